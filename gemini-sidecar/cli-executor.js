@@ -22,7 +22,7 @@ const path = require('path');
 const os = require('os');
 const { AGENT_CLI, AGENT_MODEL, AGENT_ROLE, AGENT_EFFORT_LEVEL, resolveTimeoutMs, DEFAULT_WORK_DIR, FINDINGS_FRESHNESS_MS } = require('./config');
 const state = require('./state');
-const { parseStreamLine } = require('./stream-parser');
+const { parseStreamLine, sliceWhole } = require('./stream-parser');
 const { wsSend } = require('./ws-utils');
 
 const CLAUDE_JSON_PATH = path.join(os.homedir(), '.claude.json');
@@ -132,7 +132,7 @@ function stdoutFallback(effectiveOutput) {
         console.log(`[${new Date().toISOString()}] No findings, using full stdout (${effectiveOutput.length} chars)`);
         return effectiveOutput;
     }
-    const tail = effectiveOutput.slice(-MAX_FALLBACK_CHARS);
+    const tail = sliceWhole(effectiveOutput, -MAX_FALLBACK_CHARS);
     console.log(`[${new Date().toISOString()}] No findings, using stdout tail (${MAX_FALLBACK_CHARS} of ${effectiveOutput.length} chars)`);
     return `[...truncated planning output...]\n\n${tail}`;
 }
@@ -4,6 +4,8 @@
 // 2. [Pattern]: Unified parseStreamLine handles both Gemini and Claude stream-json schemas; returns { text, sessionId, toolCalls, done } or null.
 // 3. [Pattern]: parseClaudeStreamLine is backward-compat wrapper — returns parsed.text only for legacy callers.
 // 4. [Gotcha]: Non-JSON input returns { text: line, ... } (raw line as text); JSON parse errors are caught, not thrown.
+// 5. [Constraint]: Truncate text bound for a WS frame with sliceWhole(), never a bare .slice() -- a cut through a
+//    surrogate pair leaves a lone half that the Brain's orjson decoder rejects.
 
 /**
  * Unified stream-json line parser for both Gemini and Claude CLIs.
@@ -46,7 +48,7 @@ function parseStreamLine(line) {
                     parts.push(block.text);
                 } else if (block.type === 'tool_use' && block.name) {
                     const hint = block.input?.file_path || block.input?.command || block.input?.query || '';
-                    const suffix = hint ? `: ${hint.toString().slice(0, 2000)}` : '';
+                    const suffix = hint ? `: ${sliceWhole(hint.toString(), 0, 2000)}` : '';
                     parts.push(`[tool] ${block.name}${suffix}`);
                 }
             }
@@ -57,7 +59,7 @@ function parseStreamLine(line) {
         if (obj.type === 'user' && obj.tool_use_result) {
             const file = obj.tool_use_result?.file;
             if (file?.filePath) {
-                const preview = (file.content || '').slice(0, 500).replace(/\n/g, ' ');
+                const preview = sliceWhole(file.content || '', 0, 500).replace(/\n/g, ' ');
                 return { text: `[${file.filePath}] → ${preview}${(file.content || '').length > 500 ? '...' : ''}`, sessionId: null, toolCalls: null, done: false };
             }
             return null;
@@ -66,7 +68,7 @@ function parseStreamLine(line) {
         // --- Gemini: tool_use event (top-level, not nested in assistant message) ---
         if (obj.type === 'tool_use' && obj.tool_name) {
             const hint = obj.parameters?.file_path || obj.parameters?.command || obj.parameters?.query || '';
-            const suffix = hint ? `: ${hint.toString().slice(0, 2000)}` : '';
+            const suffix = hint ? `: ${sliceWhole(hint.toString(), 0, 2000)}` : '';
             return { text: `[tool] ${obj.tool_name}${suffix}`, sessionId: null, toolCalls: null, done: false };
         }
 
@@ -80,7 +82,7 @@ function parseStreamLine(line) {
                 raw = obj.content;
             }
             const len = raw.length;
-            const preview = raw.slice(0, 500).replace(/\n/g, ' ');
+            const preview = sliceWhole(raw, 0, 500).replace(/\n/g, ' ');
             const suffix = preview ? ` → ${preview}${len > 500 ? '...' : ''}` : '';
             return { text: `[${name}]${suffix}`, sessionId: null, toolCalls: null, done: false };
         }
@@ -113,4 +115,20 @@ function parseClaudeStreamLine(line) {
     return parsed?.text || null;
 }
 
-module.exports = { parseStreamLine, parseClaudeStreamLine };
+const isHighSurrogate = (code) => code >= 0xd800 && code <= 0xdbff;
+const isLowSurrogate = (code) => code >= 0xdc00 && code <= 0xdfff;
+
+/**
+ * String.prototype.slice that never leaves half of a surrogate pair at either end.
+ * Negative indexes count from the end, as with slice().
+ */
+function sliceWhole(text, start, end = text.length) {
+    const len = text.length;
+    let s = start < 0 ? Math.max(len + start, 0) : Math.min(start, len);
+    let e = end < 0 ? Math.max(len + end, 0) : Math.min(end, len);
+    if (s > 0 && s < len && isLowSurrogate(text.charCodeAt(s)) && isHighSurrogate(text.charCodeAt(s - 1))) s++;
+    if (e > 0 && e < len && isHighSurrogate(text.charCodeAt(e - 1)) && isLowSurrogate(text.charCodeAt(e))) e--;
+    return text.slice(s, e);
+}
+
+module.exports = { parseStreamLine, parseClaudeStreamLine, sliceWhole };
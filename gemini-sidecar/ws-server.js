@@ -6,6 +6,14 @@
 // 4. [Gotcha]: On ws.close, kills orphaned child process (SIGTERM then SIGKILL after 5s) and clears currentTask.
 // 5. [Pattern]: model/effort/role read from the task msg and threaded to executeCLIStreaming. `model` is
 //    typically empty for local sidecars (they use their Deployment-configured AGENT_MODEL env).
+// 6. [Pattern]: Clients rejected with 'busy' are remembered in busyWaiters and sent { type: 'ready' }
+//    whenever the current task clears (result/error, followup, cancel, disconnect). Client resends on ready.
+// 7. [Pattern]: Task results longer than RESULT_CHUNK_CHARS go out as ordered 'result_chunk' frames
+//    ({ output, seq, final }) so the client can stream them; the final chunk carries session_id/status/source.
+//    Chunk boundaries step back off a high surrogate so no chunk ends mid-pair.
+// 8. [Pattern]: Every frame of a run carries the client's task_id (taskSocket proxy, like ws-client's wsProxy).
+//    The run owns its state.currentTask object and releases it only if it is still current (releaseTask) -- a
+//    cancelled run that exits late must not clear its successor. cancel with a task_id only stops that run.
 
 const { executeCLIStreaming } = require('./cli-executor');
 const {
@@ -27,6 +35,62 @@ const state = require('./state');
 const { DEFAULT_WORK_DIR } = require('./config');
 const { wsSend } = require('./ws-utils');
 
+// Sockets that got a 'busy' rejection and are waiting to resend their task.
+const busyWaiters = new Set();
+
+function notifyReady() {
+  for (const waiter of busyWaiters) {
+    wsSend(waiter, { type: 'ready' });
+  }
+  busyWaiters.clear();
+}
+
+const RESULT_CHUNK_CHARS = 64 * 1024;
+
+function sendResult(ws, frame) {
+  const output = frame.output || '';
+  if (output.length <= RESULT_CHUNK_CHARS) {
+    wsSend(ws, frame);
+    return;
+  }
+  let start = 0;
+  for (let seq = 0; start < output.length; seq++) {
+    let end = Math.min(start + RESULT_CHUNK_CHARS, output.length);
+    // Never split a surrogate pair -- a lone half is invalid JSON for the orjson reader.
+    if (end < output.length && isHighSurrogate(output.charCodeAt(end - 1))) end--;
+    const final = end === output.length;
+    wsSend(ws, {
+      ...(final ? frame : { event_id: frame.event_id }),
+      type: 'result_chunk',
+      output: output.slice(start, end),
+      seq,
+      final,
+    });
+    start = end;
+  }
+}
+
+function isHighSurrogate(code) {
+  return code >= 0xd800 && code <= 0xdbff;
+}
+
+// Stamp every frame of one run with the client's task_id so late output of a
+// cancelled run is never mistaken for the next run on the same event.
+function taskSocket(ws, taskId) {
+  if (!taskId) return ws;
+  return {
+    get readyState() { return ws.readyState; },
+    send(raw) { ws.send(JSON.stringify({ ...JSON.parse(raw), task_id: taskId })); },
+  };
+}
+
+// Clear the current task only while it is still this run's.
+function releaseTask(task) {
+  if (state.getCurrentTask() !== task) return;
+  state.clearCurrentTask();
+  notifyReady();
+}
+
 function setupWSServer(wss) {
   wss.on('connection', (ws) => {
     console.log(`[${new Date().toISOString()}] WebSocket client connected`);
@@ -41,13 +105,15 @@ function setupWSServer(wss) {
       }
 
       if (msg.type === 'task') {
+        const out = taskSocket(ws, msg.task_id);
         // Reject if already busy
         if (state.getCurrentTask()) {
-          ws.send(JSON.stringify({
+          busyWaiters.add(ws);
+          wsSend(out, {
             type: 'busy',
             event_id: msg.event_id || '',
             message: 'Agent busy, task rejected. One task at a time.',
-          }));
+          });
           return;
         }
 
@@ -61,70 +127,79 @@ function setupWSServer(wss) {
         const role = msg.role || '';
 
         if (!prompt) {
-          ws.send(JSON.stringify({ type: 'error', event_id: eventId, message: 'Missing prompt' }));
+          wsSend(out, { type: 'error', event_id: eventId, message: 'Missing prompt' });
           return;
         }
 
-        // Reset callback result for new task
-        state.resetCallbackResult();
-        console.log(`[${new Date().toISOString()}] WS task received: ${eventId} (prompt: ${prompt.length} chars, session: ${sessionId})`);
+        // Claim the sidecar before the awaited credential setup; executeCLIStreaming fills in child
+        const task = { eventId, taskId: msg.task_id || null, cwd: workDir, child: null };
+        state.setCurrentTask(task);
 
-        // Setup git credentials + GitHub tooling
-        if (hasGitHubCredentials()) {
-          try {
-            const token = await generateInstallationToken();
-            setupGitCredentials(token, workDir);
-            setupGitHubTooling(token);
-            wsSend(ws, { type: 'progress', event_id: eventId, message: 'GitHub credentials configured' });
-          } catch (err) {
-            wsSend(ws, { type: 'progress', event_id: eventId, message: `GitHub credentials failed: ${err.message}, continuing...` });
+        try {
+          // Reset callback result for new task
+          state.resetCallbackResult();
+          console.log(`[${new Date().toISOString()}] WS task received: ${eventId} (prompt: ${prompt.length} chars, session: ${sessionId})`);
+
+          // Setup git credentials + GitHub tooling
+          if (hasGitHubCredentials()) {
+            try {
+              const token = await generateInstallationToken();
+              setupGitCredentials(token, workDir);
+              setupGitHubTooling(token);
+              wsSend(out, { type: 'progress', event_id: eventId, message: 'GitHub credentials configured' });
+            } catch (err) {
+              wsSend(out, { type: 'progress', event_id: eventId, message: `GitHub credentials failed: ${err.message}, continuing...` });
+            }
           }
-        }
 
-        // Setup GitLab credentials + MCP tooling
-        if (hasGitLabCredentials()) {
-          try {
-            const glToken = readGitLabToken();
-            setupGitLabCredentials(glToken, workDir);
-            setupGitLabTooling(glToken);
-            wsSend(ws, { type: 'progress', event_id: eventId, message: `GitLab credentials configured (${GITLAB_HOST})` });
-          } catch (err) {
-            wsSend(ws, { type: 'progress', event_id: eventId, message: `GitLab credentials failed: ${err.message}, continuing...` });
+          // Setup GitLab credentials + MCP tooling
+          if (hasGitLabCredentials()) {
+            try {
+              const glToken = readGitLabToken();
+              setupGitLabCredentials(glToken, workDir);
+              setupGitLabTooling(glToken);
+              wsSend(out, { type: 'progress', event_id: eventId, message: `GitLab credentials configured (${GITLAB_HOST})` });
+            } catch (err) {
+              wsSend(out, { type: 'progress', event_id: eventId, message: `GitLab credentials failed: ${err.message}, continuing...` });
+            }
           }
-        }
 
-        // Configure ArgoCD MCP server (session API -> JWT per-task)
-        await setupArgoCDMCP();
+          // Configure ArgoCD MCP server (session API -> JWT per-task)
+          await setupArgoCDMCP();
 
-        // Login to ArgoCD/Kargo CLIs (awaited, with deduplication)
-        await setupCLILogins();
+          // Login to ArgoCD/Kargo CLIs (awaited, with deduplication)
+          await setupCLILogins();
 
-        setupRegistryCredentials();
-        setupRemoteK8sMCPs();
+          setupRegistryCredentials();
+          setupRemoteK8sMCPs();
 
-        // Execute agent CLI with streaming progress (headless mode for both Gemini + Claude).
-        // Both CLIs use -p (headless) + -o stream-json. Session IDs from the init event
-        // enable --resume for follow-ups. No PTY needed -- env vars handle auth in headless.
-        try {
-          const result = await executeCLIStreaming(ws, eventId, prompt, {
-            autoApprove, cwd: workDir, sessionId, model, effort, role,
-          });
-          wsSend(ws, {
-            type: 'result',
-            event_id: eventId,
-            session_id: result.sessionId || null,
-            status: result.status,
-            output: result.output || result.stdout || '',
-            source: result.source || 'stdout',
-          });
-        } catch (err) {
-          wsSend(ws, {
-            type: 'error',
-            event_id: eventId,
-            message: err.message,
-          });
+          if (state.getCurrentTask() !== task) return; // cancelled during setup
+
+          // Execute agent CLI with streaming progress (headless mode for both Gemini + Claude).
+          // Both CLIs use -p (headless) + -o stream-json. Session IDs from the init event
+          // enable --resume for follow-ups. No PTY needed -- env vars handle auth in headless.
+          try {
+            const result = await executeCLIStreaming(out, eventId, prompt, {
+              autoApprove, cwd: workDir, sessionId, model, effort, role,
+            });
+            sendResult(out, {
+              type: 'result',
+              event_id: eventId,
+              session_id: result.sessionId || null,
+              status: result.status,
+              output: result.output || result.stdout || '',
+              source: result.source || 'stdout',
+            });
+          } catch (err) {
+            wsSend(out, {
+              type: 'error',
+              event_id: eventId,
+              message: err.message,
+            });
+          }
+        } finally {
+          releaseTask(task);
         }
-        state.clearCurrentTask();
 
       } else if (msg.type === 'followup') {
         // Forward follow-up message to an existing session via --resume.
@@ -132,17 +207,20 @@ function setupWSServer(wss) {
         const sessionId = msg.session_id || '';
         const followupMsg = msg.message || '';
         const eventId = msg.event_id || 'unknown';
+        const out = taskSocket(ws, msg.task_id);
         console.log(`[${new Date().toISOString()}] Followup for session ${sessionId} (event: ${eventId})`);
 
         if (sessionId) {
+          const task = state.getCurrentTask()
+            || { eventId, taskId: msg.task_id || null, cwd: DEFAULT_WORK_DIR, child: null };
+          state.setCurrentTask(task);
           try {
-            const task = state.getCurrentTask();
-            const result = await executeCLIStreaming(ws, eventId, followupMsg, {
+            const result = await executeCLIStreaming(out, eventId, followupMsg, {
               autoApprove: true,
-              cwd: task?.cwd || DEFAULT_WORK_DIR,
+              cwd: task.cwd || DEFAULT_WORK_DIR,
               sessionId: sessionId,
             });
-            wsSend(ws, {
+            wsSend(out, {
               type: 'result',
               event_id: eventId,
               session_id: result.sessionId || sessionId,
@@ -150,18 +228,21 @@ function setupWSServer(wss) {
               source: result.source || 'stdout',
             });
           } catch (err) {
-            wsSend(ws, { type: 'error', event_id: eventId, message: err.message });
+            wsSend(out, { type: 'error', event_id: eventId, message: err.message });
           }
-          state.clearCurrentTask();
+          releaseTask(task);
         } else {
-          wsSend(ws, { type: 'error', event_id: eventId, message: 'No session_id for followup' });
+          wsSend(out, { type: 'error', event_id: eventId, message: 'No session_id for followup' });
         }
 
       } else if (msg.type === 'cancel') {
         const task = state.getCurrentTask();
-        if (task && task.child) {
-          console.log(`[${new Date().toISOString()}] Cancelling task: ${task.eventId}`);
-          const child = task.child;
+        if (!task || (msg.task_id && task.taskId && task.taskId !== msg.task_id)) {
+          return; // nothing running, or a stale cancel for a run that already ended
+        }
+        console.log(`[${new Date().toISOString()}] Cancelling task: ${task.eventId}`);
+        const child = task.child;
+        if (child) {
           child.kill('SIGTERM');
           const killTimer = setTimeout(() => {
             if (!child.killed) {
@@ -170,13 +251,15 @@ function setupWSServer(wss) {
             }
           }, 5000);
           child.on('exit', () => clearTimeout(killTimer));
-          state.clearCurrentTask();
         }
+        state.clearCurrentTask();
+        notifyReady();
       }
     });
 
     ws.on('close', () => {
       console.log(`[${new Date().toISOString()}] WebSocket client disconnected`);
+      busyWaiters.delete(ws);
       const task = state.getCurrentTask();
       if (task && task.child) {
         // S5 probe: log whether the disconnecting client is the task owner
@@ -191,6 +274,7 @@ function setupWSServer(wss) {
         }, 5000);
         child.on('exit', () => clearTimeout(killTimer));
         state.clearCurrentTask();
+        notifyReady();
       }
     });
 
@@ -9,13 +9,22 @@
 # 7. [Pattern]: _handle_chat passes user.email as created_by_email for multi-tenant event ownership.
 # 8. [Pattern]: ArgoCDObserver injected post-init via set_argocd_observer(), same shape as Kargo. No UI
 #    consumer sends argocd_health_update yet (v1 dead wire) -- no _send_initial_argocd_state needed.
+# 9. [Pattern]: Broadcast frames are encoded once with orjson (every progress line fans out through here);
+#    stdlib json is only the fallback for values orjson rejects.
+# 10. [Pattern]: Broadcast sends to all clients concurrently, each bounded by _SEND_TIMEOUT. A client whose
+#     socket stops draining is dropped like a disconnected one instead of stalling Brain's fan-out, and its
+#     socket is closed (1011) -- wait_for may have cut a frame, and an open socket would keep the browser
+#     connected but deaf. The close makes the UI reconnect and resync.
+#     Frames stay one-message-per-send ("turn", "progress", ...) -- the UI has no batched frame type.
 """Dashboard WebSocket adapter -- manages UI client connections and broadcast."""
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from typing import TYPE_CHECKING
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from ..auth import get_user_from_websocket
@@ -27,6 +36,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SEND_TIMEOUT = 5.0
+
 
 class DashboardWSAdapter:
     """Dashboard WebSocket adapter.
@@ -59,14 +70,29 @@ class DashboardWSAdapter:
         """BroadcastPort implementation -- fan out to all connected UI clients."""
         if not self._clients:
             return
-        data = json.dumps(message)
-        disconnected: set[WebSocket] = set()
-        for client in self._clients:
+        try:
+            data = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:  # int > 64-bit etc. -- keep the stdlib encoder's behaviour
+            data = json.dumps(message)
+        clients = list(self._clients)
+        results = await asyncio.gather(*(self._send(client, data) for client in clients))
+        self._clients.difference_update(c for c, ok in zip(clients, results) if not ok)
+
+    @staticmethod
+    async def _send(client: WebSocket, data: str) -> bool:
+        """Send one frame; False if the client is gone or not draining."""
+        try:
+            await asyncio.wait_for(client.send_text(data), _SEND_TIMEOUT)
+            return True
+        except TimeoutError:
+            logger.warning("Closing UI WebSocket that stopped draining")
             try:
-                await client.send_text(data)
+                await asyncio.wait_for(client.close(code=1011), _SEND_TIMEOUT)
             except Exception:
-                disconnected.add(client)
-        self._clients.difference_update(disconnected)
+                pass
+            return False
+        except Exception:
+            return False
 
     async def websocket_handler(self, websocket: WebSocket) -> None:
         """Handle a single Dashboard WebSocket lifecycle."""
@@ -108,6 +134,18 @@ class DashboardWSAdapter:
     async def _handle_chat(self, ws: WebSocket, data: dict, user) -> None:
         message = data.get("message", "")
         service = data.get("service", "general")
+        image = data.get("image")
+        if image and len(image) > 1_400_000:
+            await ws.send_json({"type": "error", "message": "Image too large (max 1MB). Image was not attached."})
+            image = None
+        user_turn = ConversationTurn(
+            turn=1,
+            actor="user",
+            action="message",
+            thoughts=message,
+            image=image,
+            user_name=user.label if user.label != "anonymous" else None,
+        )
         event_id = await self._blackboard.create_event(
             source="chat",
             service=service,
@@ -120,20 +158,8 @@ class DashboardWSAdapter:
                 severity="info",
             ),
             created_by_email=user.email,
+            initial_turns=[user_turn],
         )
-        image = data.get("image")
-        if image and len(image) > 1_400_000:
-            await ws.send_json({"type": "error", "message": "Image too large (max 1MB). Image was not attached."})
-            image = None
-        user_turn = ConversationTurn(
-            turn=1,
-            actor="user",
-            action="message",
-            thoughts=message,
-            image=image,
-            user_name=user.label if user.label != "anonymous" else None,
-        )
-        await self._blackboard.append_turn(event_id, user_turn)
         await ws.send_json({
             "type": "event_created",
             "event_id": event_id,
@@ -81,7 +81,7 @@ from ..agents.jarvis_instructions import (
     TOOL_DECLARATIONS,
 )
 from ..memory.pulse import PulseBatch
-from ..models import _resolve_phase
+from ..models import EventStatus, _resolve_phase
 from ..utils import redact_pii as _redact_pii
 
 if TYPE_CHECKING:
@@ -161,6 +161,7 @@ class LiveAPIAdapter:
         self._idle_watchdog_task: asyncio.Task | None = None
         self._running = False
         self._client = None
+        self._search_client = None  # genai.Client for google_web_search -- reused across calls
         self._last_status_broadcast: float = 0
         self._last_was_watching: bool = False
         self._session_report_enabled = os.getenv("SYSTEM2_SESSION_REPORT", "true").lower() == "true"
@@ -635,7 +636,7 @@ class LiveAPIAdapter:
             self._awaiting_jarvis_reply = False
             self._awaiting_jarvis_event_id = None
             for fc in msg.tool_call.function_calls:
-                args = dict(fc.args) if fc.args else {}
+                args = fc.args or {}
                 tool_eid = args.get("event_id", eid)
                 try:
                     await self._broadcast({
@@ -1241,13 +1242,17 @@ class LiveAPIAdapter:
             return "Error: query required"
         query = query.strip()[:500]
         model = os.getenv("GOOGLE_SEARCH_GROUNDING_MODEL", "gemini-3.5-flash-lite")
-        project = os.getenv("GCP_PROJECT", "")
-        location = os.getenv("GCP_LOCATION", "global")
         try:
             from google import genai
             from google.genai import types
 
-            client = genai.Client(vertexai=True, project=project, location=location)
+            if self._search_client is None:
+                self._search_client = genai.Client(
+                    vertexai=True,
+                    project=os.getenv("GCP_PROJECT", ""),
+                    location=os.getenv("GCP_LOCATION", "global"),
+                )
+            client = self._search_client
             async with asyncio.timeout(60):
                 response = await client.aio.models.generate_content(
                     model=model,
@@ -1457,7 +1462,7 @@ class LiveAPIAdapter:
                 continue
             if not event:
                 continue
-            if event.status.value == "deferred":
+            if event.status is EventStatus.DEFERRED:
                 continue
             domain = (
                 event.event.evidence.brain_domain
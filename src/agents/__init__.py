@@ -1,15 +1,51 @@
 # BlackBoard/src/agents/__init__.py
-"""Trinity Agents + Registry infrastructure for Darwin Blackboard."""
-from .aligner import Aligner
-from .agent_registry import AgentRegistry
-from .architect import Architect
-from .archivist import Archivist
-from .brain import Brain
-from .developer import Developer
-from .dispatch import dispatch_to_agent, send_cancel, RETRYABLE_SENTINEL
-from .security import SecurityError
-from .sysadmin import SysAdmin
-from .task_bridge import TaskBridge
+"""Trinity Agents + Registry infrastructure for Darwin Blackboard.
+
+Exports resolve lazily (PEP 562) so importing one submodule -- e.g.
+``src.agents.architect`` -- does not execute Brain, Archivist and every
+handler module just to initialise the package.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_EXPORTS: dict[str, str] = {
+    "Aligner": ".aligner",
+    "AgentRegistry": ".agent_registry",
+    "Architect": ".architect",
+    "Archivist": ".archivist",
+    "Brain": ".brain",
+    "Developer": ".developer",
+    "dispatch_to_agent": ".dispatch",
+    "send_cancel": ".dispatch",
+    "RETRYABLE_SENTINEL": ".dispatch",
+    "SecurityError": ".security",
+    "SysAdmin": ".sysadmin",
+    "TaskBridge": ".task_bridge",
+}
+
+if TYPE_CHECKING:
+    from .aligner import Aligner
+    from .agent_registry import AgentRegistry
+    from .architect import Architect
+    from .archivist import Archivist
+    from .brain import Brain
+    from .developer import Developer
+    from .dispatch import dispatch_to_agent, send_cancel, RETRYABLE_SENTINEL
+    from .security import SecurityError
+    from .sysadmin import SysAdmin
+    from .task_bridge import TaskBridge
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "AgentRegistry", "Aligner", "Archivist", "Architect", "Brain",
@@ -4,6 +4,8 @@
 # 2. [Pattern]: Evict-on-reconnect by role + agent_id prefix match.
 # 3. [Pattern]: _on_task_orphaned callback wired by TaskBridge for error sentinel injection on disconnect.
 # 4. [Constraint]: Pure infrastructure. No LLM logic, no routing decisions.
+# 5. [Pattern]: get_available() balances across a role's replicas: the idle agent idle longest (idle_since,
+#    monotonic, set on register/mark_idle) wins -- not dict order, which pinned work to the first pod.
 """Agent Registry -- manages a dynamic pool of connected agent sidecars."""
 from __future__ import annotations
 
@@ -35,6 +37,7 @@ class AgentConnection:
     ephemeral: bool = False
     bound_event_id: str | None = None
     current_role: str | None = None
+    idle_since: float = 0.0  # time.monotonic() of the last register/mark_idle
 
 
 class AgentRegistry:
@@ -91,6 +94,7 @@ class AgentRegistry:
                 connected_at=time.time(),
                 ephemeral=ephemeral,
                 bound_event_id=event_id,
+                idle_since=time.monotonic(),
             )
             logger.info(
                 "Registered agent %s (role=%s, cli=%s, model=%s, ephemeral=%s, event=%s)",
@@ -113,13 +117,17 @@ class AgentRegistry:
                 logger.info("Unregistered agent %s (role=%s)", agent_id, conn.role)
 
     async def get_available(self, role: str) -> AgentConnection | None:
+        """Least-recently-used idle agent for *role* -- spreads tasks across replicas."""
         async with self._lock:
+            best: AgentConnection | None = None
             for conn in self._agents.values():
-                if conn.role == role and not conn.busy:
-                    logger.debug("Found idle agent %s for role=%s", conn.agent_id, role)
-                    return conn
-            logger.debug("No idle agent for role=%s", role)
-            return None
+                if conn.role == role and not conn.busy and (best is None or conn.idle_since < best.idle_since):
+                    best = conn
+            if best is None:
+                logger.debug("No idle agent for role=%s", role)
+            else:
+                logger.debug("Found idle agent %s for role=%s", best.agent_id, role)
+            return best
 
     async def get_by_role(self, role: str) -> AgentConnection | None:
         """Find any agent matching a role, regardless of busy state."""
@@ -170,6 +178,7 @@ class AgentRegistry:
             conn.current_event_id = None
             conn.current_task_id = None
             conn.current_role = None
+            conn.idle_since = time.monotonic()
             logger.debug("Marked agent %s idle", agent_id)
 
     async def list_agents(self) -> list[dict]:
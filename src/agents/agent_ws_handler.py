@@ -7,15 +7,21 @@
 # 5. [Pattern]: Ephemeral agents registering for a closed/missing event are terminated immediately (orphan cleanup).
 # 6. [Pattern]: wake_register creates queue SYNC (before next receive), then spawns Brain handler via on_wake callback.
 #    Payload may include optional `mode` (default implement in Brain) — single source with sidecar synthetic task.
+# 7. [Pattern]: Inbound frames are parsed with orjson via _receive_frame() (text or binary), not receive_json().
+#    orjson rejects lone surrogates, so a rejected frame is retried with stdlib json. A frame neither can decode
+#    is logged and skipped in the message loop -- it must not reach the outer except and unregister the agent.
 """WebSocket handler for agent sidecar connections (reversed WS direction)."""
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 from typing import Callable, TYPE_CHECKING
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
+from ..models import EventStatus
 from .agent_registry import AgentRegistry
 from .task_bridge import TaskBridge
 
@@ -40,6 +46,23 @@ async def _heartbeat(ws: WebSocket, interval: int = 30) -> None:
             break
 
 
+async def _receive_frame(ws: WebSocket) -> dict:
+    """receive_json() equivalent parsed with orjson; accepts text or binary frames.
+
+    Raises ValueError for a frame neither orjson nor stdlib json can decode.
+    """
+    message = await ws.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    raw = message.get("text")
+    if raw is None:
+        raw = message.get("bytes") or b""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)  # lone surrogates: orjson rejects them, stdlib json keeps them
+
+
 async def agent_websocket_handler(
     websocket: WebSocket,
     registry: AgentRegistry,
@@ -53,7 +76,7 @@ async def agent_websocket_handler(
     heartbeat_task: asyncio.Task | None = None
 
     try:
-        raw = await asyncio.wait_for(websocket.receive_json(), timeout=10.0)
+        raw = await asyncio.wait_for(_receive_frame(websocket), timeout=10.0)
         if raw.get("type") != "register" or not raw.get("agent_id"):
             await websocket.close(code=1008, reason="Expected register message")
             return
@@ -71,7 +94,7 @@ async def agent_websocket_handler(
 
         if is_ephemeral and event_id and blackboard and not event_id.startswith("nw-sweep-"):
             event = await blackboard.get_event(event_id)
-            if not event or event.status.value == "closed":
+            if not event or event.status is EventStatus.CLOSED:
                 logger.info("Terminating orphan ephemeral agent %s: event %s is %s",
                             agent_id, event_id, event.status.value if event else "missing")
                 await websocket.send_json({"type": "terminate", "event_id": event_id, "reason": "Event closed"})
@@ -81,7 +104,11 @@ async def agent_websocket_handler(
         heartbeat_task = asyncio.create_task(_heartbeat(websocket))
 
         while True:
-            data = await websocket.receive_json()
+            try:
+                data = await _receive_frame(websocket)
+            except ValueError as e:
+                logger.warning("Dropping undecodable frame from %s: %s", agent_id, e)
+                continue
             msg_type = data.get("type", "")
             if msg_type in _ROUTED_TYPES:
                 bridge.put(data.get("task_id", ""), data)
@@ -36,7 +36,7 @@ import os
 import time
 from typing import TYPE_CHECKING, Optional
 
-from ..models import ESCALATION_SCOPE_MAP
+from ..models import ESCALATION_SCOPE_MAP, OPEN_EVENT_STATUSES, UNEVALUATED_MESSAGE_STATUSES, EventStatus
 
 # AIR GAP ENFORCEMENT: Only these imports allowed
 # import kubernetes  # FORBIDDEN
@@ -94,6 +94,7 @@ class Aligner:
         self.blackboard = blackboard
         self.filter_rules: list[FilterRule] = []
         self._adapter = None
+        self._adapter_lock = asyncio.Lock()
         
         # LLM config -- Aligner uses Gemini (model from LLM_MODEL_ALIGNER) for configure_filter() only
         self._llm_enabled = bool(os.getenv("GCP_PROJECT"))
@@ -111,21 +112,17 @@ class Aligner:
     
     async def _get_adapter(self):
         """Lazy-load LLM adapter (always Gemini for Aligner, model from LLM_MODEL_ALIGNER)."""
-        if self._adapter is None and self._llm_enabled:
-            try:
-                from .llm import create_adapter
-                
-                project = os.getenv("GCP_PROJECT")
-                location = os.getenv("GCP_LOCATION", "us-central1")
-                model_name = os.getenv("LLM_MODEL_ALIGNER", "gemini-3.6-flash")
-                
-                self._adapter = create_adapter("gemini", project, location, model_name)
-                logger.info(f"Aligner LLM adapter initialized: gemini/{model_name}")
-            except Exception as e:
-                logger.warning(f"LLM adapter not available for Aligner: {e}")
-                self._adapter = None
-        
-        return self._adapter
+        if self._adapter is not None or not self._llm_enabled:
+            return self._adapter
+        from .llm import get_or_create_adapter
+
+        return await get_or_create_adapter(
+            self, self._adapter_lock, "gemini",
+            os.getenv("GCP_PROJECT"),
+            os.getenv("GCP_LOCATION", "us-central1"),
+            os.getenv("LLM_MODEL_ALIGNER", "gemini-3.6-flash"),
+            label="Aligner",
+        )
 
     # =========================================================================
     # Poll Loop Lifecycle (TimeKeeper pattern)
@@ -423,7 +420,7 @@ class Aligner:
         active_ids = await self.blackboard.get_active_events()
         for eid in active_ids:
             existing = await self.blackboard.get_event(eid)
-            if existing and existing.service == service and existing.status.value in ("new", "active", "deferred"):
+            if existing and existing.service == service and existing.status in OPEN_EVENT_STATUSES:
                 logger.info(
                     f"Skipping event creation for {service} ({anomaly_type}) "
                     f"-- active event {eid} already exists (status: {existing.status.value})"
@@ -495,14 +492,14 @@ class Aligner:
             event = await self.blackboard.get_event(eid)
             if event and event.service == service:
                 # Skip DEFERRED events -- Brain explicitly chose to wait
-                if event.status.value == "deferred":
+                if event.status is EventStatus.DEFERRED:
                     logger.debug(f"Skipping notify for deferred event {eid}")
                     continue
                 # Dedup: skip if a previous confirm is still unprocessed
                 pending = [
                     t for t in event.conversation
                     if t.actor == "aligner" and t.action == "confirm"
-                    and t.status.value in ("sent", "delivered")
+                    and t.status in UNEVALUATED_MESSAGE_STATUSES
                 ]
                 if pending:
                     pending[0].evidence = message
@@ -545,7 +542,7 @@ class Aligner:
         active_ids = await self.blackboard.get_active_events()
         for eid in active_ids:
             existing = await self.blackboard.get_event(eid)
-            if existing and existing.service == service and existing.status.value in ("new", "active", "deferred"):
+            if existing and existing.service == service and existing.status in OPEN_EVENT_STATUSES:
                 logger.info(f"Skipping Kargo event for {service}: active event {eid} exists")
                 return None
 
@@ -5,7 +5,7 @@
 # 3. [Gotcha]: embed_content with output_dimensionality=768 (gemini-embedding-2 native is 3072). Qdrant collections must match 768.
 # 4. [Pattern]: All errors caught and logged. Failure falls back to existing append_journal().
 # 5. [Pattern]: store_feedback() reuses the same embedding pipeline for user feedback on AI responses.
-# 6. [Pattern]: _get_adapter() (Gemini fallback) and _get_claude_adapter() (primary) follow lazy-load pattern. _claude_adapter initialized in __init__. _ensure_initialized() is for embeddings + Qdrant only.
+# 6. [Pattern]: _get_adapter() (Gemini fallback) and _get_claude_adapter() (primary) follow lazy-load pattern. _claude_adapter initialized in __init__. Both build via llm.get_or_create_adapter under _adapter_lock. _ensure_initialized() is for embeddings + Qdrant only.
 # 7. [Pattern]: correct_memory() overwrites a contaminated event memory with corrected root_cause/fix_action. Uses same deterministic uuid5 point ID.
 # 8. [Pattern]: store_lesson() dedup search is isolated in its own try/except (fail-open to insert). Merge path includes updated_at timestamp.
 # 9. [Pattern]: Four Qdrant collections: darwin_events (archived summaries), darwin_feedback (quality tracking), darwin_lessons (human-authored patterns), darwin_knowledge (static infrastructure facts).
@@ -17,6 +17,9 @@
 #     shared by store_knowledge() and digest_field_notes(). service=None hashes to 'global'. VALID_SCOPES:
 #     convention, ownership, historical, relationship.
 # 15. [Pattern]: embed_query() is the public embedding interface. Brain embeds once, passes vector to search_knowledge/search_lessons/search to avoid triple embedding.
+#     Query-path embeds (embed_query and the search* fallbacks) go through _embed_query(): bounded LRU
+#     (QUERY_EMBED_CACHE_MAX) keyed by blake2b(query), with single-flight for concurrent identical misses.
+#     A cancelled leader resolves the shared future with None; followers then embed on their own.
 # 16. [Pattern]: update_knowledge(knowledge_id, **updates) encapsulates read-modify-reembed-upsert. Routes MUST use this, not _embed/_vector_store directly.
 # 17. [Pattern]: digest_field_notes(blackboard) drains notebook HASH, LLM-extracts Reference Facts (topic/fact/scope/service/event_id),
 #     batch-resolves service via asyncio.gather over unique event_ids (DB-first precedence over LLM output),
@@ -34,6 +37,33 @@
 #     (must stay in sync with BRAIN_TOOL_SCHEMAS — Test T-10 enforces). Applied in store_lesson()
 #     before embed AND in the dedup-merge path. Does NOT import from src/agents/llm/ (hexagonal
 #     boundary); mapping maintained manually.
+# 22. [Pattern]: Archive-path embeddings (_embed_archive) and Qdrant writes (_upsert_archive) go through
+#     _BatchCoalescer: concurrent archive tasks coalesce for ARCHIVE_EMBED_WINDOW_SEC into one list-valued
+#     embed_content / one upsert_many per collection (<= ARCHIVIST_BATCH_SIZE items), sharing
+#     ARCHIVIST_MAX_CONCURRENT_BATCHES in flight. Query-path _embed()/embed_query() and lesson/knowledge/feedback
+#     writes stay unbatched (latency, read-after-write).
+#     backfill_archives() archives with bounded concurrency so its embeddings batch too.
+#     search_many() is the multi-query read path: list-valued embeds, then SEARCH_MANY_CONCURRENCY parallel searches.
+#     In-flight batch tasks are held in _BatchCoalescer._batches (discarded by done-callback) so GC cannot drop them.
+# 23. [Pattern]: Semantic summary cache (darwin_archive_cache, _archive_cache_ready like _knowledge_ready). archive_event
+#     embeds the timestamp-stripped conversation; a same-service hit >= ARCHIVE_CACHE_THRESHOLD within
+#     ARCHIVE_CACHE_TTL_SEC reuses only its pattern fields (_CACHE_PATTERN_FIELDS); instance fields (timings,
+#     outcome, procedures, instance_keywords) are rebuilt from the current event, reference_facts are dropped.
+#     Cache vectors are conversation embeddings -- never compared against darwin_events summary vectors.
+#     The conversation embed only runs for a service already archived within the TTL (_archive_cache_services),
+#     so isolated events pay no extra embed; an alert storm hits from its third event on.
+# 24. [Pattern]: Fast path: conversations of <= ARCHIVIST_FAST_PATH_MAX_TURNS skip the cache embed and the LLM;
+#     _heuristic_summary() (reason + last result, summary_source="heuristic") is embedded and upserted directly.
+# 25. [Pattern]: Archive checkpoint: when main.py sets self.checkpoint (BlackboardState), _upsert_archive stages each
+#     point in Redis (darwin:archivist:pending) before coalescing; _upsert_grouped commits after upsert_many succeeds.
+#     backfill_archives() replays leftovers first, so a crash after the summary LLM call never re-summarizes.
+#     Checkpoint failures are logged at debug and never block the write. A full checkpoint (ARCHIVE_PENDING_MAX)
+#     skips staging with one warning per episode; the pending count is the archivist_pending flow gauge.
+# 26. [Gotcha]: genai async calls ride aiohttp (in requirements) with an unbounded TCPConnector, so concurrent
+#     embed batches / search_many are not capped by a connection pool. HttpOptions(async_client_args={"http2": True})
+#     only affects the httpx path (needs a custom transport + h2) -- don't add it expecting multiplexing.
+# 27. [Pattern]: Gemini JSON calls (_archive_event_fallback, digest_field_notes) pass response_mime_type="application/json"
+#     and parse response.text directly -- no ``` fence stripping. Claude text paths keep their fence strip.
 """
 Archivist: Summarizes closed events into vectorized deep memory.
 
@@ -44,15 +74,18 @@ as fallback for event summary, and gemini-embedding-2 for vectors (truncated to
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
 import re
 import time
 import uuid
-from datetime import datetime
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
+import orjson
+
 if TYPE_CHECKING:
     from ..models import EventDocument
 
@@ -62,6 +95,7 @@ COLLECTION_NAME = "darwin_events"
 FEEDBACK_COLLECTION = "darwin_feedback"
 LESSONS_COLLECTION = "darwin_lessons"
 KNOWLEDGE_COLLECTION = "darwin_knowledge"
+ARCHIVE_CACHE_COLLECTION = "darwin_archive_cache"
 VALID_SCOPES = {"convention", "ownership", "historical", "relationship"}
 EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "gemini-embedding-2")
 EMBEDDING_DIMS = int(os.getenv("EMBEDDING_DIMS", "768"))
@@ -73,6 +107,24 @@ EXTRACTOR_MODEL = os.getenv("LLM_MODEL_LESSON_EXTRACTOR", "claude-sonnet-5")
 # knob was the defect -- each provider call now has its own env var.
 _ARCHIVIST_CLAUDE_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS_ARCHIVIST_CLAUDE", "16384"))
 _ARCHIVIST_DIGEST_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS_ARCHIVIST_DIGEST", "4096"))
+# Archive-path embedding coalescing (bursty event closures / backfill)
+ARCHIVIST_BATCH_SIZE = int(os.getenv("ARCHIVIST_BATCH_SIZE", "32"))
+ARCHIVIST_MAX_CONCURRENT_BATCHES = int(os.getenv("ARCHIVIST_MAX_CONCURRENT_BATCHES", "2"))
+ARCHIVE_EMBED_WINDOW_SEC = 0.1
+QUERY_EMBED_CACHE_MAX = 1024
+# Conversations this short carry little beyond the alert and the closing result -- archive them from a
+# heuristic summary (no LLM, one embed). 0 disables the fast path.
+ARCHIVIST_FAST_PATH_MAX_TURNS = int(os.getenv("ARCHIVIST_FAST_PATH_MAX_TURNS", "3"))
+_FAST_PATH_RESULT_CHARS = 1000
+SEARCH_MANY_CONCURRENCY = 8  # in-flight Qdrant searches per search_many() call
+# Semantic summary cache: near-duplicate conversations (alert storms) reuse a recent summary
+ARCHIVE_CACHE_THRESHOLD = float(os.getenv("ARCHIVIST_CACHE_THRESHOLD", "0.95"))
+ARCHIVE_CACHE_TTL_SEC = int(os.getenv("ARCHIVIST_CACHE_TTL_SEC", "3600"))
+_ARCHIVE_CACHE_EDGE_CHARS = 4000  # head + tail of the conversation (embedding input is truncated)
+# Component-neutral summary fields a cache hit may reuse; everything else describes the source event
+_CACHE_PATTERN_FIELDS = ("symptom", "root_cause", "fix_action", "pattern_keywords", "domain")
+_TURN_TS_RE = re.compile(r"^\[\d\d:\d\d:\d\d ", re.MULTILINE)
+_EVENT_POINT_PREFIX = uuid.NAMESPACE_URL.bytes + b"darwin:"
 
 # ---------------------------------------------------------------------------
 # Lesson tool-name sanitization (Layer 3 defense-in-depth)
@@ -124,6 +176,12 @@ _TOOL_TO_BEHAVIOR: dict[str, str] = {
 
 _ALL_TOOL_NAMES: frozenset[str] = frozenset(_TOOL_TO_BEHAVIOR.keys())
 
+# One word-bounded alternation compiled at import -- a single scan per field
+# instead of a re.sub() per tool name. Longest-first so no name shadows another.
+_TOOL_NAME_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(n) for n in sorted(_TOOL_TO_BEHAVIOR, key=len, reverse=True)) + r")\b"
+)
+
 
 def _sanitize_lesson_text(text: str) -> str:
     """Strip Brain tool/function names from lesson text fields.
@@ -134,9 +192,64 @@ def _sanitize_lesson_text(text: str) -> str:
     """
     if not text:
         return text
-    for name, behavior in _TOOL_TO_BEHAVIOR.items():
-        text = re.sub(rf"\b{re.escape(name)}\b", behavior, text)
-    return text
+    return _TOOL_NAME_RE.sub(lambda m: _TOOL_TO_BEHAVIOR[m.group(0)], text)
+
+
+def _event_point_id(event_id: str) -> str:
+    """Qdrant point ID for an event memory.
+
+    Bit-identical to uuid5(NAMESPACE_URL, f"darwin:{event_id}") -- existing points
+    must keep resolving -- but hashes a precomputed namespace+prefix directly.
+    """
+    digest = hashlib.sha1(_EVENT_POINT_PREFIX + event_id.encode()).digest()
+    return str(uuid.UUID(bytes=digest[:16], version=5))
+
+
+def _heuristic_summary(event: EventDocument) -> dict:
+    """Summary for a short conversation, built from the alert reason and the last turn's result.
+
+    root_cause stays "unknown", so _remember_archive never serves it from the summary cache.
+    """
+    last = next(
+        (t.result or t.thoughts for t in reversed(event.conversation) if t.result or t.thoughts), "",
+    )
+    return {
+        "symptom": event.event.reason,
+        "root_cause": "unknown",
+        "fix_action": last[:_FAST_PATH_RESULT_CHARS] or "unknown",
+        "keywords": [event.service],
+        "operational_timings": [],
+        "defer_patterns": [],
+        "agent_execution_times": [],
+        "procedures": "unknown",
+        "outcome": "unknown",
+        "summary_source": "heuristic",
+    }
+
+
+def _format_conversation(conversation) -> str:
+    """Render turns as the timestamped transcript the archive prompts expect.
+
+    Pieces go into one list and are joined once -- no per-line string
+    concatenation, so multi-100K agent results are copied a single time.
+    """
+    parts: list[str] = []
+    for turn in conversation:
+        if turn.action == "think":
+            continue
+        if parts:
+            parts.append("\n")
+        parts += ("[", time.strftime("%H:%M:%S", time.localtime(turn.timestamp)),
+                  " ", turn.actor, ".", turn.action, "]")
+        if turn.thoughts:
+            parts += (" ", turn.thoughts)
+        if turn.evidence:
+            parts += ("\n  Evidence: ", turn.evidence)
+        if turn.result:
+            parts += ("\n  Result: ", turn.result)
+        if turn.plan:
+            parts += ("\n  Plan: ", turn.plan)
+    return "".join(parts)
 
 
 SUMMARIZE_PROMPT = """Summarize this operational event conversation into a structured JSON object for similarity search.
@@ -271,6 +384,61 @@ ARCHIVE_TOOL_SCHEMA = {
 }
 
 
+class _BatchCoalescer:
+    """Coalesce concurrent submit() calls into batched flush_fn(items) calls.
+
+    A batch goes out when max_batch items are pending or window seconds after
+    the first one arrived; the semaphore caps batches in flight. flush_fn returns
+    one result per item (in order); its exception is delivered to every caller.
+    """
+
+    def __init__(self, flush_fn, *, max_batch: int, window: float, semaphore: asyncio.Semaphore):
+        self._flush_fn = flush_fn
+        self._max_batch = max_batch
+        self._window = window
+        self._semaphore = semaphore
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task] = set()  # strong refs -- the loop only keeps weak ones
+
+    async def submit(self, item: Any) -> Any:
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append((item, fut))
+        if len(self._pending) >= self._max_batch:
+            self._start_batch()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._start_batch)
+        return await fut
+
+    def _start_batch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = self._pending[:self._max_batch]
+        del self._pending[:self._max_batch]
+        if self._pending:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._start_batch)
+        if batch:
+            t = asyncio.create_task(self._run(batch))
+            self._batches.add(t)
+            t.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        async with self._semaphore:
+            try:
+                results = await self._flush_fn([item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"batch flush returned {len(results)} results for {len(batch)} items")
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                return
+        for (_, fut), result in zip(batch, results):
+            if not fut.done():
+                fut.set_result(result)
+
+
 class Archivist:
     """Processes closed events into deep memory vectors."""
 
@@ -278,12 +446,30 @@ class Archivist:
         self._client = None
         self._adapter = None
         self._claude_adapter = None
+        self._adapter_lock = asyncio.Lock()
+        # Archive-path embeds and Qdrant writes share the in-flight batch budget
+        self._archive_batches = asyncio.Semaphore(ARCHIVIST_MAX_CONCURRENT_BATCHES)
+        self._embed_batcher = _BatchCoalescer(
+            self._embed_many, max_batch=ARCHIVIST_BATCH_SIZE,
+            window=ARCHIVE_EMBED_WINDOW_SEC, semaphore=self._archive_batches,
+        )
+        self._upsert_batcher = _BatchCoalescer(
+            self._upsert_grouped, max_batch=ARCHIVIST_BATCH_SIZE,
+            window=ARCHIVE_EMBED_WINDOW_SEC, semaphore=self._archive_batches,
+        )
+        # Query-path embeddings: LRU keyed by blake2b(query) + single-flight for concurrent misses
+        self._query_embed_cache: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._query_embed_inflight: dict[bytes, asyncio.Future] = {}
         self._vector_store = None
         self._initialized = False
         self._knowledge_ready = False
+        self._archive_cache_ready = False
+        self._archive_cache_services: dict[str, float] = {}  # service -> last summarized archive (cache-embed gate)
         self.project = os.getenv("GCP_PROJECT", "")
         self.location = os.getenv("GCP_LOCATION", "global")
         self.pulse_port = None  # PulsePort | None -- set by main.py when pulse tracking enabled
+        self.checkpoint = None  # BlackboardState | None -- set by main.py; stages archive points until Qdrant acks
+        self._checkpoint_full = False  # last stage hit ARCHIVE_PENDING_MAX (warn once per episode)
 
     async def _ensure_initialized(self) -> bool:
         """Lazy-init google-genai client and vector store."""
@@ -324,23 +510,32 @@ class Archivist:
                 logger.warning(f"Knowledge collection init failed (degraded): {e}")
                 self._knowledge_ready = False
 
+            try:
+                await self._vector_store.ensure_collection(ARCHIVE_CACHE_COLLECTION, vector_size=768)
+                await self._vector_store.create_payload_index(ARCHIVE_CACHE_COLLECTION, "service", "keyword")
+                await self._vector_store.create_payload_index(ARCHIVE_CACHE_COLLECTION, "closed_at", "float")
+                self._archive_cache_ready = True
+            except Exception as e:
+                logger.warning(f"Archive summary cache init failed (degraded, always summarizing): {e}")
+                self._archive_cache_ready = False
+
             return True
         except Exception as e:
             logger.warning(f"Archivist init failed (non-fatal): {e}")
             return False
 
+    async def close(self) -> None:
+        """Release the pooled Qdrant HTTP client. Wired to lifespan shutdown."""
+        if self._vector_store is not None:
+            await self._vector_store.close()
+
     async def _get_adapter(self):
         """Lazy-load LLM adapter for summarization (Gemini, ARCHIVIST model)."""
-        if self._adapter is None:
-            try:
-                from .llm import create_adapter
-
-                self._adapter = create_adapter("gemini", self.project, self.location, ARCHIVIST_MODEL)
-                logger.info(f"Archivist LLM adapter initialized: gemini/{ARCHIVIST_MODEL}")
-            except Exception as e:
-                logger.warning(f"LLM adapter not available for Archivist: {e}")
-                self._adapter = None
-        return self._adapter
+        from .llm import get_or_create_adapter
+        return await get_or_create_adapter(
+            self, self._adapter_lock, "gemini", self.project, self.location, ARCHIVIST_MODEL,
+            label="Archivist",
+        )
 
     async def _embed(self, text: str) -> list[float]:
         """Generate embedding vector, truncated to EMBEDDING_DIMS."""
@@ -352,6 +547,83 @@ class Archivist:
         )
         return r.embeddings[0].values
 
+    async def _embed_query(self, query: str) -> list[float]:
+        """Query-path embed: served from the LRU cache; concurrent misses share one call."""
+        key = hashlib.blake2b(query.encode(), digest_size=16).digest()
+        vector = self._query_embed_cache.get(key)
+        if vector is not None:
+            self._query_embed_cache.move_to_end(key)
+            return vector
+        pending = self._query_embed_inflight.get(key)
+        if pending is not None:
+            vector = await asyncio.shield(pending)
+            if vector is None:  # the leader was cancelled -- this caller was not, so embed on its own
+                return await self._embed_query(query)
+            return vector
+        fut = asyncio.get_running_loop().create_future()
+        self._query_embed_inflight[key] = fut
+        try:
+            vector = await self._embed(query)
+        except asyncio.CancelledError:
+            fut.set_result(None)  # not fut.cancel(): that would raise CancelledError in every follower
+            raise
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved -- having no waiters is not an error
+            raise
+        finally:
+            self._query_embed_inflight.pop(key, None)
+        fut.set_result(vector)
+        self._query_embed_cache[key] = vector
+        while len(self._query_embed_cache) > QUERY_EMBED_CACHE_MAX:
+            self._query_embed_cache.popitem(last=False)
+        return vector
+
+    async def _embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Embed several texts in one embed_content call, truncated to EMBEDDING_DIMS."""
+        from google.genai import types
+        r = await self._client.aio.models.embed_content(
+            model=EMBEDDING_MODEL,
+            contents=texts,
+            config=types.EmbedContentConfig(output_dimensionality=EMBEDDING_DIMS),
+        )
+        return [e.values for e in r.embeddings]
+
+    async def _embed_archive(self, text: str) -> list[float]:
+        """Archive-path embed: coalesce with concurrent archives into one batched request."""
+        return await self._embed_batcher.submit(text)
+
+    async def _upsert_grouped(self, points: list[tuple[str, dict]]) -> list[None]:
+        """Flush buffered (collection, point) writes -- one upsert_many per collection."""
+        by_collection: dict[str, list[dict]] = {}
+        for collection, point in points:
+            by_collection.setdefault(collection, []).append(point)
+        for collection, batch in by_collection.items():
+            await self._vector_store.upsert_many(collection, batch)
+            if self.checkpoint is not None:
+                try:
+                    await self.checkpoint.commit_archive_points([p["id"] for p in batch])
+                except Exception as e:
+                    logger.debug(f"Archive checkpoint commit failed (replay will re-upsert): {e}")
+        if len(points) > 1:
+            logger.debug(f"Archivist wrote {len(points)} archive points in {len(by_collection)} request(s)")
+        return [None] * len(points)
+
+    async def _upsert_archive(
+        self, collection: str, point_id: str, vector: list[float], payload: dict,
+    ) -> None:
+        """Archive-path Qdrant write: checkpointed, then coalesced with concurrent archives into one upsert."""
+        point = {"id": point_id, "vector": vector, "payload": payload}
+        if self.checkpoint is not None:
+            try:
+                staged = await self.checkpoint.stage_archive_point(collection, point)
+                if not staged and not self._checkpoint_full:
+                    logger.warning("Archive checkpoint full -- writing without crash protection until Qdrant drains it")
+                self._checkpoint_full = not staged
+            except Exception as e:
+                logger.debug(f"Archive checkpoint stage failed for {point_id} (writing anyway): {e}")
+        await self._upsert_batcher.submit((collection, point))
+
     async def embed_query(self, text: str) -> list[float]:
         """Generate a 768-dim embedding for a query string.
 
@@ -360,7 +632,89 @@ class Archivist:
         """
         if not await self._ensure_initialized():
             raise RuntimeError("Archivist not initialized")
-        return await self._embed(text)
+        return await self._embed_query(text)
+
+    async def _archive_cache_vector(self, event: EventDocument, conversation_text: str) -> list[float] | None:
+        """Embed the conversation (timestamps stripped, head + tail) for the summary cache.
+
+        Skipped for the first archive of a service within the TTL -- nothing could
+        be cached for it yet, and most events are not part of a storm.
+        """
+        if not self._archive_cache_ready or not conversation_text:
+            return None
+        now = time.time()
+        seen = self._archive_cache_services
+        recent = now - seen.get(event.service, 0.0) < ARCHIVE_CACHE_TTL_SEC
+        if event.service not in seen:
+            for svc in [svc for svc, ts in seen.items() if now - ts >= ARCHIVE_CACHE_TTL_SEC]:
+                del seen[svc]
+        seen[event.service] = now
+        if not recent:
+            return None
+        text = _TURN_TS_RE.sub("[", conversation_text)
+        if len(text) > 2 * _ARCHIVE_CACHE_EDGE_CHARS:
+            text = f"{text[:_ARCHIVE_CACHE_EDGE_CHARS]}\n...\n{text[-_ARCHIVE_CACHE_EDGE_CHARS:]}"
+        try:
+            return await self._embed_archive(text)
+        except Exception as e:
+            logger.debug(f"Archive cache embed failed (summarizing): {e}")
+            return None
+
+    async def _cached_summary(
+        self, event: EventDocument, cache_vector: list[float], duration: int,
+    ) -> dict | None:
+        """Reuse a recent same-service summary for a near-duplicate conversation."""
+        try:
+            hits = await self._vector_store.search(
+                ARCHIVE_CACHE_COLLECTION, cache_vector, limit=1,
+                filter={"must": [
+                    {"key": "service", "match": {"value": event.service}},
+                    {"key": "closed_at", "range": {"gte": time.time() - ARCHIVE_CACHE_TTL_SEC}},
+                ]},
+            )
+        except Exception as e:
+            logger.debug(f"Archive cache lookup failed (summarizing): {e}")
+            return None
+        if not hits or hits[0]["score"] < ARCHIVE_CACHE_THRESHOLD:
+            return None
+        payload = hits[0]["payload"]
+        cached = payload.get("summary") or {}
+        if not cached.get("symptom"):
+            return None
+        # Per-event fields come from this event; reference_facts were already stored by the source archive
+        summary = _heuristic_summary(event)
+        summary.update({k: cached[k] for k in _CACHE_PATTERN_FIELDS if k in cached})
+        summary["instance_keywords"] = [event.service]
+        summary["summary_source"] = "cache"
+        summary["source_event_id"] = payload.get("event_id")
+        summary["turns"] = len(event.conversation)
+        summary["duration_seconds"] = duration
+        logger.info(
+            f"Archive cache hit for {event.id}: reusing summary of {payload.get('event_id')} "
+            f"(score={round(hits[0]['score'], 3)})"
+        )
+        return summary
+
+    async def _remember_archive(
+        self, event: EventDocument, summary: dict, cache_vector: list[float] | None,
+    ) -> None:
+        """Record this event's summary under its conversation vector. Non-fatal."""
+        if cache_vector is None or summary.get("root_cause", "unknown") == "unknown":
+            return  # never serve a parse-failure placeholder as a cached summary
+        try:
+            await self._upsert_archive(
+                collection=ARCHIVE_CACHE_COLLECTION,
+                point_id=str(uuid.uuid5(uuid.NAMESPACE_URL, f"darwin:cache:{event.id}")),
+                vector=cache_vector,
+                payload={
+                    "event_id": event.id,
+                    "service": event.service,
+                    "closed_at": summary.get("closed_at", time.time()),
+                    "summary": summary,
+                },
+            )
+        except Exception as e:
+            logger.debug(f"Archive cache write failed for {event.id}: {e}")
 
     async def archive_event(self, event: EventDocument) -> None:
         """
@@ -374,22 +728,7 @@ class Archivist:
             if not await self._ensure_initialized():
                 return
 
-            conv_lines = []
-            for turn in event.conversation:
-                if turn.action in ("think",):
-                    continue
-                ts = datetime.fromtimestamp(turn.timestamp).strftime("%H:%M:%S")
-                line = f"[{ts} {turn.actor}.{turn.action}]"
-                if turn.thoughts:
-                    line += f" {turn.thoughts}"
-                if turn.evidence:
-                    line += f"\n  Evidence: {turn.evidence}"
-                if turn.result:
-                    line += f"\n  Result: {turn.result}"
-                if turn.plan:
-                    line += f"\n  Plan: {turn.plan}"
-                conv_lines.append(line)
-            conversation_text = "\n".join(conv_lines)
+            conversation_text = _format_conversation(event.conversation)
 
             duration = 0
             if event.conversation:
@@ -397,43 +736,53 @@ class Archivist:
                 last_ts = event.conversation[-1].timestamp
                 duration = int(last_ts - first_ts)
 
-            adapter = await self._get_claude_adapter()
-            if not adapter:
-                logger.warning(f"Claude adapter unavailable for archive, falling back to Gemini for {event.id}")
-                await self._archive_event_fallback(event, conversation_text, duration)
-                return
-
-            claude_timeout = float(os.getenv("CLAUDE_TIMEOUT_SEC", "120"))
-            try:
-                response = await asyncio.wait_for(
-                    adapter.generate(
-                        system_prompt=ARCHIVE_SYSTEM_PROMPT,
-                        contents=conversation_text,
-                        tools=[ARCHIVE_TOOL_SCHEMA],
-                        tool_choice={"type": "auto"},
-                        temperature=1.0,
-                        max_output_tokens=_ARCHIVIST_CLAUDE_MAX_TOKENS,
-                    ),
-                    timeout=claude_timeout,
-                )
-            except asyncio.TimeoutError:
-                logger.warning(f"Claude archive timed out after {claude_timeout}s for {event.id}, falling back to Gemini")
-                await self._archive_event_fallback(event, conversation_text, duration)
-                return
-            from .llm import record_token_usage
-            record_token_usage("archivist", response.usage)
-
-            if response.function_call and response.function_call.args is not None:
-                summary = response.function_call.args
+            cache_vector = None
+            summary = None
+            if len(event.conversation) <= ARCHIVIST_FAST_PATH_MAX_TURNS:
+                summary = _heuristic_summary(event)
             else:
-                text = (response.text or "").strip()
-                if text.startswith("```"):
-                    text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+                cache_vector = await self._archive_cache_vector(event, conversation_text)
+            if cache_vector is not None:
+                summary = await self._cached_summary(event, cache_vector, duration)
+
+            if summary is None:
+                adapter = await self._get_claude_adapter()
+                if not adapter:
+                    logger.warning(f"Claude adapter unavailable for archive, falling back to Gemini for {event.id}")
+                    await self._archive_event_fallback(event, conversation_text, duration, cache_vector)
+                    return
+
+                claude_timeout = float(os.getenv("CLAUDE_TIMEOUT_SEC", "120"))
                 try:
-                    summary = json.loads(text)
-                except json.JSONDecodeError:
-                    logger.warning(f"Archive summary parse failed for {event.id}, using fallback")
-                    summary = {"symptom": event.event.reason, "root_cause": "unknown", "fix_action": "unknown"}
+                    response = await asyncio.wait_for(
+                        adapter.generate(
+                            system_prompt=ARCHIVE_SYSTEM_PROMPT,
+                            contents=conversation_text,
+                            tools=[ARCHIVE_TOOL_SCHEMA],
+                            tool_choice={"type": "auto"},
+                            temperature=1.0,
+                            max_output_tokens=_ARCHIVIST_CLAUDE_MAX_TOKENS,
+                        ),
+                        timeout=claude_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning(f"Claude archive timed out after {claude_timeout}s for {event.id}, falling back to Gemini")
+                    await self._archive_event_fallback(event, conversation_text, duration, cache_vector)
+                    return
+                from .llm import record_token_usage
+                record_token_usage("archivist", response.usage)
+
+                if response.function_call and response.function_call.args is not None:
+                    summary = response.function_call.args
+                else:
+                    text = (response.text or "").strip()
+                    if text.startswith("```"):
+                        text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+                    try:
+                        summary = orjson.loads(text)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Archive summary parse failed for {event.id}, using fallback")
+                        summary = {"symptom": event.event.reason, "root_cause": "unknown", "fix_action": "unknown"}
 
             summary.setdefault("service", event.service)
             summary.setdefault("turns", len(event.conversation))
@@ -455,18 +804,20 @@ class Archivist:
                 f"{' '.join(summary.get('instance_keywords', []))} "
                 f"{summary.get('outcome', '')}"
             )
-            vector = await self._embed(embed_text)
+            vector = await self._embed_archive(embed_text)
 
-            point_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"darwin:{event.id}"))
+            point_id = _event_point_id(event.id)
             summary["event_id"] = event.id
             summary["closed_at"] = time.time()
 
-            await self._vector_store.upsert(
+            await self._upsert_archive(
                 collection=COLLECTION_NAME,
                 point_id=point_id,
                 vector=vector,
                 payload=summary,
             )
+            if "source_event_id" not in summary:
+                await self._remember_archive(event, summary, cache_vector)
 
             for fact in summary.get("reference_facts", []):
                 try:
@@ -490,7 +841,10 @@ class Archivist:
         except Exception as e:
             logger.warning(f"Archivist failed for event {event.id} (non-fatal): {e}")
 
-    async def _archive_event_fallback(self, event: EventDocument, conversation_text: str, duration: int) -> None:
+    async def _archive_event_fallback(
+        self, event: EventDocument, conversation_text: str, duration: int,
+        cache_vector: list[float] | None = None,
+    ) -> None:
         """Fallback to Gemini (SUMMARIZE_PROMPT) when Claude is unavailable."""
         adapter = await self._get_adapter()
         if not adapter:
@@ -503,16 +857,15 @@ class Archivist:
             temperature=float(os.getenv("LLM_TEMPERATURE_ARCHIVIST", "0.3")),
             max_output_tokens=int(os.getenv("LLM_MAX_TOKENS_ARCHIVIST", "4096")),
             thinking_level=os.getenv("LLM_THINKING_ARCHIVIST", "high"),
+            response_mime_type="application/json",
         )
         from .llm import record_token_usage
         record_token_usage("archivist", response.usage)
 
         summary_text = (response.text or "").strip()
-        if summary_text.startswith("```"):
-            summary_text = summary_text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
 
         try:
-            summary = json.loads(summary_text)
+            summary = orjson.loads(summary_text)
         except json.JSONDecodeError:
             summary = {
                 "symptom": event.event.reason,
@@ -549,18 +902,19 @@ class Archivist:
             f"{' '.join(summary.get('instance_keywords', []))} "
             f"{summary.get('outcome', '')}"
         )
-        vector = await self._embed(embed_text)
+        vector = await self._embed_archive(embed_text)
 
-        point_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"darwin:{event.id}"))
+        point_id = _event_point_id(event.id)
         summary["event_id"] = event.id
         summary["closed_at"] = time.time()
 
-        await self._vector_store.upsert(
+        await self._upsert_archive(
             collection=COLLECTION_NAME,
             point_id=point_id,
             vector=vector,
             payload=summary,
         )
+        await self._remember_archive(event, summary, cache_vector)
 
         for fact in summary.get("reference_facts", []):
             try:
@@ -577,17 +931,45 @@ class Archivist:
 
         logger.info(f"Archived event {event.id} (Gemini fallback) -> Qdrant")
 
+    async def _replay_checkpoint(self, blackboard) -> int:
+        """Upsert archive points staged before a crash or failed write. Returns count replayed."""
+        try:
+            staged = await blackboard.get_staged_archive_points()
+        except Exception as e:
+            logger.warning(f"Archive checkpoint read failed (non-fatal): {e}")
+            return 0
+        if not staged:
+            return 0
+        by_collection: dict[str, list[dict]] = {}
+        for collection, point in staged:
+            by_collection.setdefault(collection, []).append(point)
+        replayed = 0
+        for collection, points in by_collection.items():
+            for i in range(0, len(points), ARCHIVIST_BATCH_SIZE):
+                batch = points[i:i + ARCHIVIST_BATCH_SIZE]
+                try:
+                    await self._vector_store.upsert_many(collection, batch)
+                    await blackboard.commit_archive_points([p["id"] for p in batch])
+                    replayed += len(batch)
+                except Exception as e:
+                    logger.warning(f"Archive checkpoint replay failed for {collection} (kept for next start): {e}")
+        if replayed:
+            logger.info(f"Replayed {replayed} checkpointed archive point(s) to Qdrant")
+        return replayed
+
     async def backfill_archives(self, blackboard) -> int:
         """Scan Redis for closed events missing from Qdrant. Returns count backfilled."""
         try:
             if not await self._ensure_initialized():
                 return 0
 
+            await self._replay_checkpoint(blackboard)
+
             event_ids = await blackboard.get_closed_event_ids(limit=200)
             if not event_ids:
                 return 0
 
-            point_ids = [str(uuid.uuid5(uuid.NAMESPACE_URL, f"darwin:{eid}")) for eid in event_ids]
+            point_ids = [_event_point_id(eid) for eid in event_ids]
             existing = await self._vector_store.get_points(COLLECTION_NAME, point_ids)
             existing_ids = {p.get("id") for p in existing}
 
@@ -598,13 +980,20 @@ class Archivist:
             if not missing:
                 return 0
 
-            backfilled = 0
-            for eid, _ in missing:
-                event = await blackboard.get_event(eid)
-                if event:
+            # Bounded concurrency: archive calls overlap, so their embeddings coalesce
+            gate = asyncio.Semaphore(ARCHIVIST_BATCH_SIZE // 4 or 1)
+
+            async def _backfill_one(eid: str) -> bool:
+                async with gate:
+                    event = await blackboard.get_event(eid)
+                    if not event:
+                        return False
                     logger.info(f"Backfill: archiving missed event {eid}")
                     await self.archive_event(event)
-                    backfilled += 1
+                    return True
+
+            results = await asyncio.gather(*(_backfill_one(eid) for eid, _ in missing))
+            backfilled = sum(results)
 
             if backfilled:
                 logger.info(f"Backfill complete: {backfilled} events archived")
@@ -626,7 +1015,7 @@ class Archivist:
                 return []
 
             if vector is None:
-                vector = await self._embed(query)
+                vector = await self._embed_query(query)
 
             results = await self._vector_store.search(
                 collection=COLLECTION_NAME,
@@ -644,6 +1033,37 @@ class Archivist:
             logger.warning(f"Deep memory search failed (non-fatal): {e}")
             return []
 
+    async def search_many(
+        self, queries: list[str], *, limit: int = 5, context=None, filter: dict | None = None,
+    ) -> list[list[dict]]:
+        """
+        Search deep memory for several queries at once.
+
+        Embeds the queries in list-valued embed_content calls (one RTT per
+        ARCHIVIST_BATCH_SIZE queries) and runs the Qdrant searches concurrently,
+        bounded by SEARCH_MANY_CONCURRENCY. Returns one result list per query,
+        in input order; a failed query yields [].
+        """
+        if not queries:
+            return []
+        try:
+            if not await self._ensure_initialized():
+                return [[] for _ in queries]
+            vectors: list[list[float]] = []
+            for i in range(0, len(queries), ARCHIVIST_BATCH_SIZE):
+                vectors.extend(await self._embed_many(queries[i:i + ARCHIVIST_BATCH_SIZE]))
+        except Exception as e:
+            logger.warning(f"Deep memory batch embed failed (non-fatal): {e}")
+            return [[] for _ in queries]
+
+        gate = asyncio.Semaphore(SEARCH_MANY_CONCURRENCY)
+
+        async def _one(query: str, vector: list[float]) -> list[dict]:
+            async with gate:
+                return await self.search(query, limit=limit, context=context, vector=vector, filter=filter)
+
+        return list(await asyncio.gather(*(_one(q, v) for q, v in zip(queries, vectors))))
+
     async def store_feedback(
         self,
         event_id: str,
@@ -703,7 +1123,7 @@ class Archivist:
             if not await self._ensure_initialized():
                 return False
 
-            point_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"darwin:{event_id}"))
+            point_id = _event_point_id(event_id)
             existing = await self._vector_store.get_points(COLLECTION_NAME, [point_id])
             if not existing:
                 logger.warning(f"correct_memory: event {event_id} not found in Qdrant")
@@ -886,7 +1306,7 @@ class Archivist:
             max_experience = int(os.environ.get("LESSON_RECALL_MAX_EXPERIENCE", "1"))
 
             if vector is None:
-                vector = await self._embed(query)
+                vector = await self._embed_query(query)
             results = await self._vector_store.search(
                 collection=LESSONS_COLLECTION,
                 vector=vector,
@@ -994,7 +1414,7 @@ class Archivist:
         try:
             if not await self._ensure_initialized():
                 return None
-            point_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"darwin:{event_id}"))
+            point_id = _event_point_id(event_id)
             results = await self._vector_store.get_points(COLLECTION_NAME, [point_id])
             return results[0] if results else None
         except Exception as e:
@@ -1159,7 +1579,7 @@ class Archivist:
                 return []
 
             if vector is None:
-                vector = await self._embed(query)
+                vector = await self._embed_query(query)
 
             conditions = []
             if scope_filter:
@@ -1472,15 +1892,11 @@ class Archivist:
 
     async def _get_claude_adapter(self):
         """Lazy-load Claude adapter for extraction (same lifecycle pattern as _get_adapter)."""
-        if self._claude_adapter is None:
-            try:
-                from .llm import create_adapter
-                self._claude_adapter = create_adapter("claude", self.project, self.location, EXTRACTOR_MODEL)
-                logger.info(f"Claude adapter initialized: {EXTRACTOR_MODEL}")
-            except Exception as e:
-                logger.warning(f"Claude adapter not available: {e}")
-                self._claude_adapter = None
-        return self._claude_adapter
+        from .llm import get_or_create_adapter
+        return await get_or_create_adapter(
+            self, self._adapter_lock, "claude", self.project, self.location, EXTRACTOR_MODEL,
+            attr="_claude_adapter", label="Archivist",
+        )
 
     async def extract_lessons(
         self,
@@ -1684,11 +2100,10 @@ class Archivist:
             contents=prompt_body,
             temperature=0.2,
             max_output_tokens=_ARCHIVIST_DIGEST_MAX_TOKENS,
+            response_mime_type="application/json",
         )
 
-        raw = response.text.strip()
-        if raw.startswith("```"):
-            raw = raw.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+        raw = (response.text or "").strip()
 
         try:
             result = json.loads(raw)
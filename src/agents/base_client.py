@@ -1,12 +1,53 @@
 # BlackBoard/src/agents/base_client.py
 # @ai-rules:
-# 1. [Pattern]: process() serialized via _lock. _process_inner() does the actual WS send/recv.
-# 2. [Pattern]: CancelledError in WS recv loop triggers finally -> WS close -> sidecar SIGTERM chain.
-# 3. [Gotcha]: busy retry loop re-sends the task. Max 5 retries with exponential backoff (5s-60s).
-# 4. [Constraint]: Security check on prompt before sending. FORBIDDEN_PATTERNS from security.py.
-# 5. [Pattern]: connect() retries 5 times with exponential backoff (1-16s). _ensure_connected() pings first.
+# 1. [Constraint]: process()/followup() serialize on _call_lock by default (defensive_lock=True). The legacy
+#    sidecar runs one CLI at a time: its followup handler has no busy check, and Brain.send_to_agent calls
+#    followup() outside _agent_locks. _send() also holds _send_lock (frame atomicity); _read_loop routes by
+#    event_id, and a second call for an event already in _pending is refused. defensive_lock=False lets calls
+#    for different events share the WS concurrently -- only for sidecars that multiplex. _process_inner() does
+#    the send/recv.
+# 2. [Pattern]: CancelledError in the recv loop sends {type: cancel} -> sidecar SIGTERMs the CLI. The WS stays
+#    open for the next task; only if that send fails is the WS closed (sidecar kills orphans on disconnect).
+#    Successful result/error/busy-exhausted returns never touch the socket. abort_current_task() is the explicit
+#    hard stop: closes the WS and fails in-flight waiters with _CLOSED.
+# 3. [Gotcha]: busy retry loop re-sends the task. Max 5 retries. After "busy" the loop keeps reading and
+#    resends on the sidecar's "ready" frame; the BUSY_BACKOFF_SEC table (5s-60s) is only the fallback deadline.
+#    Retry count lives on the per-invocation _TaskRun -- no per-event dict on the instance (session_id is
+#    returned to Brain, which owns _agent_sessions). The only cross-event
+#    busy state is _busy_ema (smoothed busy->ready wait): once measured, the fallback is that estimate (+10% per
+#    retry, 0.5s floor, +/-20% jitter) capped by the table entry. Only real "ready" frames feed the EMA (timed-out
+#    fallbacks would drag it down to the delay itself), and the last fallback never fires before sum(table) has
+#    elapsed since the first busy -- a silent sidecar still gets the table's full ~135s before Brain hears busy.
+# 4. [Constraint]: Security check on prompt before sending. FORBIDDEN_PATTERNS via security.find_forbidden_pattern().
+# 5. [Pattern]: connect() retries 5 times with exponential backoff (CONNECT_BACKOFF_SEC, 1-16s). _ensure_connected() pings first
+#    unless a frame was sent/received within PING_SKIP_SEC (_last_activity); a dropped socket is already
+#    flagged by _read_loop, so the freshness shortcut never trusts a dead connection.
 # 6. [Pattern]: process() accepts optional session_id for CLI --resume. Returns tuple[str, Optional[str]] = (result, session_id).
 # 7. [Pattern]: followup() sends a follow-up message to an active/resumable session. Same recv loop as process().
+# 8. [Pattern]: health() reuses one lazy httpx.AsyncClient (_get_http). close() releases it -- wired to lifespan shutdown.
+# 9. [Pattern]: Wire JSON via orjson. Frames are sent as bytes (sidecar does JSON.parse(data.toString())).
+#    Values returned to Brain stay str (.decode()).
+# 10. [Pattern]: One persistent WS per client. _read_loop (started by connect()) is the ONLY reader and routes
+#     frames by event_id into _pending queues; process()/followup() consume their own queue. No event_id -> all
+#     waiters; unknown event_id -> dropped. Connection loss pushes _CLOSED to every waiter.
+#     task/followup/cancel frames carry a per-run task_id (_run_ids); a frame whose task_id is not the current
+#     run's for that event (late result of a cancelled run) is dropped. Frames without task_id are routed as before. A frame orjson rejects
+#     is retried with stdlib json (lone surrogates) and otherwise logged and dropped -- never ends the reader.
+# 11. [Pattern]: "result_chunk" frames ({output, seq, final}) are forwarded to on_progress (source=result_chunk)
+#     and joined once on final=True, then handled exactly like a "result" frame.
+# 12. [Pattern]: on_progress runs on a ProgressPump side task, never inline in the frame loop. Overflow drops the
+#     oldest UI-only payload; agent_message/teammate payloads (they become turns) are never dropped. The pump is
+#     flushed before a result/error is returned so progress turns land before the result turn. Callback errors
+#     are logged, not fatal to the task. Frames are already drained per wake (the pump empties its deque per
+#     wakeup); consecutive still-queued LATEST_ONLY_SOURCES payloads (callback status) collapse to the newest.
+#     close() (every exit path, incl. cancel/_CLOSED) discards queued UI-only payloads but gives queued
+#     lossless ones LOSSLESS_DRAIN_SEC to be delivered before the side task is cancelled.
+#     AgentClient(..., progress_coalesce_ms=N) turns that on for every droppable source and delivers at most one
+#     batch per N ms tick. Off by default -- progress lines are the UI's live log.
+# 13. [Pattern]: process() dispatches frames via self._frame_handlers (type -> _on_<type>(run, msg)). Handlers return
+#     None to keep reading or the (result, session_id) tuple to return. New frame types = new handler + map entry.
+# 14. [Constraint]: Per-frame log calls (reader, ProgressPump, _on_* handlers) use %-style args, not f-strings,
+#     so filtered levels cost no formatting. Connection-lifecycle logs are rare and may stay f-strings.
 """
 Base agent client -- shared WebSocket logic for all Darwin agent sidecars.
 
@@ -16,28 +57,71 @@ that only set agent_name, sidecar_url_env, and cwd.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
-import re
+import random
+import time
+import uuid
 from typing import Callable, Optional
 
+import orjson
 import websockets
+import websockets.exceptions  # lazy in websockets>=14 -- bind for the except clauses below
 
-from .security import FORBIDDEN_PATTERNS, SecurityError
+from .progress_pump import ProgressPump
+from .security import SecurityError, find_forbidden_pattern
 
 logger = logging.getLogger(__name__)
 
 
+class _TaskRun:
+    """Per-invocation state of one process() receive loop (shared by its frame handlers)."""
+
+    __slots__ = ("event_id", "task_frame", "progress", "session_id", "latest_callback_result",
+                 "retries", "resend_at", "busy_since", "first_busy_at", "result_chunks")
+
+    def __init__(
+        self, event_id: str, task_frame: bytes, on_progress: Optional[Callable], label: str,
+        coalesce_sec: float = 0.0,
+    ):
+        self.event_id = event_id
+        self.task_frame = task_frame  # serialized "task" frame, resent verbatim on busy retry
+        self.progress = ProgressPump(on_progress, label, coalesce_sec)
+        self.session_id: Optional[str] = None
+        self.latest_callback_result: Optional[str] = None  # From sendResults partial_result
+        self.retries = 0  # busy retries -- per-invocation, nothing shared across process() calls
+        self.resend_at: Optional[float] = None  # loop time of fallback resend while parked on "busy"
+        self.busy_since: Optional[float] = None  # loop time of the "busy" we are parked on
+        self.first_busy_at: Optional[float] = None  # loop time of this run's first "busy" (total-wait floor)
+        self.result_chunks: list[str] = []  # streamed result pieces, joined once on final
+
+
 class AgentClient:
     """WebSocket client to an agent CLI sidecar container (Gemini or Claude Code)."""
 
+    # Fallback resend deadline after the Nth "busy" when no "ready" frame arrives; len() = max retries.
+    # Once busy->ready waits have been measured these are ceilings, not the schedule (_busy_fallback_delay).
+    BUSY_BACKOFF_SEC: tuple[float, ...] = (5, 10, 20, 40, 60)
+    BUSY_EMA_ALPHA = 0.3
+    BUSY_MIN_DELAY_SEC = 0.5
+    # Largest inbound frame. partial_result deliverables are not chunked; the websockets default (1 MiB)
+    # would close the socket (1009) on a big one. Results over 64 KB already arrive as result_chunk frames.
+    WS_MAX_FRAME_BYTES = 64 * 1024 * 1024
+    # _ensure_connected() skips the ping when a frame moved on the WS this recently
+    PING_SKIP_SEC = 5.0
+    # Sleep after the Nth failed connect attempt; len() = attempts
+    CONNECT_BACKOFF_SEC: tuple[float, ...] = (1, 2, 4, 8, 16)
+
     def __init__(
         self,
         agent_name: str,
         sidecar_url_env: str,
         default_url: str,
         cwd: str,
+        defensive_lock: bool = True,
+        progress_coalesce_ms: int = 0,
     ):
         self.sidecar_url = os.getenv(sidecar_url_env, default_url)
         ws_base = self.sidecar_url.replace("http://", "ws://").replace("https://", "wss://")
@@ -46,18 +130,35 @@ class AgentClient:
         self.cwd = cwd
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._connected = False
-        self._busy_retries: dict[str, int] = {}
-        self._active_sessions: dict[str, str] = {}  # event_id -> session_id (Phase 2)
-        # Defense-in-depth lock: serializes process() calls on this agent instance.
-        # Brain also holds per-agent locks (_agent_locks) to prevent concurrent dispatch.
-        # This client lock ensures safety if the agent is used outside the Brain context
-        # (e.g., direct testing, future multi-Brain scenarios).
-        self._lock = asyncio.Lock()
+        self._http = None  # httpx.AsyncClient -- lazy, reused across health() calls (keep-alive)
+        # Single reader task demultiplexes frames by event_id into per-request queues
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: dict[str, asyncio.Queue] = {}  # event_id -> frame queue
+        self._run_ids: dict[str, str] = {}  # event_id -> task_id of the run that owns _pending[event_id]
+        # Frame-level send mutex -- keeps concurrent senders' frames whole on the shared WS
+        self._send_lock = asyncio.Lock()
+        # Whole-call serialization (ai-rule 1). Off only for sidecars that run several events at once.
+        self._call_lock = asyncio.Lock() if defensive_lock else contextlib.nullcontext()
+        self._progress_coalesce_sec = progress_coalesce_ms / 1000  # 0 = deliver every progress frame
+        self._busy_ema: Optional[float] = None  # smoothed busy->ready wait, shared across events
+        self._last_activity = 0.0  # monotonic time of the last frame sent or received
+        # process() frame dispatch: msg type -> handler(run, msg); unknown types are ignored
+        self._frame_handlers: dict[str, Callable] = {
+            "progress": self._on_progress,
+            "result_chunk": self._on_result_chunk,
+            "partial_result": self._on_partial_result,
+            "agent_teammate_message": self._on_teammate_message,
+            "result": self._on_result,
+            "error": self._on_error,
+            "busy": self._on_busy,
+            "ready": self._on_ready,
+            "question": self._on_question,
+        }
         logger.info(f"{agent_name} client initialized (WS: {self.ws_url})")
 
     async def connect(self) -> None:
         """Establish persistent WebSocket connection with retry."""
-        delays = [1, 2, 4, 8, 16]
+        delays = self.CONNECT_BACKOFF_SEC
         for attempt, delay in enumerate(delays, 1):
             try:
                 self._ws = await websockets.connect(
@@ -65,8 +166,12 @@ class AgentClient:
                     ping_interval=30,
                     ping_timeout=10,
                     close_timeout=5,
+                    # Sidecars never enable permessage-deflate; don't offer it, so no zlib on any frame
+                    compression=None,
+                    max_size=self.WS_MAX_FRAME_BYTES,
                 )
                 self._connected = True
+                self._start_reader()
                 logger.info(f"{self.agent_name} WebSocket connected to {self.ws_url}")
                 return
             except Exception as e:
@@ -76,19 +181,85 @@ class AgentClient:
         logger.error(f"{self.agent_name} WebSocket failed to connect after {len(delays)} attempts")
 
     async def close(self) -> None:
-        """Close WebSocket connection."""
+        """Close WebSocket connection, its reader task, and the shared HTTP client."""
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
         if self._ws:
             await self._ws.close()
             self._connected = False
             logger.info(f"{self.agent_name} WebSocket closed")
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     def cleanup_event(self, event_id: str) -> None:
-        """Clean up per-event state. Called by Brain on event close/cancel."""
-        self._active_sessions.pop(event_id, None)
+        """Clean up per-event state. Called by Brain on event close/cancel.
+
+        The base client keeps none: task state lives on the per-call _TaskRun and
+        Brain owns the event -> session_id map. Subclasses extend this hook.
+        """
+
+    _CLOSED = {"type": "_closed"}  # reader -> waiters: connection ended
+
+    def _start_reader(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+        self._reader = asyncio.create_task(self._read_loop(self._ws))
+
+    async def _read_loop(self, ws) -> None:
+        """Route every frame to the queue registered for its event_id.
+
+        Frames without an event_id (e.g. "ready") go to every waiter; frames for
+        an event nobody is waiting on (stale output of a cancelled task) are dropped.
+        """
+        try:
+            async for raw in ws:
+                self._last_activity = time.monotonic()
+                try:
+                    msg = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # orjson rejects lone surrogates (a JS .slice() mid-pair); stdlib json keeps them.
+                    try:
+                        msg = json.loads(raw)
+                    except ValueError as e:
+                        logger.warning("%s dropping undecodable frame: %s", self.agent_name, e)
+                        continue
+                eid = msg.get("event_id")
+                if eid:
+                    q = self._pending.get(eid)
+                    tid = msg.get("task_id")
+                    if tid is not None and tid != self._run_ids.get(eid):
+                        # Late output of a cancelled run on the same event -- not this run's frame
+                        logger.debug("%s dropping %s frame of stale run %s for %s", self.agent_name, msg.get("type"), tid, eid)
+                    elif q is not None:
+                        q.put_nowait(msg)
+                    else:
+                        logger.debug("%s dropping %s frame for idle event %s", self.agent_name, msg.get("type"), eid)
+                else:
+                    for q in self._pending.values():
+                        q.put_nowait(msg)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.warning(f"{self.agent_name} WS reader stopped: {e}")
+        finally:
+            if ws is self._ws:  # a superseded reader must not fail the new connection's waiters
+                self._connected = False
+                for q in self._pending.values():
+                    q.put_nowait(self._CLOSED)
+
+    async def _send(self, frame: bytes) -> None:
+        """Write one frame; the mutex keeps concurrent senders' frames whole."""
+        async with self._send_lock:
+            await self._ws.send(frame)
+        self._last_activity = time.monotonic()
 
     async def _ensure_connected(self) -> bool:
-        """Reconnect if disconnected."""
+        """Reconnect if disconnected. A recently active socket is trusted without a ping RTT."""
         if self._ws and self._connected:
+            if time.monotonic() - self._last_activity < self.PING_SKIP_SEC:
+                return True
             try:
                 await self._ws.ping()
                 return True
@@ -112,9 +283,9 @@ class AgentClient:
         When session_id is provided, the sidecar passes --resume to the CLI so
         the agent retains context from prior turns on this event.
         Returns (result, None) when sessions are unavailable.
-        Serialized via asyncio.Lock to prevent concurrent WS recv conflicts.
+        Calls are serialized unless the client was built with defensive_lock=False.
         """
-        async with self._lock:
+        async with self._call_lock:
             return await self._process_inner(event_id, task, event_md_path, on_progress, mode, session_id)
 
     async def _process_inner(
@@ -126,7 +297,7 @@ class AgentClient:
         mode: str = "",
         session_id: Optional[str] = None,
     ) -> tuple[str, Optional[str]]:
-        """Inner process logic (called under lock). Returns (result, session_id)."""
+        """Inner process logic. Returns (result, session_id)."""
         # Build prompt
         if event_md_path:
             prompt = f"Read the event document at {event_md_path} and execute this task:\n\n{task}"
@@ -138,163 +309,222 @@ class AgentClient:
             prompt = f"[Mode: {mode}] {prompt}"
 
         # Security check
-        for pattern in FORBIDDEN_PATTERNS:
-            if re.search(pattern, prompt, re.IGNORECASE):
-                msg = f"SECURITY BLOCK: Forbidden pattern: {pattern}"
-                logger.error(msg)
-                raise SecurityError(msg)
+        pattern = find_forbidden_pattern(prompt)
+        if pattern is not None:
+            msg = f"SECURITY BLOCK: Forbidden pattern: {pattern}"
+            logger.error(msg)
+            raise SecurityError(msg)
 
         # Ensure connected
         if not await self._ensure_connected():
             return f"Error: Cannot connect to {self.agent_name} sidecar WebSocket", None
-
-        # Send task
+        if event_id in self._pending:
+            return f"Error: {self.agent_name} already has a task in flight for {event_id}", None
+
+        frames = self._pending[event_id] = asyncio.Queue()
+        task_id = self._run_ids[event_id] = uuid.uuid4().hex
+
+        # Send task -- serialized once; busy retries resend the same bytes
+        task_msg = {
+            "type": "task",
+            "event_id": event_id,
+            "task_id": task_id,
+            "prompt": prompt,
+            "cwd": self.cwd,
+            "autoApprove": True,
+        }
+        if session_id:
+            task_msg["session_id"] = session_id
+        task_frame = orjson.dumps(task_msg)
         try:
-            task_msg = {
-                "type": "task",
-                "event_id": event_id,
-                "prompt": prompt,
-                "cwd": self.cwd,
-                "autoApprove": True,
-            }
-            if session_id:
-                task_msg["session_id"] = session_id
-            await self._ws.send(json.dumps(task_msg))
+            await self._send(task_frame)
         except Exception as e:
+            self._pending.pop(event_id, None)
+            self._run_ids.pop(event_id, None)
             self._connected = False
             return f"Error: Failed to send task: {e}", None
 
-        # Receive messages until result or error.
-        # CancelledError propagates up to Brain.cancel_active_task().
-        # Finally block ensures WS close -> sidecar SIGTERM chain fires.
-        session_id: Optional[str] = None
-        latest_callback_result: Optional[str] = None  # From sendResults partial_result
+        # Receive this event's frames (routed by _read_loop) until result or error.
+        # CancelledError propagates up to Brain.cancel_active_task(); the sidecar is
+        # told to cancel so its CLI process is SIGTERMed without dropping the socket.
+        run = _TaskRun(event_id, task_frame, on_progress, self.agent_name, self._progress_coalesce_sec)
+        loop = asyncio.get_running_loop()
         try:
-            async for raw_msg in self._ws:
-                msg = json.loads(raw_msg)
-                msg_type = msg.get("type")
-
-                if msg_type == "progress":
-                    progress_text = msg.get("message", "")
-                    source = msg.get("source", "")
-                    log_prefix = "[agent_msg]" if source == "agent_message" else ""
-                    logger.debug(f"{self.agent_name} progress {log_prefix}[{event_id}]: {progress_text[:100]}")
-                    if on_progress:
-                        await on_progress({
-                            "actor": self.agent_name,
-                            "event_id": event_id,
-                            "message": progress_text,
-                            "source": source,
-                        })
-
-                elif msg_type == "partial_result":
-                    content = msg.get("content", "")
-                    latest_callback_result = content
-                    logger.info(f"{self.agent_name} callback result [{event_id}]: {len(content)} chars")
-                    if on_progress:
-                        await on_progress({
-                            "actor": self.agent_name,
-                            "event_id": event_id,
-                            "message": f"[deliverable updated: {len(content)} chars]",
-                            "source": "callback",
-                        })
-
-                elif msg_type == "agent_teammate_message":
-                    from_role = msg.get("from", "unknown")
-                    content = msg.get("content", "")
-                    logger.info(f"{self.agent_name} teammate message [{event_id}]: from={from_role}, {len(content)} chars")
-                    if on_progress:
-                        await on_progress({
-                            "actor": from_role,
-                            "event_id": event_id,
-                            "message": content,
-                            "source": "teammate",
-                        })
-
-                elif msg_type == "result":
-                    output = msg.get("output", "")
-                    source = msg.get("source", "stdout")
-                    if isinstance(output, dict):
-                        output = json.dumps(output, indent=2)
-                    # If we have a callback result and the WS result is a stdout fallback,
-                    # prefer the callback (the agent's explicit deliverable)
-                    if latest_callback_result and source == "stdout":
-                        logger.info(f"{self.agent_name} [{event_id}]: preferring callback result over stdout fallback")
-                        output = latest_callback_result
-                    # Capture session_id if sidecar reports one (Phase 2)
-                    session_id = msg.get("session_id") or session_id
-                    if session_id:
-                        self._active_sessions[event_id] = session_id
-                    logger.info(f"{self.agent_name} completed [{event_id}]: {len(str(output))} chars (source={source})"
-                                + (f" (session: {session_id})" if session_id else ""))
-                    self._busy_retries.pop(event_id, None)
-                    return str(output), session_id
-
-                elif msg_type == "error":
-                    error_msg = msg.get("message", "Unknown error")
-                    logger.error(f"{self.agent_name} error [{event_id}]: {error_msg}")
-                    self._busy_retries.pop(event_id, None)
-                    return f"Error: {error_msg}", session_id
-
-                elif msg_type == "busy":
-                    retries = self._busy_retries.get(event_id, 0) + 1
-                    self._busy_retries[event_id] = retries
-                    if retries > 5:
-                        self._busy_retries.pop(event_id, None)
-                        return json.dumps({
-                            "type": "agent_busy",
-                            "agent": self.agent_name,
-                            "event_id": event_id,
-                            "message": f"{self.agent_name} busy after 5 retries. Returning to Brain for decision.",
-                        }), None
-                    delay = min(5 * (2 ** (retries - 1)), 60)
-                    logger.warning(f"{self.agent_name} busy [{event_id}], retry {retries}/5 in {delay}s...")
-                    await asyncio.sleep(delay)
-                    try:
-                        retry_msg = {
-                            "type": "task",
-                            "event_id": event_id,
-                            "prompt": prompt,
-                            "cwd": self.cwd,
-                            "autoApprove": True,
-                        }
-                        if session_id:
-                            retry_msg["session_id"] = session_id
-                        await self._ws.send(json.dumps(retry_msg))
-                    except Exception:
-                        self._busy_retries.pop(event_id, None)
-                        return json.dumps({
-                            "type": "agent_busy",
-                            "agent": self.agent_name,
-                            "event_id": event_id,
-                            "message": f"{self.agent_name} busy and retry send failed.",
-                        }), None
-
-                elif msg_type == "question":
-                    return json.dumps({
-                        "type": "question",
-                        "message": msg.get("message", ""),
-                        "requestingAgent": msg.get("requestingAgent", ""),
-                    }), session_id
+            while True:
+                try:
+                    if run.resend_at is None:
+                        msg = await frames.get()
+                    else:
+                        msg = await asyncio.wait_for(
+                            frames.get(), timeout=max(run.resend_at - loop.time(), 0),
+                        )
+                except TimeoutError:
+                    # Backoff elapsed without a "ready" frame -- fall back to a blind resend
+                    msg = {"type": "ready", "fallback": True}
+                if msg is self._CLOSED:
+                    return "Error: WebSocket connection closed during execution", run.session_id
+                handler = self._frame_handlers.get(msg.get("type"))
+                if handler is not None:
+                    done = await handler(run, msg)
+                    if done is not None:
+                        return done
 
         except asyncio.CancelledError:
             logger.info(f"{self.agent_name} task cancelled for {event_id}")
+            await self._send_cancel(event_id, task_id)
             raise
         except websockets.exceptions.ConnectionClosed:
             self._connected = False
-            return "Error: WebSocket connection closed during execution", session_id
+            return "Error: WebSocket connection closed during execution", run.session_id
         except Exception as e:
-            return f"Error: {e}", session_id
+            return f"Error: {e}", run.session_id
         finally:
-            # Close WS on any exit path -- triggers sidecar SIGTERM on the CLI process
-            if self._ws and self._connected:
-                try:
-                    await self._ws.close()
-                except Exception:
-                    pass
-                self._connected = False
-
-        return "Error: No result received", None
+            await run.progress.close()
+            self._pending.pop(event_id, None)
+            self._run_ids.pop(event_id, None)
+
+    # -- process() frame handlers: return None to keep reading, or the (result, session_id) to return --
+
+    async def _on_result_chunk(self, run: "_TaskRun", msg: dict) -> Optional[tuple[str, Optional[str]]]:
+        # Large results arrive in order as {output, seq, final}; stream each piece
+        # to on_progress and treat the final chunk as the "result" frame.
+        chunk = msg.get("output", "")
+        if msg.get("seq", len(run.result_chunks)) != len(run.result_chunks):
+            logger.warning("%s [%s]: result_chunk seq %s after %d chunks",
+                           self.agent_name, run.event_id, msg.get("seq"), len(run.result_chunks))
+        run.result_chunks.append(chunk)
+        run.progress.emit({
+            "actor": self.agent_name,
+            "event_id": run.event_id,
+            "message": chunk,
+            "source": "result_chunk",
+        })
+        if not msg.get("final"):
+            return None
+        output = "".join(run.result_chunks)
+        run.result_chunks.clear()  # drop the pieces so only the joined copy stays alive
+        return await self._on_result(run, {**msg, "output": output})
+
+    async def _on_progress(self, run: "_TaskRun", msg: dict) -> None:
+        progress_text = msg.get("message", "")
+        source = msg.get("source", "")
+        if logger.isEnabledFor(logging.DEBUG):  # highest-volume frame -- skip formatting when debug is off
+            log_prefix = "[agent_msg]" if source == "agent_message" else ""
+            logger.debug("%s progress %s[%s]: %s", self.agent_name, log_prefix, run.event_id, progress_text[:100])
+        run.progress.emit({
+            "actor": self.agent_name,
+            "event_id": run.event_id,
+            "message": progress_text,
+            "source": source,
+        })
+
+    async def _on_partial_result(self, run: "_TaskRun", msg: dict) -> None:
+        content = msg.get("content", "")
+        run.latest_callback_result = content
+        logger.info("%s callback result [%s]: %d chars", self.agent_name, run.event_id, len(content))
+        run.progress.emit({
+            "actor": self.agent_name,
+            "event_id": run.event_id,
+            "message": f"[deliverable updated: {len(content)} chars]",
+            "source": "callback",
+        })
+
+    async def _on_teammate_message(self, run: "_TaskRun", msg: dict) -> None:
+        from_role = msg.get("from", "unknown")
+        content = msg.get("content", "")
+        logger.info("%s teammate message [%s]: from=%s, %d chars", self.agent_name, run.event_id, from_role, len(content))
+        run.progress.emit({
+            "actor": from_role,
+            "event_id": run.event_id,
+            "message": content,
+            "source": "teammate",
+        })
+
+    async def _on_result(self, run: "_TaskRun", msg: dict) -> tuple[str, Optional[str]]:
+        output = msg.get("output", "")
+        source = msg.get("source", "stdout")
+        if isinstance(output, dict):
+            output = orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
+        elif not isinstance(output, str):
+            output = str(output)
+        # If we have a callback result and the WS result is a stdout fallback,
+        # prefer the callback (the agent's explicit deliverable)
+        if run.latest_callback_result and source == "stdout":
+            logger.info("%s [%s]: preferring callback result over stdout fallback", self.agent_name, run.event_id)
+            output = run.latest_callback_result
+        # Capture session_id if sidecar reports one (Phase 2)
+        run.session_id = msg.get("session_id") or run.session_id
+        logger.info("%s completed [%s]: %d chars (source=%s)%s", self.agent_name, run.event_id, len(output), source,
+                    f" (session: {run.session_id})" if run.session_id else "")
+        await run.progress.flush()
+        return output, run.session_id
+
+    async def _on_error(self, run: "_TaskRun", msg: dict) -> tuple[str, Optional[str]]:
+        error_msg = msg.get("message", "Unknown error")
+        logger.error("%s error [%s]: %s", self.agent_name, run.event_id, error_msg)
+        await run.progress.flush()
+        return f"Error: {error_msg}", run.session_id
+
+    async def _on_busy(self, run: "_TaskRun", msg: dict) -> Optional[tuple[str, Optional[str]]]:
+        run.retries += 1
+        max_retries = len(self.BUSY_BACKOFF_SEC)
+        if run.retries > max_retries:
+            return orjson.dumps({
+                "type": "agent_busy",
+                "agent": self.agent_name,
+                "event_id": run.event_id,
+                "message": f"{self.agent_name} busy after {max_retries} retries. Returning to Brain for decision.",
+            }).decode(), None
+        now = asyncio.get_running_loop().time()
+        if run.first_busy_at is None:
+            run.first_busy_at = now
+        delay = self._busy_fallback_delay(run.retries)
+        if run.retries == max_retries:
+            delay = max(delay, run.first_busy_at + sum(self.BUSY_BACKOFF_SEC) - now)
+        logger.warning(
+            f"{self.agent_name} busy [{run.event_id}], retry {run.retries}/{max_retries} on ready (fallback {delay:.1f}s)..."
+        )
+        # Park on the socket: the sidecar sends "ready" when its current task ends.
+        run.busy_since = now
+        run.resend_at = now + delay
+        return None
+
+    def _busy_fallback_delay(self, retries: int) -> float:
+        """Fallback resend delay for the Nth busy: measured busy time, capped by the table."""
+        ceiling = self.BUSY_BACKOFF_SEC[retries - 1]
+        if self._busy_ema is None:
+            return ceiling
+        delay = max(self.BUSY_MIN_DELAY_SEC, self._busy_ema * (1 + 0.1 * retries))
+        # Jitter decorrelates events that were all parked on the same busy sidecar
+        return min(delay * random.uniform(0.8, 1.2), ceiling)
+
+    async def _on_ready(self, run: "_TaskRun", msg: dict) -> Optional[tuple[str, Optional[str]]]:
+        if run.resend_at is None:
+            return None  # not parked on busy -- stale/unsolicited ready
+        if not msg.get("fallback"):
+            # Timed-out fallbacks only measure our own delay -- feeding them back would shrink it every retry
+            waited = asyncio.get_running_loop().time() - run.busy_since
+            self._busy_ema = waited if self._busy_ema is None else (
+                self.BUSY_EMA_ALPHA * waited + (1 - self.BUSY_EMA_ALPHA) * self._busy_ema
+            )
+        run.resend_at = run.busy_since = None
+        try:
+            await self._send(run.task_frame)
+        except Exception:
+            return orjson.dumps({
+                "type": "agent_busy",
+                "agent": self.agent_name,
+                "event_id": run.event_id,
+                "message": f"{self.agent_name} busy and retry send failed.",
+            }).decode(), None
+        return None
+
+    async def _on_question(self, run: "_TaskRun", msg: dict) -> tuple[str, Optional[str]]:
+        return orjson.dumps({
+            "type": "question",
+            "message": msg.get("message", ""),
+            "requestingAgent": msg.get("requestingAgent", ""),
+        }).decode(), run.session_id
 
     async def followup(
         self,
@@ -307,9 +537,9 @@ class AgentClient:
 
         Used in Phase 2 to forward user messages to running agents
         instead of killing and re-spawning them.
-        Serialized via the same _lock as process() to prevent WS conflicts.
+        Serialized with process() unless defensive_lock=False.
         """
-        async with self._lock:
+        async with self._call_lock:
             return await self._followup_inner(event_id, session_id, message, on_progress)
 
     async def _followup_inner(
@@ -319,64 +549,110 @@ class AgentClient:
         message: str,
         on_progress: Optional[Callable] = None,
     ) -> str:
-        """Inner followup logic (called under lock)."""
+        """Inner followup logic."""
         if not await self._ensure_connected():
             return "Error: Cannot connect to sidecar"
+        if event_id in self._pending:
+            return f"Error: {self.agent_name} already has a task in flight for {event_id}"
 
+        frames = self._pending[event_id] = asyncio.Queue()
+        task_id = self._run_ids[event_id] = uuid.uuid4().hex
         try:
-            await self._ws.send(json.dumps({
+            await self._send(orjson.dumps({
                 "type": "followup",
                 "event_id": event_id,
+                "task_id": task_id,
                 "session_id": session_id,
                 "message": message,
             }))
         except Exception as e:
+            self._pending.pop(event_id, None)
+            self._run_ids.pop(event_id, None)
             self._connected = False
             return f"Error: Failed to send followup: {e}"
 
         # Same receive loop as process() -- progress, result, error
+        progress = ProgressPump(on_progress, self.agent_name, self._progress_coalesce_sec)
         try:
-            async for raw_msg in self._ws:
-                msg = json.loads(raw_msg)
+            while True:
+                msg = await frames.get()
                 msg_type = msg.get("type")
+                if msg is self._CLOSED:
+                    return "Error: WebSocket connection closed during followup"
 
                 if msg_type == "progress":
-                    if on_progress:
-                        await on_progress({
-                            "actor": self.agent_name,
-                            "event_id": event_id,
-                            "message": msg.get("message", ""),
-                        })
+                    progress.emit({
+                        "actor": self.agent_name,
+                        "event_id": event_id,
+                        "message": msg.get("message", ""),
+                    })
                 elif msg_type == "result":
                     output = msg.get("output", "")
                     if isinstance(output, dict):
-                        output = json.dumps(output, indent=2)
-                    return str(output)
+                        output = orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
+                    elif not isinstance(output, str):
+                        output = str(output)
+                    await progress.flush()
+                    return output
                 elif msg_type == "error":
+                    await progress.flush()
                     return f"Error: {msg.get('message', 'Unknown error')}"
         except asyncio.CancelledError:
             logger.info(f"{self.agent_name} followup cancelled for {event_id}")
+            await self._send_cancel(event_id, task_id)
             raise
-        except websockets.exceptions.ConnectionClosed:
-            self._connected = False
-            return "Error: WebSocket connection closed during followup"
         finally:
-            if self._ws and self._connected:
+            await progress.close()
+            self._pending.pop(event_id, None)
+            self._run_ids.pop(event_id, None)
+
+    async def _send_cancel(self, event_id: str, task_id: str) -> None:
+        """Ask the sidecar to SIGTERM the run's CLI. Falls back to closing the WS
+        (sidecar kills orphaned processes on disconnect) if the send fails."""
+        try:
+            await self._send(orjson.dumps({"type": "cancel", "event_id": event_id, "task_id": task_id}))
+        except Exception:
+            if self._ws:
                 try:
                     await self._ws.close()
                 except Exception:
                     pass
-                self._connected = False
+            self._connected = False
 
-        return "Error: No followup result received"
+    async def abort_current_task(self) -> None:
+        """Hard stop: close the WS so the sidecar SIGTERMs every CLI it was running.
+
+        Normal completion never closes the socket (ai-rule 2). This is for callers
+        that want the disconnect-kill semantics without cancelling their asyncio
+        task -- in-flight process()/followup() calls return a connection-closed
+        error and the next call reconnects.
+        """
+        ws = self._ws
+        self._connected = False
+        for q in self._pending.values():
+            q.put_nowait(self._CLOSED)
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+
+    def _get_http(self):
+        """Lazy shared httpx client -- one keep-alive connection per sidecar."""
+        if self._http is None:
+            import httpx
+            # Probes are one GET at a time against a single host; a bigger pool only holds idle sockets
+            self._http = httpx.AsyncClient(
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=1, max_connections=4),
+            )
+        return self._http
 
     async def health(self) -> bool:
         """Check sidecar health via HTTP (K8s probes use HTTP)."""
-        import httpx
         try:
             url = f"{self.sidecar_url}/health"
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(url)
-                return response.status_code == 200
+            response = await self._get_http().get(url)
+            return response.status_code == 200
         except Exception:
             return False
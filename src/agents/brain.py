@@ -9,12 +9,16 @@
 # 5. [Gotcha]: _waiting_for_user (dict[str,float]: event_id -> wait_start_timestamp) is cleared by main.py WS handler AND queue.py REST endpoints (clear_waiting), not by Brain internally.
 # 6. [Pattern]: Bidirectional agent status: routing_turn_num tracks brain.route -> DELIVERED on first progress -> EVALUATED on completion.
 # 7. [Pattern]: Temporal memory: _journal_cache (60s TTL) + _get_journal_cached(). Invalidated in _close_and_broadcast().
+#    lookup_service reads go through _service_cache (0.5s) / _service_names_cache (2s) -- sub-turn dedup only.
+#    _service_cache evicts expired entries on insert and is capped at SERVICE_CACHE_MAX (LLM-supplied keys).
 # 7b. [Gotcha]: _close_and_broadcast archival re-fetches the event via get_event() AFTER close_event()
 #     -- the pre-close `event` local is stale (missing the final closing turns) by the time Archivist runs.
 # 7c. [Pattern]: _create_reflex_pair(event_id, event_domain, event_service) threads event.service into
 #     ReflexSearcher for service-scoped knowledge-fact search (lessons stay unscoped).
 # 8. [Pattern]: _event_to_markdown is a backward-compat wrapper for src/utils/event_markdown.event_to_markdown.
 # 9. [Pattern]: Use _append_and_broadcast() for all turn persistence. Direct append_turn only for probe-mode (line ~517).
+#    Exception: defer/approval append inside their status transaction, then fan out via _fanout_turn().
+#    Exception: the final LLM thoughts+response pair goes through _append_turns_and_broadcast() (one transaction).
 # 10. [Constraint]: defer_event is blocked when _waiting_for_user -- prevents defer→re-activate→close leak. Automated nudge escalation also sets _waiting_for_user.
 # 11. [Constraint]: Resync scan has_unread + deferred re-activation paths skip enqueueing when _waiting_for_user.
 # 12. [Pattern]: LLM adapter layer (.llm subpackage) -- Brain uses generate_stream(), tool schemas in llm/types.py.
@@ -27,8 +31,12 @@
 #     thin facade that wires QueueTrigger (BRPOP), ResyncTrigger (5s scan), StalenessGuard (jarvis 120s, chat 5400s).
 #     N workers process events concurrently. FairQueue provides per-key dedup (no spin monopoly).
 #     Brain._scan_active_for_reconcile() is the decision callback: returns list[str] of event_ids to enqueue.
-# 14. [Pattern]: cancel_active_task() is the single kill path. Cancels asyncio.Task -> CancelledError in base_client -> WS close -> SIGTERM.
+#     It reads the whole active set with one get_events MGET per tick; inline side effects that need fresh
+#     state (defer wake, re-check) still re-read the single event.
+# 14. [Pattern]: cancel_active_task() is the single kill path. Cancels asyncio.Task -> CancelledError in base_client -> {type: cancel} frame -> SIGTERM (WS stays open).
 # 15. [Pattern]: _active_tasks + _active_agent_for_event track which agent is running per event. Populated in _run_agent_task, cleaned immediately after turn delivery (via _release_task_state) to prevent TOCTOU race with is_intermediate gate evaluation. Ordering invariant: _release_task_state MUST run before any await after turn delivery. Also cleaned in finally + cancel + close.
+#     run_agent_task adds a _drop_finished_task done-callback for tasks cancelled before their first step (no finally runs).
+#     _active_tasks holds the ONLY strong ref to dispatch tasks (the loop keeps weak refs) -- never make it a WeakValueDictionary.
 # 15b. [Pattern]: _waiting_for_agent (dict[str, tuple[str, int]]) blocks process_event re-entry after
 #     wait_for_agent. Value: (agent_name, wait_turn_number). Guard 7 PRIMARY path: task-liveness check
 #     (task None or done → stale race, clear and enqueue). FALLBACK path: participant-input check
@@ -37,7 +45,7 @@
 #     Also cleared in _release_task_state + _close_and_broadcast.
 # 16. [Pattern]: _agent_sessions + _agent_session_modes: session resume is mode-aware. Same mode = resume (e.g., investigate->investigate). Cross-mode (investigate->execute) = fresh session to avoid Claude thinking-block corruption.
 # 17. [Pattern]: _broadcast() fans out to _broadcast_targets list. register_channel() adds targets (e.g., Slack).
-# 27. [Pattern]: event_status_changed broadcast fires after successful status transitions (new->active, active->deferred, deferred->active). Broadcasts at call sites, NOT inside transition_event_status() (Hexagonal boundary). Defer path is defense-in-depth (turn broadcast already fires via _append_and_broadcast).
+# 27. [Pattern]: event_status_changed broadcast fires after successful status transitions (new->active, active->deferred, deferred->active). Broadcasts at call sites, NOT inside transition_event_status() (Hexagonal boundary). Defer path is defense-in-depth (turn broadcast already fires via _fanout_turn).
 # 30. [Gotcha]: consult_deep_memory cached guard uses string matching ("No historical patterns", "No results") coupled to Archivist response text. If Archivist wording changes, the guard silently breaks.
 # 31. [Pattern]: _reasoning_by_event (dict[str, str | None]) keyed by event_id. Set in _process_with_llm
 #     before _execute_function_call, consumed via .pop() in _emit_executive_pulse, cleared on error/text-only
@@ -68,6 +76,7 @@
 #     BrainSkillLoader.get_tag_type(): frontmatter override > folder default > "skill".
 #     build_skill_refs is an instance method on BrainSkillLoader (dynamic from frontmatter tools:).
 #     Replay-time injection in _build_contents() replaces per-handler storage-time injection.
+#     On a tool_result turn the refs are a separate part after "[SYSTEM <tool>]: ..." (FC/FR pairing needs it first).
 # 22b. [Constraint]: section id values must be ASCII path chars (a-z, 0-9, -, _, /). No quotes,
 #     angle brackets, or ampersands in skill filenames -- would break the XML id attribute.
 # 29. [Pattern]: _format_recall_block reads _recall_lessons dict (populated by reflex gate).
@@ -180,6 +189,14 @@
 #     use .get(agent_name, default) -- never bracket access -- so an out-of-vocabulary role fails safe.
 #     `effort` (FRIDAY's optional select_agent param) passes through for BOTH local + ephemeral dispatch
 #     and never invalidates --resume (unlike mode, which does on change).
+# 47. [Constraint]: _build_contents rebuilds from event.conversation every call -- no in-process prefix cache.
+#     Redis is the source of truth (turns are mutated in place by update_turn_evidence / mark_turn_status, and
+#     any replica may serve the next call); formatting is ~0.1ms per 60 turns. Gemini implicit prefix caching
+#     can't hit past the system prompt anyway: the live _build_event_state_header (turn count, wall clock)
+#     leads it by design, and the event header carries "Event Created: Xm Ys ago".
+# 48. [Pattern]: The prune marker from _compress_contents carries a _condense_pruned tally (counts by actor +
+#     last agent outcome snippet). Pure function of the pruned slice -- no LLM call, nothing stored on the event --
+#     so the marker stays byte-identical between _PRUNE_STEP snaps. Below budget every turn is sent verbatim.
 """
 The Brain Orchestrator - Thin Python Shell, LLM Does the Thinking.
 
@@ -198,6 +215,8 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import functools
+import hashlib
 import json
 import logging
 import os
@@ -209,7 +228,10 @@ from typing import TYPE_CHECKING, Any, Callable, Optional, TypedDict
 
 import httpx
 
-from ..models import ConversationTurn, EventDocument, EventStatus, EventType, MessageStatus, _resolve_domain, _resolve_phase
+from ..models import (
+    OPEN_EVENT_STATUSES, UNEVALUATED_MESSAGE_STATUSES, ConversationTurn, EventDocument, EventStatus,
+    EventType, MessageStatus, _resolve_domain, _resolve_phase,
+)
 from ..ports import BroadcastPort
 from ..utils.event_markdown import event_to_markdown
 from .dispatch import dispatch_to_agent, send_cancel, RETRYABLE_SENTINEL
@@ -281,6 +303,16 @@ def _init_tool_names() -> frozenset[str]:
     return frozenset(t["name"] for t in BRAIN_TOOL_SCHEMAS)
 
 
+# _extract_recommendation heuristics, in priority order (header section, then bold label)
+_RECOMMENDATION_RES = (
+    re.compile(
+        r"(?:^|\n)##?\s*(?:Recommendation|Next Step|Suggested Action)s?\s*\n(.*?)(?=\n##?\s|\Z)",
+        re.DOTALL | re.IGNORECASE,
+    ),
+    re.compile(r"\*\*(?:Recommendation|Next Step)\*\*:?\s*(.*?)(?=\n\n|\Z)", re.DOTALL | re.IGNORECASE),
+)
+
+
 def _strip_tool_names(text: str) -> str:
     """Defense-in-depth: strip any surviving tool identifiers from RECALL content."""
     global _BRAIN_TOOL_NAMES
@@ -445,6 +477,12 @@ class _BrainToolContext:
         self._b._routing_depth[eid] = depth
         return depth
 
+    def record_dispatch(self, eid: str, signature: str) -> int:
+        last_sig, count, result_sig = self._b._dispatch_repeat.get(eid, ("", 0, ""))
+        count = count + 1 if signature == last_sig else 1
+        self._b._dispatch_repeat[eid] = (signature, count, result_sig)
+        return count
+
     def is_dispatch_locked(self) -> bool:
         return bool(self._b._dispatch_semaphore and self._b._dispatch_semaphore.locked())
 
@@ -509,6 +547,12 @@ class _BrainToolContext:
     async def get_cached_journal(self, svc: str) -> list[str]:
         return await self._b._get_journal_cached(svc)
 
+    async def get_cached_service(self, name: str):
+        return await self._b._get_service_cached(name)
+
+    async def get_cached_service_names(self) -> list[str]:
+        return await self._b._get_service_names_cached()
+
     # --- Timers ---
     def get_idle_timeout(self):
         return self._b._idle_timeout
@@ -526,6 +570,9 @@ class _BrainToolContext:
     async def append_and_broadcast(self, event_id, turn, event=None) -> int:
         return await self._b._append_and_broadcast(event_id, turn, event)
 
+    async def fanout_turn(self, event_id, turn, event=None) -> None:
+        await self._b._fanout_turn(event_id, turn, event)
+
     async def broadcast(self, message: dict) -> None:
         await self._b._broadcast(message)
 
@@ -546,6 +593,7 @@ class _BrainToolContext:
         t = asyncio.create_task(task_coro)
         if not parallel:
             self._b._active_tasks[event_id] = t
+            t.add_done_callback(functools.partial(self._b._drop_finished_task, event_id))
 
     async def dispatch_handler(self, name, event_id, args, response_parts) -> bool:
         return await self._b._execute_function_call(event_id, name, args, response_parts)
@@ -580,8 +628,13 @@ class _BrainToolContext:
 _ACLOSE_TIMEOUT = 5.0
 
 # Conversation compression safety net: when estimated prompt tokens exceed this budget,
-# _compress_contents prunes oldest turns from the front, keeping the last ~200K tokens.
+# _compress_contents prunes oldest turns from the front, keeping the last ~_CONTENT_TAIL_BUDGET tokens.
+# The cut point snaps back to a multiple of _PRUNE_STEP messages so consecutive calls send an
+# identical prefix (header + marker + kept turns) instead of sliding the window one turn per call.
 _CONTENT_BUDGET = int(os.getenv("BRAIN_CONTENT_BUDGET_TOKENS", "800000"))
+_CONTENT_TAIL_BUDGET = int(os.getenv("BRAIN_CONTENT_TAIL_TOKENS", "200000"))
+_PRUNE_STEP = 16
+_CONDENSED_SNIPPET_CHARS = 300
 
 # Ephemeral-only model/effort routing (scoped to Tekton-spawned pods -- local
 # sidecars keep their Deployment-configured model, never read these maps).
@@ -632,6 +685,7 @@ class Brain:
         self._agent_sessions: dict[str, dict[str, str]] = {}  # event_id -> {agent_name -> session_id}
         self._agent_session_modes: dict[str, dict[str, str]] = {}  # event_id -> {agent_name -> mode}
         self._routing_depth: dict[str, int] = {}  # event_id -> recursion counter
+        self._dispatch_repeat: dict[str, tuple[str, int, str]] = {}  # event_id -> (last dispatch sig, consecutive count, last result sig)
         # Per-agent locks -- prevents concurrent dispatch to the same agent
         from collections import defaultdict
         self._agent_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
@@ -674,6 +728,10 @@ class Brain:
         self._incident_adapter = None
         # Journal cache: avoid LRANGE per prompt build (60s TTL, invalidated on close)
         self._journal_cache: dict[str, tuple[float, list[str]]] = {}
+        # Tool-call cache: repeated lookup_service calls within one multi-call turn
+        # hit Redis once. Service docs carry live health/replicas -> shorter TTL.
+        self._service_cache: dict[str, tuple[float, Any]] = {}
+        self._service_names_cache: tuple[float, list[str]] | None = None
         # LLM config from environment
         self.project = os.getenv("GCP_PROJECT", "")
         self.location = os.getenv("GCP_LOCATION", "global")
@@ -685,6 +743,7 @@ class Brain:
         # only configurable ceiling on agent result turn size (Goal 1, truncation-search-destroy).
         self._agent_result_max = int(os.getenv("AGENT_RESULT_MAX_CHARS", "100000"))
         self._adapter = None  # Lazy-loaded via _get_adapter()
+        self._adapter_lock = asyncio.Lock()
         self._scheduler = None  # ReconcileScheduler | None -- set by start_event_loop()
         self._state_watcher = None  # StateWatcher | None -- set by start_event_loop()
         self._flow_collector = None  # FlowCollector | None -- set by start_event_loop()
@@ -722,6 +781,9 @@ class Brain:
         self._tool_ctx = _BrainToolContext(self)
 
     JOURNAL_CACHE_TTL = 60  # seconds
+    SERVICE_CACHE_TTL = 0.5  # seconds -- health/replicas are freshness-sensitive
+    SERVICE_CACHE_MAX = 256  # keys are LLM-supplied names (misses included) -- bound the dict
+    SERVICE_NAMES_CACHE_TTL = 2.0  # seconds -- topology membership changes slowly
 
     @property
     def skill_loader(self) -> BrainSkillLoader | None:
@@ -738,6 +800,34 @@ class Brain:
         self._journal_cache[service] = (now, entries)
         return entries
 
+    async def _get_service_cached(self, name: str):
+        """Get a service doc with a short TTL cache (misses are cached too)."""
+        now = time.monotonic()
+        cached = self._service_cache.get(name)
+        if cached and (now - cached[0]) < self.SERVICE_CACHE_TTL:
+            return cached[1]
+        svc = await self.blackboard.get_service(name)
+        cache = self._service_cache
+        cache.pop(name, None)  # re-insert at the end: dict order stays oldest-first
+        # Evict expired entries from the front, then the oldest if still at the cap
+        while cache:
+            oldest = next(iter(cache))
+            if now - cache[oldest][0] < self.SERVICE_CACHE_TTL and len(cache) < self.SERVICE_CACHE_MAX:
+                break
+            del cache[oldest]
+        cache[name] = (now, svc)
+        return svc
+
+    async def _get_service_names_cached(self) -> list[str]:
+        """Get known service names with a short TTL cache."""
+        now = time.monotonic()
+        cached = self._service_names_cache
+        if cached and (now - cached[0]) < self.SERVICE_NAMES_CACHE_TTL:
+            return cached[1]
+        names = await self.blackboard.get_services()
+        self._service_names_cache = (now, names)
+        return names
+
     # Sources that bypass the global WIP cap entirely (admitted immediately).
     # User-initiated + meta-cognitive events don't queue behind automated work.
     # The 1.3x headroom in cap sizing accounts for bypass-event overhead.
@@ -759,25 +849,24 @@ class Brain:
         )
 
     async def _get_adapter(self):
-        """Lazy-load LLM adapter (Gemini or Claude based on LLM_PROVIDER)."""
-        if self._adapter is None:
-            try:
-                from .llm import create_adapter
+        """Lazy-load LLM adapter (Gemini or Claude based on LLM_PROVIDER).
 
-                self._adapter = create_adapter(
-                    provider=self.provider,
-                    project=self.project,
-                    location=self.location,
-                    model_name=self.model_name,
-                )
-                self._llm_available = True
-                logger.info(f"Brain LLM adapter initialized: {self.provider}/{self.model_name}")
+        _adapter_lock keeps a first event racing prewarm_adapter() from
+        building a second client. None keeps Brain in probe mode.
+        """
+        from .llm import get_or_create_adapter
 
-            except Exception as e:
-                logger.warning(f"LLM adapter not available: {e}. Brain stays in probe mode.")
-                self._adapter = None
+        adapter = await get_or_create_adapter(
+            self, self._adapter_lock, self.provider, self.project, self.location, self.model_name,
+            label="Brain",
+        )
+        if adapter is not None:
+            self._llm_available = True
+        return adapter
 
-        return self._adapter
+    async def prewarm_adapter(self) -> None:
+        """Build the LLM adapter at startup so the first event skips SDK cold start."""
+        await self._get_adapter()
 
     # =========================================================================
     # Event Processing
@@ -896,7 +985,7 @@ class Brain:
 
         # CLOSED guard: skip events that were closed concurrently
         if event.status == EventStatus.CLOSED:
-            logger.debug(f"Skipping closed event {event_id}")
+            logger.debug("Skipping closed event %s", event_id)
             return
 
         # Mirror active meta-event ID on first process of a jarvis event
@@ -908,14 +997,14 @@ class Brain:
         if event_id in self._waiting_for_agent:
             _, wait_turn = self._waiting_for_agent[event_id]
             has_response = any(
-                t.status.value == "delivered" and t.actor != "brain"
+                t.status is MessageStatus.DELIVERED and t.actor != "brain"
                 for t in event.conversation[wait_turn:]
             )
             if has_response:
                 self._waiting_for_agent.pop(event_id, None)
-                logger.info(f"Cleared _waiting_for_agent for {event_id}: participant responded (post-wait scoped)")
+                logger.info("Cleared _waiting_for_agent for %s: participant responded (post-wait scoped)", event_id)
             else:
-                logger.debug(f"Skipping process_event for {event_id}: waiting for participant")
+                logger.debug("Skipping process_event for %s: waiting for participant", event_id)
                 return
 
         # JARVIS intermediate wake filter: prevent JARVIS turns from waking FRIDAY
@@ -950,13 +1039,11 @@ class Brain:
             new_mr = new_ctx.get("mr_iid")
             new_project = new_ctx.get("project_id")
             new_mr_url = self._extract_mr_url(event)
-            for eid in active_ids:
-                if eid == event_id:
-                    continue
-                existing = await self.blackboard.get_event(eid)
+            other_ids = [eid for eid in active_ids if eid != event_id]
+            for eid, existing in zip(other_ids, await self.blackboard.get_events(other_ids)):
                 if not (existing
                         and existing.conversation
-                        and existing.status.value in ("active", "new", "deferred")):
+                        and existing.status in OPEN_EVENT_STATUSES):
                     continue
 
                 # Pass 1: service-name match (existing behavior)
@@ -1035,7 +1122,7 @@ class Brain:
             if event.source in self._BYPASS_SOURCES:
                 # User/JARVIS: rush into WIP immediately, no cap check
                 if await self.blackboard.transition_event_status(event_id, "new", EventStatus.ACTIVE):
-                    logger.info(f"Event {event_id} (bypass:{event.source}) transitioned NEW -> ACTIVE")
+                    logger.info("Event %s (bypass:%s) transitioned NEW -> ACTIVE", event_id, event.source)
                     await self._broadcast({
                         "type": "event_status_changed",
                         "event_id": event_id,
@@ -1052,7 +1139,7 @@ class Brain:
                     )
                     return
                 if await self.blackboard.transition_event_status(event_id, "new", EventStatus.ACTIVE):
-                    logger.info(f"Event {event_id} transitioned NEW -> ACTIVE")
+                    logger.info("Event %s transitioned NEW -> ACTIVE", event_id)
                     await self._broadcast({
                         "type": "event_status_changed",
                         "event_id": event_id,
@@ -1074,7 +1161,7 @@ class Brain:
                 if inactivity > NUDGE_INTERVAL_SECONDS:
                     has_pending_nudge = any(
                         t.actor == "user" and t.source == "automated"
-                        and t.status.value in ("sent", "delivered")
+                        and t.status in UNEVALUATED_MESSAGE_STATUSES
                         for t in event.conversation
                     )
                     if has_pending_nudge:
@@ -1101,7 +1188,7 @@ class Brain:
                             thoughts=f"Automated health check: this event has been idle for {idle_min} minutes with no progress. Evaluate the current state and take action: route an agent to check status, defer with a reason, or close if resolved.",
                         )
                         await self._append_and_broadcast(event_id, nudge_turn)
-                        logger.info(f"Nudge injected for {event_id} ({consecutive_nudges + 1}/{MAX_NUDGES_BEFORE_ESCALATION})")
+                        logger.info("Nudge injected for %s (%s/%s)", event_id, consecutive_nudges + 1, MAX_NUDGES_BEFORE_ESCALATION)
                         return
 
         # Snapshot turn count BEFORE LLM call -- any turns appended during processing
@@ -1147,7 +1234,7 @@ class Brain:
                 )
                 await self.blackboard.append_turn(event_id, turn)
                 await self.blackboard.mark_turns_evaluated(event_id, up_to_turn=turn_snapshot + 1)
-                logger.info(f"Brain processed event {event_id} (probe mode)")
+                logger.info("Brain processed event %s (probe mode)", event_id)
                 return
 
             # Determine defer-wake state ONCE before the iterative loop.
@@ -1200,7 +1287,7 @@ class Brain:
                 if not is_intermediate:
                     new_user_turns = [
                         t for t in event.conversation[turn_snapshot:]
-                        if t.actor == "user" and t.status.value in ("sent", "delivered")
+                        if t.actor == "user" and t.status in UNEVALUATED_MESSAGE_STATUSES
                         and t.turn not in acknowledged_interrupts
                     ]
                     if new_user_turns:
@@ -1208,7 +1295,7 @@ class Brain:
                         acknowledged_interrupts.update(t.turn for t in new_user_turns)
                         response_emitted = False
                         self._response_emitted_for.discard(event_id)
-                        logger.info(f"User interrupt detected for {event_id} at iteration {iteration}, turn {user_interrupt_turn}")
+                        logger.info("User interrupt detected for %s at iteration %s, turn %s", event_id, iteration, user_interrupt_turn)
 
                 should_continue = await self._process_with_llm(
                     event_id, event, is_defer_wake=is_defer_wake,
@@ -1221,7 +1308,7 @@ class Brain:
                     response_emitted = True
                 if not should_continue:
                     break
-                logger.debug(f"LLM loop iteration {iteration + 1} for {event_id} (tool requested continuation)")
+                logger.debug("LLM loop iteration %s for %s (tool requested continuation)", iteration + 1, event_id)
             else:
                 logger.warning(f"Event {event_id} hit max LLM iterations ({max_llm_iterations})")
 
@@ -1327,7 +1414,7 @@ class Brain:
                         loaded_from_redis = await self._skill_loader.reload_from_redis()
                         if loaded_from_redis:
                             self._skills_version = inner_version
-                            logger.info(f"Brain skills reloaded from Redis (version={inner_version[:8]})")
+                            logger.info("Brain skills reloaded from Redis (version=%s)", inner_version[:8])
                         else:
                             logger.info("Skill reload fell back to filesystem -- version not updated")
 
@@ -1584,7 +1671,7 @@ class Brain:
 
         # Closed guard: event may have been force-closed during the LLM call
         if await self._is_event_closed(event_id):
-            logger.info(f"Event {event_id} closed during LLM call -- discarding result")
+            logger.info("Event %s closed during LLM call -- discarding result", event_id)
             return False
 
         grounding_evidence = ""
@@ -1597,7 +1684,7 @@ class Brain:
             )
             queries = ", ".join(last_grounding.get("queries", []))
             grounding_evidence = f"\n\n## Web Search Context\n\nQueries: {queries}\n\nSources:\n{sources}"
-            logger.info(f"Google Search grounding for {event_id}: {len(resolved_chunks)} sources (resolved)")
+            logger.info("Google Search grounding for %s: %s sources (resolved)", event_id, len(resolved_chunks))
 
         # Process the final result
         if function_call:
@@ -1652,7 +1739,7 @@ class Brain:
                 )
                 await self._append_and_broadcast(event_id, turn)
                 return True
-            logger.info(f"Brain LLM decision for {event_id}: {function_call.name}")
+            logger.info("Brain LLM decision for %s: %s", event_id, function_call.name)
 
             # Runtime gate enforcement: reject FCs for tools stripped by gates
             valid_tool_names = {t["name"] for t in active_tools}
@@ -1714,25 +1801,28 @@ class Brain:
                 grounding_evidence=grounding_evidence or None,
             )
 
+        final_turns: list[ConversationTurn] = []
         if accumulated_thoughts:
-            thoughts_turn = ConversationTurn(
-                turn=(await self._next_turn_number(event_id)),
+            final_turns.append(ConversationTurn(
+                turn=0,
                 actor="brain",
                 action="thoughts",
                 thoughts=accumulated_thoughts,
-            )
-            await self._append_and_broadcast(event_id, thoughts_turn)
-
-        if accumulated_text:  # Text-only response is always terminal -- no tool, loop ends
-            response_turn = ConversationTurn(
-                turn=(await self._next_turn_number(event_id)),
+            ))
+        if accumulated_text:
+            final_turns.append(ConversationTurn(
+                turn=0,
                 actor="brain",
                 action="response",
                 thoughts=accumulated_text,
                 evidence=grounding_evidence if grounding_evidence else None,
                 response_parts=captured_parts,
-            )
-            await self._append_and_broadcast(event_id, response_turn)
+            ))
+        if final_turns:
+            # thoughts + response land in one transaction
+            await self._append_turns_and_broadcast(event_id, final_turns)
+
+        if accumulated_text:  # Text-only response is always terminal -- no tool, loop ends
             await self._emit_executive_pulse(event_id, [("tool:brain_response", "tool")])
             self._last_processed[event_id] = time.time()
             if event.source in ("slack", "chat"):
@@ -1910,7 +2000,7 @@ class Brain:
                 fc = part.function_call
                 args = {}
                 if fc.args:
-                    args = {str(k): str(v) if isinstance(v, bytes) else v for k, v in dict(fc.args).items()}
+                    args = {str(k): str(v) if isinstance(v, bytes) else v for k, v in fc.args.items()}
                 p['functionCall'] = {"name": str(fc.name), "args": args}
             sig = getattr(part, 'thought_signature', None) or getattr(part, 'thoughtSignature', None)
             if sig:
@@ -1957,21 +2047,18 @@ class Brain:
             flags["_cached_mermaid"] = ""
             flags["has_graph_edges"] = False
         else:
-            active_ids = await self.blackboard.get_active_events()
+            # Independent reads -- same concurrent shape as _build_contents' header fetch.
+            active_ids, recent_closed = await asyncio.gather(
+                self.blackboard.get_active_events(),
+                self.blackboard.get_recent_closed_for_service(event.service, minutes=15),
+            )
             flags["_cached_active_ids"] = active_ids
-            has_related = False
-            for eid in active_ids:
-                if eid == event.id:
-                    continue
-                other = await self.blackboard.get_event(eid)
-                if other and other.service == event.service:
-                    has_related = True
-                    break
-            flags["has_related"] = has_related
-
-            recent_closed = await self.blackboard.get_recent_closed_for_service(
-                event.service, minutes=15
+            other_ids = [eid for eid in active_ids if eid != event.id]
+            flags["has_related"] = any(
+                other and other.service == event.service
+                for other in await self.blackboard.get_events(other_ids)
             )
+
             flags["_cached_recent_closed"] = recent_closed
             flags["has_recent_closed"] = bool(recent_closed)
 
@@ -1986,7 +2073,7 @@ class Brain:
             and any(t.actor == "user" and t.source == "slack" for t in event.conversation)
         )
         flags["has_pending_huddle"] = any(
-            t.action == "huddle" and t.status.value in ("sent", "delivered")
+            t.action == "huddle" and t.status in UNEVALUATED_MESSAGE_STATUSES
             for t in event.conversation
         )
 
@@ -2451,12 +2538,8 @@ class Brain:
         at write time by `self._agent_result_max` (Goal 1, truncation-search-destroy).
         Slicing an already-bounded field again downstream is redundant truncation.
         """
-        patterns = [
-            r"(?:^|\n)##?\s*(?:Recommendation|Next Step|Suggested Action)s?\s*\n(.*?)(?=\n##?\s|\Z)",
-            r"\*\*(?:Recommendation|Next Step)\*\*:?\s*(.*?)(?=\n\n|\Z)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        for pattern in _RECOMMENDATION_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -2487,23 +2570,33 @@ class Brain:
         subject_type = event.subject_type
 
         # Gate get_service: only for K8s deployment subjects
-        svc = None
-        if (subject_type == "service"
-                and event.service not in ("general", "system")
-                and not (isinstance(evidence, EventEvidence) and evidence.gitlab_context)):
-            svc = await self.blackboard.get_service(event.service)
+        needs_svc = (subject_type == "service"
+                     and event.service not in ("general", "system")
+                     and not (isinstance(evidence, EventEvidence) and evidence.gitlab_context))
+
+        async def _none():
+            return None
+
+        # Independent reads -- issue concurrently so header latency is max(), not sum().
+        cached = context_cache or {}
+        svc, active_event_ids, recent_closed, journal = await asyncio.gather(
+            self.blackboard.get_service(event.service) if needs_svc else _none(),
+            _none() if "_cached_active_ids" in cached else self.blackboard.get_active_events(),
+            _none() if "_cached_recent_closed" in cached
+            else self.blackboard.get_recent_closed_for_service(event.service, minutes=15),
+            self._get_journal_cached(event.service),
+        )
+        if "_cached_active_ids" in cached:
+            active_event_ids = cached["_cached_active_ids"]
+        if "_cached_recent_closed" in cached:
+            recent_closed = cached["_cached_recent_closed"]
 
         mermaid = ""
 
-        if context_cache and "_cached_active_ids" in context_cache:
-            active_event_ids = context_cache["_cached_active_ids"]
-        else:
-            active_event_ids = await self.blackboard.get_active_events()
+        other_ids = [eid for eid in active_event_ids if eid != event.id]
+        others = await self.blackboard.get_events(other_ids)
         related = []
-        for eid in active_event_ids:
-            if eid == event.id:
-                continue
-            other = await self.blackboard.get_event(eid)
+        for eid, other in zip(other_ids, others):
             if not other:
                 continue
             if other.service == event.service:
@@ -2518,15 +2611,6 @@ class Brain:
                         related.append(f"  - {eid} (chat): {other.event.reason}")
                         break
 
-        if context_cache and "_cached_recent_closed" in context_cache:
-            recent_closed = context_cache["_cached_recent_closed"]
-        else:
-            recent_closed = await self.blackboard.get_recent_closed_for_service(
-                event.service, minutes=15
-            )
-
-        journal = await self._get_journal_cached(event.service)
-
         # -- Build source-aware header via pure function --
         header = build_event_header(
             event,
@@ -2570,7 +2654,11 @@ class Brain:
                 refs = self._skill_loader.build_skill_refs(
                     turn.waitingFor, event.brain_phase, event.source,
                 )
-                if refs and parts[0].get("text"):
+                if refs and turn.action == "tool_result":
+                    # Own part after the result: "[SYSTEM <tool>]: " must stay the leading
+                    # text so _convert_structured still pairs it as a function_response
+                    parts.insert(1, {"text": refs})
+                elif refs and parts[0].get("text"):
                     parts[0]["text"] = f"{refs}\n{parts[0]['text']}"
 
             if contents and contents[-1]["role"] == role:
@@ -2677,44 +2765,77 @@ class Brain:
 
         First message (event context header) always kept intact.
         No truncation of individual turns — full fidelity until prune threshold.
-        When over budget: keep header + last ~200K tokens of conversation from the end.
+        When over budget: keep header + last ~_CONTENT_TAIL_BUDGET tokens of conversation,
+        with the cut snapped to a _PRUNE_STEP boundary while that still fits max_tokens.
         """
         if len(contents) <= 3:
             return contents
 
-        if cls._estimate_tokens(contents) < max_tokens:
+        msg_tokens = [
+            sum(len(str(p.get("text", ""))) // 4 for p in msg.get("parts", []))
+            for msg in contents
+        ]
+        if sum(msg_tokens) < max_tokens:
             return contents
 
         context_msg = contents[0]
         conv_msgs = contents[1:]
+        conv_tokens = msg_tokens[1:]
 
-        tail_budget = 200_000
-        kept: list[dict] = []
+        # Walk back from the end until the tail budget is spent (always keep >= 1)
+        start = len(conv_msgs)
         running_tokens = 0
-
-        for msg in reversed(conv_msgs):
-            msg_tokens = sum(
-                len(str(p.get("text", ""))) // 4
-                for p in msg.get("parts", [])
-            )
-            if running_tokens + msg_tokens > tail_budget and kept:
+        while start > 0:
+            if running_tokens + conv_tokens[start - 1] > _CONTENT_TAIL_BUDGET and start < len(conv_msgs):
                 break
-            kept.append(msg)
-            running_tokens += msg_tokens
+            start -= 1
+            running_tokens += conv_tokens[start]
 
-        kept.reverse()
+        snapped = start - start % _PRUNE_STEP
+        if snapped < start and msg_tokens[0] + running_tokens + sum(conv_tokens[snapped:start]) < max_tokens:
+            start = snapped
 
-        if kept and kept[0] != conv_msgs[0]:
-            pruned_count = len(conv_msgs) - len(kept)
-            first_kept_idx = len(conv_msgs) - len(kept) + 1
+        kept = conv_msgs[start:]
+        if start > 0:
             marker = {"role": "user", "parts": [{"text": (
-                f"[{pruned_count} earlier turns (1-{first_kept_idx - 1}) pruned for context window. "
+                f"[{start} earlier turns (1-{start}) pruned for context window. "
+                f"{cls._condense_pruned(conv_msgs[:start])} "
                 f"Use recall_pruned_turns(from_turn, to_turn) to retrieve if needed.]"
             )}]}
             return [context_msg, marker] + kept
 
         return [context_msg] + kept
 
+    @staticmethod
+    def _condense_pruned(msgs: list[dict]) -> str:
+        """One-line tally of pruned messages so the model keeps the gist of what it dropped.
+
+        Derived only from the pruned slice, so the marker is byte-identical while the cut holds.
+        """
+        agents = systems = users = brain = 0
+        last_outcome = ""
+        for msg in msgs:
+            if msg.get("role") == "model":
+                brain += 1
+                continue
+            for part in msg.get("parts", []):
+                text = str(part.get("text", ""))
+                if text.startswith("[AGENT "):
+                    agents += 1
+                    last_outcome = text
+                elif text.startswith("[SYSTEM "):
+                    systems += 1
+                elif text.startswith("[USER"):
+                    users += 1
+        summary = (
+            f"Condensed: {brain} brain turns, {agents} agent replies, "
+            f"{systems} system/tool results, {users} user messages."
+        )
+        if last_outcome:
+            snippet = " ".join(last_outcome.split())[:_CONDENSED_SNIPPET_CHARS]
+            summary += f" Last agent outcome: {snippet}"
+        return summary
+
     # =========================================================================
     # Function Call Dispatcher
     # =========================================================================
@@ -2818,7 +2939,7 @@ class Brain:
             try:
                 return await handler(self._tool_ctx, event_id, args, response_parts)
             except Exception as e:
-                logger.error(f"Handler {function_name} failed for {event_id}: {e}", exc_info=True)
+                logger.error("Handler %s failed for %s: %s", function_name, event_id, e, exc_info=True)
                 error_turn = ConversationTurn(
                     turn=(await self._next_turn_number(event_id)),
                     actor="brain",
@@ -2830,7 +2951,7 @@ class Brain:
                 await self._append_and_broadcast(event_id, error_turn)
                 return False
         else:
-            logger.warning(f"[UNKNOWN] function call: {function_name} for {event_id}")
+            logger.warning("[UNKNOWN] function call: %s for %s", function_name, event_id)
             unknown_turn = ConversationTurn(
                 turn=(await self._next_turn_number(event_id)),
                 actor="brain",
@@ -2858,7 +2979,7 @@ class Brain:
             return False
         async with lock:
             event = await self.blackboard.get_event(event_id)
-            if not event or event.status.value == "closed":
+            if not event or event.status is EventStatus.CLOSED:
                 logger.warning(f"execute_tool_locked: event {event_id} is closed, skipping {function_name}")
                 return False
             return await self._execute_function_call(event_id, function_name, args, response_parts)
@@ -3014,6 +3135,16 @@ class Brain:
     # Agent Task Runner (non-blocking via create_task)
     # =========================================================================
 
+    def _drop_finished_task(self, event_id: str, task: asyncio.Task) -> None:
+        """Done-callback: forget a task that ended without reaching its own finally.
+
+        A task cancelled before its first step never runs _run_agent_task's
+        finally, so its _active_tasks entry would otherwise sit until close.
+        Identity-checked like the finally -- a newer task for the event is kept.
+        """
+        if self._active_tasks.get(event_id) is task:
+            del self._active_tasks[event_id]
+
     def _release_task_state(self, event_id: str) -> None:
         """Clear active task tracking for an event. Used before re-entry and in finally."""
         self._active_tasks.pop(event_id, None)
@@ -3053,7 +3184,7 @@ class Brain:
             return
 
         evt = await self.blackboard.get_event(event_id)
-        if not evt or evt.status.value == "closed":
+        if not evt or evt.status is EventStatus.CLOSED:
             logger.info("handle_wake_task: event %s is %s, skipping", event_id, evt.status.value if evt else "missing")
             bridge.delete_queue(task_id)
             await registry.mark_idle(agent_id)
@@ -3131,7 +3262,8 @@ class Brain:
             result_str = str(result).strip() if result else ""
 
             try:
-                result_data = json.loads(result)
+                # Only a JSON object can be a structured reply -- skip parsing large plain-text results.
+                result_data = json.loads(result_str) if result_str.startswith("{") else None
                 if isinstance(result_data, dict) and result_data.get("type") == "agent_busy":
                     logger.warning("Wake task: agent %s busy for %s", role, event_id)
                     self._release_task_state(event_id)
@@ -3222,6 +3354,21 @@ class Brain:
             )
             return False
 
+    def _note_agent_result(self, event_id: str, result_str: str) -> None:
+        """Reset the identical-dispatch count when the agent's answer changes.
+
+        The loop guard targets "same task, same answer"; a repeated task that
+        produces new results is progress, not a loop.
+        """
+        entry = self._dispatch_repeat.get(event_id)
+        if entry is None:
+            return
+        dispatch_sig, count, last_result = entry
+        result_sig = hashlib.blake2b(result_str.encode(errors="replace"), digest_size=8).hexdigest()
+        if last_result and result_sig != last_result:
+            count = 0
+        self._dispatch_repeat[event_id] = (dispatch_sig, count, result_sig)
+
     async def _run_agent_task(
         self,
         event_id: str,
@@ -3493,7 +3640,12 @@ class Brain:
                                 logger.debug("Dispatcher turn write failed for %s, continuing", event_id)
 
                     if agent_id_override is None:
-                        await self.write_event_to_volume(event_id, agent_name)
+                        # A plain local dispatch appends no turns after event_doc was read,
+                        # so reuse it. A circuit-breaker fallback has appended the ack turn and
+                        # waited in ensure_agent since then -- re-read (event=None).
+                        await self.write_event_to_volume(
+                            event_id, agent_name, event=None if use_ephemeral else event_doc,
+                        )
 
                     # Ground truth for the model/effort gate is agent_id_override, NOT
                     # is_ephemeral_dispatch -- the latter is computed early (L3203) and
@@ -3568,8 +3720,9 @@ class Brain:
                 return
 
             # Track session + mode for follow-ups -- clear on failure to prevent corrupted resume loops
-            result_str_check = str(result).strip() if result else ""
-            is_error_result = result_str_check.startswith("Error:") or not result_str_check
+            result_str = str(result).strip() if result else ""
+            self._note_agent_result(event_id, result_str)
+            is_error_result = result_str.startswith("Error:") or not result_str
             if session_id and not is_error_result:
                 self._agent_sessions.setdefault(event_id, {})[agent_name] = session_id
                 self._agent_session_modes.setdefault(event_id, {})[agent_name] = mode or ""
@@ -3583,7 +3736,7 @@ class Brain:
             # Note: unreachable in message mode (team_send_results blocked by MCP notInModes,
             # so callbackResult is null and stdout is plain text, never structured JSON).
             try:
-                result_data = json.loads(result)
+                result_data = json.loads(result_str) if result_str.startswith("{") else None
                 if isinstance(result_data, dict):
                     if result_data.get("type") == "question":
                         turn = ConversationTurn(
@@ -3616,7 +3769,6 @@ class Brain:
                 pass  # Not a JSON question, treat as regular result
 
             # Handle empty result as an error (Gemini CLI returned no output)
-            result_str = str(result).strip() if result else ""
             if not result_str:
                 turn = ConversationTurn(
                     turn=(await self._next_turn_number(event_id)),
@@ -3792,6 +3944,31 @@ class Brain:
         if assigned == 0:
             logger.warning("append_turn failed for %s (event not found)", event_id)
             return 0
+        # event is the pre-append document here -- the new turn is not in its conversation yet
+        await self._fanout_turn(
+            event_id, turn, event, total_turns=len(event.conversation) + 1 if event else None,
+        )
+        return assigned
+
+    async def _append_turns_and_broadcast(self, event_id: str, turns: list[ConversationTurn]) -> None:
+        """Persist consecutive turns in one Blackboard transaction, then fan each out in order."""
+        if not await self.blackboard.append_turns(event_id, turns):
+            logger.warning("append_turns failed for %s (event not found)", event_id)
+            return
+        for turn in turns:
+            await self._fanout_turn(event_id, turn)
+
+    async def _fanout_turn(
+        self, event_id: str, turn: ConversationTurn, event: "EventDocument | None" = None,
+        *, total_turns: int | None = None,
+    ) -> None:
+        """Broadcast an already-persisted turn and push it to the working agent sidecar.
+
+        Split from _append_and_broadcast for Blackboard writes that append the
+        turn inside their own transaction (defer_event_status, park_for_approval,
+        transition_event_status on deferred wake). ``event`` is the document
+        those writes return, which already contains the turn.
+        """
         await self._broadcast_turn(event_id, turn)
         try:
             from ..dependencies import get_registry_and_bridge
@@ -3800,17 +3977,17 @@ class Brain:
                 agent_conn = await registry.get_by_event(event_id)
                 if agent_conn and agent_conn.ws and turn.actor != agent_conn.current_role:
                     status = event.status.value if event else "active"
-                    total = len(event.conversation) + 1 if event else 0
+                    if total_turns is None:
+                        total_turns = len(event.conversation) if event else 0
                     await agent_conn.ws.send_json({
                         "type": "blackboard_update",
                         "event_id": event_id,
                         "turn": turn.model_dump(),
                         "event_status": status,
-                        "total_turns": total,
+                        "total_turns": total_turns,
                     })
         except Exception:
             pass
-        return assigned
 
     async def _broadcast_turn(self, event_id: str, turn: ConversationTurn) -> None:
         """Broadcast a conversation turn to all channels (WS, Slack, etc.)."""
@@ -3849,6 +4026,7 @@ class Brain:
         self._waiting_for_user.pop(event_id, None)
         self._idle_timeout.cancel(event_id)
         self._routing_depth.pop(event_id, None)  # Reset depth on user interaction
+        self._dispatch_repeat.pop(event_id, None)
 
     async def resume_if_parked(self, event_id: str) -> bool:
         """Resume a waiting_approval event back to active. Returns True if resumed."""
@@ -4095,7 +4273,7 @@ class Brain:
     async def _close_and_broadcast(self, event_id: str, summary: str, close_reason: str = "resolved") -> None:
         """Close an event and broadcast the closure to UI."""
         event = await self.blackboard.get_event(event_id)
-        if not event or event.status.value == "closed":
+        if not event or event.status is EventStatus.CLOSED:
             return
         if self._ephemeral_provisioner:
             await self._ephemeral_provisioner.terminate_agent(event_id)
@@ -4148,6 +4326,7 @@ class Brain:
             if self._live_adapter and hasattr(self._live_adapter, "on_meta_event_closed"):
                 self._live_adapter.on_meta_event_closed(event_id)
         self._routing_depth.pop(event_id, None)
+        self._dispatch_repeat.pop(event_id, None)
         self._waiting_for_user.pop(event_id, None)
         self._idle_timeout.cancel(event_id)
         self._waiting_for_agent.pop(event_id, None)
@@ -4401,10 +4580,18 @@ class Brain:
     # =========================================================================
 
     async def write_event_to_volume(
-        self, event_id: str, agent_name: str
+        self, event_id: str, agent_name: str, event: Optional[EventDocument] = None,
     ) -> None:
-        """Serialize event document as MD file to agent's volume, enriched with GitOps metadata and topology."""
-        event = await self.blackboard.get_event(event_id)
+        """Serialize event document as MD file to agent's volume, enriched with GitOps metadata and topology.
+
+        Pass ``event`` when the caller already holds a fresh copy to skip the
+        Redis read. The file is written to a temp sibling and swapped in with
+        os.replace so a sidecar reading it mid-write never sees a partial file.
+        Disk I/O runs in a worker thread; the await still completes before the
+        dispatch that reads the file goes out.
+        """
+        if event is None:
+            event = await self.blackboard.get_event(event_id)
         if not event:
             return
 
@@ -4416,14 +4603,27 @@ class Brain:
             logger.warning(f"No volume path for agent: {agent_name}")
             return
 
-        events_dir = Path(base_path) / "events"
-        events_dir.mkdir(parents=True, exist_ok=True)
-
-        file_path = events_dir / f"event-{event_id}.md"
+        file_path = Path(base_path) / "events" / f"event-{event_id}.md"
         content = self._event_to_markdown(event, service_meta, mermaid)
-        file_path.write_text(content)
+        await asyncio.to_thread(self._write_file_atomic, file_path, content)
         logger.debug(f"Wrote event MD to {file_path}")
 
+    @staticmethod
+    def _write_file_atomic(file_path: Path, content: str) -> None:
+        """Temp-file write + os.replace. Blocking -- call via asyncio.to_thread.
+
+        The parent dir is created only when the write finds it missing (first write,
+        or an agent wiped it from its working tree), not on every call.
+        """
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        data = content.encode("utf-8")
+        try:
+            tmp_path.write_bytes(data)
+        except FileNotFoundError:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+        os.replace(tmp_path, file_path)
+
     @staticmethod
     def _parse_plan_frontmatter(raw: str) -> tuple[str | None, list[dict] | None, dict]:
         """Extract plan markdown body, structured steps, and frontmatter dict from YAML.
@@ -4494,11 +4694,14 @@ class Brain:
             return
 
         stale_count = 0
-        for eid in active_ids:
-            event = await self.blackboard.get_event(eid)
+        orphan_ids: list[str] = []
+        requeue_ids: list[str] = []
+        # One MGET for every active event; orphan SREM / requeue LPUSH are batched after the loop.
+        events = await self.blackboard.get_events(active_ids)
+        for eid, event in zip(active_ids, events):
             if not event:
                 # Orphaned ID in active set -- remove it
-                await self.blackboard.redis.srem(self.blackboard.EVENT_ACTIVE, eid)
+                orphan_ids.append(eid)
                 stale_count += 1
                 continue
 
@@ -4514,11 +4717,11 @@ class Brain:
                     logger.info(f"Exempting hold_watch orphan from stale cleanup: {eid}")
                     continue
                 # Exempt deferred events: they're waiting on a timer or subscription, not stale
-                if event.status.value == "deferred":
+                if event.status is EventStatus.DEFERRED:
                     logger.info(f"Exempting deferred event from stale cleanup: {eid}")
                     continue
                 # Exempt events waiting for user approval
-                if event.status.value == "waiting_approval":
+                if event.status is EventStatus.WAITING_APPROVAL:
                     logger.info(f"Exempting waiting_approval event from stale cleanup: {eid}")
                     continue
                 self._clear_jarvis_wait(eid)
@@ -4565,9 +4768,15 @@ class Brain:
                 stale_count += 1
             else:
                 # No turns yet -- re-queue for fresh processing
-                await self.blackboard.redis.lpush(self.blackboard.EVENT_QUEUE, eid)
+                requeue_ids.append(eid)
                 logger.info(f"Re-queued untouched event {eid} for fresh processing")
 
+        if orphan_ids:
+            await self.blackboard.redis.srem(self.blackboard.EVENT_ACTIVE, *orphan_ids)
+        if requeue_ids:
+            # Multi-value LPUSH keeps the same BRPOP order as one LPUSH per event.
+            await self.blackboard.redis.lpush(self.blackboard.EVENT_QUEUE, *requeue_ids)
+
         if stale_count:
             logger.info(f"Startup cleanup: closed {stale_count} stale events from previous instance")
 
@@ -4575,8 +4784,7 @@ class Brain:
         """Reconstruct hold_watch state for jarvis meta-events that survived stale cleanup."""
         try:
             active_ids = await self.blackboard.get_active_events()
-            for eid in active_ids:
-                event = await self.blackboard.get_event(eid)
+            for eid, event in zip(active_ids, await self.blackboard.get_events(active_ids)):
                 if not event or event.source != "jarvis" or not event.conversation:
                     continue
                 if event.conversation[-1].waitingFor != "hold_watch":
@@ -4605,6 +4813,7 @@ class Brain:
             reconcile_fn=self.process_event,
             workers=self._derive_workers(),
             on_error=self._on_reconcile_error,
+            debounce_sec=_safe_int_env("BRAIN_RECONCILE_DEBOUNCE_MS", 50) / 1000,
         )
 
         self._scheduler.register_trigger(QueueTrigger(
@@ -4683,14 +4892,16 @@ class Brain:
         Used by both subscription-wake (_on_subscription_state_change) and
         timer-wake (_scan_active_for_reconcile) to avoid duplicate logic."""
         defer_key = f"{self.blackboard.EVENT_PREFIX}{event_id}:defer_until"
+        # Status flip, notification turn and timer DEL commit in one transaction.
         transitioned = await self.blackboard.transition_event_status(
             event_id, "deferred", EventStatus.ACTIVE,
+            turn=notification_turn, clear_keys=(defer_key,),
         )
-        await self.blackboard.redis.delete(defer_key)
         if not transitioned:
+            await self.blackboard.redis.delete(defer_key)
             return False
         if notification_turn:
-            await self._append_and_broadcast(event_id, notification_turn)
+            await self._fanout_turn(event_id, notification_turn)
         await self._broadcast({
             "type": "event_status_changed",
             "event_id": event_id,
@@ -4765,18 +4976,20 @@ class Brain:
                 asyncio.create_task(self._warmup_embedding())
 
         to_enqueue: list[str] = []
+        # One MGET for the whole active set instead of a GET per event per tick.
+        snapshot = dict(zip(active, await self.blackboard.get_events(active)))
 
         for eid in active:
             # Guard 1: Active task -- enqueue when unseen non-brain turns exist
             if eid in self._active_tasks and not self._active_tasks[eid].done():
-                event = await self.blackboard.get_event(eid)
+                event = snapshot[eid]
                 if event:
-                    unseen = [t for t in event.conversation if t.status.value == "sent"]
+                    unseen = [t for t in event.conversation if t.status is MessageStatus.SENT]
                     if unseen:
                         await self.blackboard.mark_turns_delivered(eid, len(event.conversation))
                         await self._broadcast_status_update(eid, "delivered", turns=unseen)
                     has_new_input = any(t.actor != "brain" for t in unseen) or any(
-                        t.status.value == "delivered" and t.actor != "brain"
+                        t.status is MessageStatus.DELIVERED and t.actor != "brain"
                         for t in event.conversation
                     )
                     if has_new_input:
@@ -4798,7 +5011,7 @@ class Brain:
                         to_enqueue.append(eid)
                 continue
 
-            event = await self.blackboard.get_event(eid)
+            event = snapshot[eid]
             if not event:
                 continue
 
@@ -4831,8 +5044,8 @@ class Brain:
                     )
                     if not user_after_defer:
                         continue
-                    logger.info(f"User message interrupted defer for {eid} -- waking early")
-                logger.info(f"Defer expired for {eid} -- attempting re-activation (defer_key exists={defer_until is not None})")
+                    logger.info("User message interrupted defer for %s -- waking early", eid)
+                logger.info("Defer expired for %s -- attempting re-activation (defer_key exists=%s)", eid, defer_until is not None)
                 woke = await self._wake_deferred_event(eid)
                 if self._state_watcher:
                     self._state_watcher.cancel(eid)
@@ -4840,7 +5053,7 @@ class Brain:
                     if eid in self._waiting_for_user:
                         logger.warning(f"Deferred event {eid} re-activated but waiting for user -- skipping")
                     else:
-                        logger.info(f"Deferred event {eid} re-activated")
+                        logger.info("Deferred event %s re-activated", eid)
                         to_enqueue.append(eid)
                 else:
                     refetched = await self.blackboard.get_event(eid)
@@ -4849,7 +5062,7 @@ class Brain:
                 continue
 
             # Mark SENT turns as DELIVERED
-            unseen = [t for t in event.conversation if t.status.value == "sent"]
+            unseen = [t for t in event.conversation if t.status is MessageStatus.SENT]
             if unseen:
                 await self.blackboard.mark_turns_delivered(eid, len(event.conversation))
                 await self._broadcast_status_update(eid, "delivered", turns=unseen)
@@ -4886,7 +5099,7 @@ class Brain:
                 # Level-triggered: delivered non-brain turns AFTER wait was set
                 if not has_participant_input:
                     has_participant_input = any(
-                        t.status.value == "delivered" and t.actor != "brain"
+                        t.status is MessageStatus.DELIVERED and t.actor != "brain"
                         for t in event.conversation[wait_turn:]
                     )
                 if not has_participant_input:
@@ -4925,7 +5138,7 @@ class Brain:
                     to_enqueue.append(eid)
                     continue
                 has_unread_hw = any(
-                    t.status.value == "delivered"
+                    t.status is MessageStatus.DELIVERED
                     for t in event.conversation[hw_idx + 1:]
                 )
                 if has_unread_hw:
@@ -4963,7 +5176,7 @@ class Brain:
                 continue
 
             # Standard enqueue decision
-            has_unread = any(t.status.value == "delivered" for t in event.conversation)
+            has_unread = any(t.status is MessageStatus.DELIVERED for t in event.conversation)
             is_waiting = eid in self._waiting_for_user
             is_locked = eid in self._event_locks and self._event_locks[eid].locked()
 
@@ -4972,7 +5185,7 @@ class Brain:
             # Scoped to recent turns to avoid matching stale history if mark_turns_evaluated fails.
             # Auth boundary: actor=="user" is set by authenticated ingestion (chat/slack endpoints).
             has_user_unread = has_unread and any(
-                t.status.value == "delivered" and t.actor == "user"
+                t.status is MessageStatus.DELIVERED and t.actor == "user"
                 for t in event.conversation[-10:]
             )
             if has_user_unread and is_waiting:
@@ -4984,7 +5197,7 @@ class Brain:
             elif not has_unread and not is_locked:
                 time_since = time.time() - self._last_processed.get(eid, 0)
                 if not is_waiting and time_since > 60:
-                    logger.info(f"Idle safety net: re-processing event {eid} (idle {time_since:.0f}s)")
+                    logger.info("Idle safety net: re-processing event %s (idle %.0fs)", eid, time_since)
                     to_enqueue.append(eid)
 
         return to_enqueue
@@ -5106,9 +5319,6 @@ class Brain:
         return not ev or ev.status == EventStatus.CLOSED
 
     async def _next_turn_number(self, event_id: str) -> int:
-        """Get the next turn number for an event."""
-        event = await self.blackboard.get_event(event_id)
-        if event:
-            return len(event.conversation) + 1
-        return 1
+        """Get the next turn number for an event (append_turn re-assigns it atomically)."""
+        return await self.blackboard.get_turn_count(event_id) + 1
 
@@ -5,6 +5,8 @@
 # 3. [Gotcha]: process() is DEPRECATED -- only used in non-reverse-WS legacy mode. Flash Manager LLM removed.
 # 4. [Pattern]: CancelledError propagation: cancels both dev_task + qe_task to prevent orphaned CLI processes.
 # 5. [Pattern]: session_id forwarded: Phase 1 passes Brain's session to dev; Phase 2 + followup() prefer internal sessions.
+#    Those maps are written only via _remember() (LRU, MAX_TRACKED_SESSIONS) -- Brain's cleanup_event is not the
+#    only thing keeping them bounded.
 """
 Developer agent -- thin AgentClient subclass.
 
@@ -17,6 +19,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+from collections import OrderedDict
 from typing import Callable, Optional
 
 from .base_client import AgentClient
@@ -24,6 +27,7 @@ from .base_client import AgentClient
 logger = logging.getLogger(__name__)
 
 MAX_REVIEW_ROUNDS = 2
+MAX_TRACKED_SESSIONS = 1024  # per-event session maps; oldest evicted first
 
 
 class Developer(AgentClient):
@@ -38,8 +42,9 @@ class Developer(AgentClient):
         )
         qe_url = os.getenv("QE_SIDECAR_URL", "")
         self._qe_enabled = bool(qe_url)
-        self._dev_sessions: dict[str, str] = {}   # event_id -> dev CLI session_id
-        self._qe_sessions: dict[str, str] = {}    # event_id -> qe CLI session_id
+        # event_id -> CLI session_id, LRU-capped so a missed cleanup_event cannot grow them forever
+        self._dev_sessions: OrderedDict[str, str] = OrderedDict()
+        self._qe_sessions: OrderedDict[str, str] = OrderedDict()
         if self._qe_enabled:
             self.qe = AgentClient(
                 agent_name="qe",
@@ -49,6 +54,13 @@ class Developer(AgentClient):
             )
             logger.info("QE pair enabled (concurrent dev + qe + Flash Manager)")
 
+    @staticmethod
+    def _remember(sessions: OrderedDict[str, str], event_id: str, session_id: str) -> None:
+        sessions[event_id] = session_id
+        sessions.move_to_end(event_id)
+        while len(sessions) > MAX_TRACKED_SESSIONS:
+            sessions.popitem(last=False)
+
     def cleanup_event(self, event_id: str) -> None:
         """Clean up per-event state including internal dev/qe session maps."""
         super().cleanup_event(event_id)
@@ -116,7 +128,7 @@ class Developer(AgentClient):
                 else:
                     qe_result = str(result_text)
                     if sid:
-                        self._qe_sessions[event_id] = sid
+                        self._remember(self._qe_sessions, event_id, sid)
                     first_agent = "QE"
 
             # Flash quick note on first finisher
@@ -137,11 +149,11 @@ class Developer(AgentClient):
                 else:
                     qe_result = str(result_text)
                     if sid:
-                        self._qe_sessions[event_id] = sid
+                        self._remember(self._qe_sessions, event_id, sid)
 
             # Track dev session
             if dev_session_id:
-                self._dev_sessions[event_id] = dev_session_id
+                self._remember(self._dev_sessions, event_id, dev_session_id)
 
             # Phase 2: Flash Manager review + rounds
             for round_num in range(1, MAX_REVIEW_ROUNDS + 1):
@@ -169,7 +181,7 @@ class Developer(AgentClient):
                         session_id=dev_session_id,
                     )
                     if dev_session_id:
-                        self._dev_sessions[event_id] = dev_session_id
+                        self._remember(self._dev_sessions, event_id, dev_session_id)
 
                 # Follow-up: QE verify
                 if qe_act in ("verify", "review"):
@@ -183,7 +195,7 @@ class Developer(AgentClient):
                         session_id=self._qe_sessions.get(event_id),
                     )
                     if qe_sid:
-                        self._qe_sessions[event_id] = qe_sid
+                        self._remember(self._qe_sessions, event_id, qe_sid)
 
         except asyncio.CancelledError:
             # Cancel BOTH sub-tasks to prevent orphaned CLI processes
@@ -213,7 +225,7 @@ class Developer(AgentClient):
             session_id=dev_session_id,
         )
         if dev_session_id:
-            self._dev_sessions[event_id] = dev_session_id
+            self._remember(self._dev_sessions, event_id, dev_session_id)
 
         merged = (
             f"## Developer Result\n{dev_result}\n\n"
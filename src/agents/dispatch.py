@@ -2,6 +2,8 @@
 # @ai-rules:
 # 1. [Constraint]: Security check (FORBIDDEN_PATTERNS) is the FIRST thing -- before any WS send. Single enforcement point.
 # 2. [Pattern]: Queue loop reads progress/partial_result/huddle_message/result/error/_error_sentinel from TaskBridge.
+#    Both loops run _consume(): frame type -> module-level _on_<type>(run, msg) via _DISPATCH_HANDLERS /
+#    _WAKE_HANDLERS (adds agent_teammate_message). Per-task state lives on a slotted _BridgeRun.
 # 3. [Pattern]: agent_id parameter enables session affinity (follow-up rounds route to same agent).
 # 4. [Pattern]: Retryable errors return ("__RETRYABLE__", None) sentinel ONLY if no partial_result exists.
 #    If partial_result was already captured, return it instead -- the agent recovered from the transient error.
@@ -13,19 +15,24 @@
 # 9. [Pattern]: WAKE_REGISTER_MODES — allowed `mode` on wake_register WS from sidecar (see handle_wake_task).
 # 10. [Pattern]: `model`/`effort` mirror the `mode` forwarding pattern (rules 7-8). `model` is only
 #     non-empty for ephemeral dispatches (gated by caller); `effort` passes through for all dispatches.
+# 11. [Pattern]: on_progress is delivered through progress_pump.ProgressPump (same as AgentClient): off the
+#     queue loop, lossy past MAX_PENDING for plain progress, flushed before result/error returns. on_huddle stays inline.
+#     close() is awaited in every finally so queued lossless payloads survive cancel/error exits.
 """Unified dispatch -- sends tasks to agent sidecars via persistent WebSocket."""
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 import uuid
 from typing import Callable
 
+import orjson
+
 from .agent_registry import AgentRegistry
+from .progress_pump import ProgressPump
 from .task_bridge import TaskBridge, ERROR_SENTINEL_TYPE
-from .security import FORBIDDEN_PATTERNS, SecurityError
+from .security import SecurityError, find_forbidden_pattern
 
 logger = logging.getLogger(__name__)
 
@@ -79,9 +86,135 @@ def _build_prompt(task: str, event_md_path: str) -> str:
 
 
 def _check_security(prompt: str) -> None:
-    for pattern in FORBIDDEN_PATTERNS:
-        if re.search(pattern, prompt, re.IGNORECASE):
-            raise SecurityError(f"Blocked forbidden pattern: {pattern}")
+    pattern = find_forbidden_pattern(prompt)
+    if pattern is not None:
+        raise SecurityError(f"Blocked forbidden pattern: {pattern}")
+
+
+class _BridgeRun:
+    """Mutable state of one dispatch/wake task while its TaskBridge queue is consumed."""
+
+    __slots__ = ("role", "event_id", "agent_id", "task_id", "on_huddle", "progress",
+                 "latest_callback_result", "session_id", "accepted", "kind")
+
+    def __init__(
+        self, role: str, event_id: str, agent_id: str, task_id: str,
+        on_progress: Callable | None, on_huddle: Callable | None,
+        session_id: str | None, kind: str = "",
+    ) -> None:
+        self.role = role
+        self.event_id = event_id
+        self.agent_id = agent_id
+        self.task_id = task_id
+        self.on_huddle = on_huddle
+        self.progress = ProgressPump(on_progress, role)
+        self.latest_callback_result: str | None = None
+        self.session_id = session_id
+        self.accepted = False  # sidecar produced output for this task -- see dispatch_to_agent finally
+        self.kind = kind  # log label: "" or "wake "
+
+
+# -- Frame handlers: return None to keep reading, or the (result, session_id) to return --
+
+async def _on_progress(run: _BridgeRun, msg: dict) -> None:
+    run.accepted = True
+    run.progress.emit({
+        "actor": run.role,
+        "event_id": run.event_id,
+        "message": msg.get("message", ""),
+        "source": msg.get("source", ""),
+    })
+
+
+async def _on_partial_result(run: _BridgeRun, msg: dict) -> None:
+    run.accepted = True
+    run.latest_callback_result = msg.get("content", "")
+    run.progress.emit({
+        "actor": run.role,
+        "event_id": run.event_id,
+        "message": f"[deliverable updated: {len(run.latest_callback_result)} chars]",
+        "source": "callback",
+    })
+
+
+async def _on_huddle_message(run: _BridgeRun, msg: dict) -> None:
+    run.accepted = True
+    if run.on_huddle:
+        await run.on_huddle({
+            "agent_id": run.agent_id,
+            "task_id": run.task_id,
+            "event_id": run.event_id,
+            "content": msg.get("content", ""),
+        })
+
+
+async def _on_teammate_message(run: _BridgeRun, msg: dict) -> None:
+    run.progress.emit({
+        "actor": msg.get("from", run.role),
+        "event_id": run.event_id,
+        "message": msg.get("content", ""),
+        "source": "teammate",
+    })
+
+
+async def _on_result(run: _BridgeRun, msg: dict) -> tuple[str, str | None]:
+    await run.progress.flush()
+    run.accepted = True
+    output = msg.get("output", "")
+    source = msg.get("source", "stdout")
+    if isinstance(output, dict):
+        output = orjson.dumps(output, option=orjson.OPT_INDENT_2).decode()
+    elif not isinstance(output, str):
+        output = str(output)
+    if run.latest_callback_result and source == "stdout":
+        output = run.latest_callback_result
+    elif source == "stdout":
+        output = _sanitize_stdout(output)
+    run.session_id = msg.get("session_id") or run.session_id
+    return output, run.session_id
+
+
+async def _on_error(run: _BridgeRun, msg: dict) -> tuple[str, str | None]:
+    await run.progress.flush()
+    error_msg = msg.get("error", msg.get("message", "Unknown error"))
+    if msg.get("retryable"):
+        if run.latest_callback_result:
+            logger.info(
+                "Retryable %serror from %s [%s] but partial_result exists (%d chars), returning it",
+                run.kind, run.role, run.event_id, len(run.latest_callback_result),
+            )
+            return run.latest_callback_result, run.session_id
+        logger.warning("Retryable %serror from %s [%s]: %s", run.kind, run.role, run.event_id, error_msg)
+        return RETRYABLE_SENTINEL, None
+    return f"Error: {error_msg}", run.session_id
+
+
+async def _on_disconnect(run: _BridgeRun, msg: dict) -> tuple[str, str | None]:
+    await run.progress.flush()
+    return f"Error: {msg.get('message', 'Agent disconnected')}", run.session_id
+
+
+_DISPATCH_HANDLERS = {
+    "progress": _on_progress,
+    "partial_result": _on_partial_result,
+    "huddle_message": _on_huddle_message,
+    "result": _on_result,
+    "error": _on_error,
+    ERROR_SENTINEL_TYPE: _on_disconnect,
+}
+# Wake tasks are CLI-initiated team sessions -- they also relay teammate messages.
+_WAKE_HANDLERS = {**_DISPATCH_HANDLERS, "agent_teammate_message": _on_teammate_message}
+
+
+async def _consume(queue: asyncio.Queue, run: _BridgeRun, handlers: dict) -> tuple[str, str | None]:
+    """Dispatch queued frames by type until a handler returns the task outcome."""
+    while True:
+        msg = await queue.get()
+        handler = handlers.get(msg.get("type", ""))
+        if handler is not None:
+            done = await handler(run, msg)
+            if done is not None:
+                return done
 
 
 async def dispatch_to_agent(
@@ -135,7 +268,7 @@ async def dispatch_to_agent(
     prev_event_id = agent_conn.current_event_id
     prev_task_id = agent_conn.current_task_id
     prev_role = agent_conn.current_role
-    accepted = False
+    run = _BridgeRun(role, event_id, agent_conn.agent_id, task_id, on_progress, on_huddle, session_id)
 
     try:
         await agent_conn.ws.send_json({
@@ -152,76 +285,11 @@ async def dispatch_to_agent(
             "effort": effort,
         })
         await registry.mark_busy(agent_conn.agent_id, event_id, task_id, role=role)
-
-        latest_callback_result: str | None = None
-        returned_session_id = session_id
-
-        while True:
-            msg = await queue.get()
-            msg_type = msg.get("type", "")
-
-            if msg_type == "progress":
-                accepted = True
-                if on_progress:
-                    await on_progress({
-                        "actor": role,
-                        "event_id": event_id,
-                        "message": msg.get("message", ""),
-                        "source": msg.get("source", ""),
-                    })
-
-            elif msg_type == "partial_result":
-                accepted = True
-                latest_callback_result = msg.get("content", "")
-                if on_progress:
-                    await on_progress({
-                        "actor": role,
-                        "event_id": event_id,
-                        "message": f"[deliverable updated: {len(latest_callback_result)} chars]",
-                        "source": "callback",
-                    })
-
-            elif msg_type == "huddle_message":
-                accepted = True
-                if on_huddle:
-                    await on_huddle({
-                        "agent_id": agent_conn.agent_id,
-                        "task_id": task_id,
-                        "event_id": event_id,
-                        "content": msg.get("content", ""),
-                    })
-
-            elif msg_type == "result":
-                accepted = True
-                output = msg.get("output", "")
-                source = msg.get("source", "stdout")
-                if isinstance(output, dict):
-                    output = json.dumps(output, indent=2)
-                if latest_callback_result and source == "stdout":
-                    output = latest_callback_result
-                elif source == "stdout" and not latest_callback_result:
-                    output = _sanitize_stdout(str(output))
-                returned_session_id = msg.get("session_id") or returned_session_id
-                return str(output), returned_session_id
-
-            elif msg_type == "error":
-                error_msg = msg.get("error", msg.get("message", "Unknown error"))
-                if msg.get("retryable"):
-                    if latest_callback_result:
-                        logger.info(
-                            "Retryable error from %s [%s] but partial_result exists (%d chars), returning it",
-                            role, event_id, len(latest_callback_result),
-                        )
-                        return latest_callback_result, returned_session_id
-                    logger.warning("Retryable error from %s [%s]: %s", role, event_id, error_msg)
-                    return RETRYABLE_SENTINEL, None
-                return f"Error: {error_msg}", returned_session_id
-
-            elif msg_type == ERROR_SENTINEL_TYPE:
-                return f"Error: {msg.get('message', 'Agent disconnected')}", returned_session_id
+        return await _consume(queue, run, _DISPATCH_HANDLERS)
 
     finally:
-        if accepted:
+        await run.progress.close()
+        if run.accepted:
             await registry.mark_idle(agent_conn.agent_id)
         elif prev_busy:
             await registry.mark_busy(
@@ -255,76 +323,11 @@ async def consume_wake_task(
     if not queue:
         return "Error: Wake task queue not found", None
 
+    run = _BridgeRun(role, event_id, agent_id, task_id, on_progress, on_huddle, None, kind="wake ")
     try:
-        latest_callback_result: str | None = None
-        returned_session_id: str | None = None
-
-        while True:
-            msg = await queue.get()
-            msg_type = msg.get("type", "")
-
-            if msg_type == "progress":
-                if on_progress:
-                    await on_progress({
-                        "actor": role, "event_id": event_id,
-                        "message": msg.get("message", ""),
-                        "source": msg.get("source", ""),
-                    })
-
-            elif msg_type == "partial_result":
-                latest_callback_result = msg.get("content", "")
-                if on_progress:
-                    await on_progress({
-                        "actor": role, "event_id": event_id,
-                        "message": f"[deliverable updated: {len(latest_callback_result)} chars]",
-                        "source": "callback",
-                    })
-
-            elif msg_type == "huddle_message":
-                if on_huddle:
-                    await on_huddle({
-                        "agent_id": agent_id, "task_id": task_id,
-                        "event_id": event_id,
-                        "content": msg.get("content", ""),
-                    })
-
-            elif msg_type == "agent_teammate_message":
-                if on_progress:
-                    await on_progress({
-                        "actor": msg.get("from", role), "event_id": event_id,
-                        "message": msg.get("content", ""),
-                        "source": "teammate",
-                    })
-
-            elif msg_type == "result":
-                output = msg.get("output", "")
-                source = msg.get("source", "stdout")
-                if isinstance(output, dict):
-                    output = json.dumps(output, indent=2)
-                if latest_callback_result and source == "stdout":
-                    output = latest_callback_result
-                elif source == "stdout" and not latest_callback_result:
-                    output = _sanitize_stdout(str(output))
-                returned_session_id = msg.get("session_id") or returned_session_id
-                return str(output), returned_session_id
-
-            elif msg_type == "error":
-                error_msg = msg.get("error", msg.get("message", "Unknown error"))
-                if msg.get("retryable"):
-                    if latest_callback_result:
-                        logger.info(
-                            "Retryable wake error from %s [%s] but partial_result exists (%d chars), returning it",
-                            role, event_id, len(latest_callback_result),
-                        )
-                        return latest_callback_result, returned_session_id
-                    logger.warning("Retryable wake error from %s [%s]: %s", role, event_id, error_msg)
-                    return RETRYABLE_SENTINEL, None
-                return f"Error: {error_msg}", returned_session_id
-
-            elif msg_type == ERROR_SENTINEL_TYPE:
-                return f"Error: {msg.get('message', 'Agent disconnected')}", returned_session_id
-
+        return await _consume(queue, run, _WAKE_HANDLERS)
     finally:
+        await run.progress.close()
         await registry.mark_idle(agent_id)
         bridge.delete_queue(task_id)
 
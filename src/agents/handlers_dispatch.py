@@ -5,10 +5,15 @@
 # 3. [Pattern]: select_agent uses ctx.run_agent_task() callback (stays on Brain).
 # 4. [Gotcha]: select_agent → defer_event recursive call via ctx.dispatch_handler().
 # 5. [Pattern]: _run_agent_task stays on Brain; injected as callback on ToolContext.
+# 6. [Pattern]: select_agent force-closes on MAX_IDENTICAL_DISPATCHES consecutive identical (agent, task) pairs,
+#    checked before the route turn so the doomed dispatch costs no agent run. Counter resets with routing depth
+#    and whenever the agent's result changes (Brain._note_agent_result) -- a loop means same task, same answer.
+#    ask_agent_for_state shares the branch but skips the guard (repeated state polls are legitimate).
 """Dispatch group: reply_to_agent, select_agent, message_agent, report_incident."""
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
 import time
@@ -23,6 +28,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("darwin.brain")
 
+MAX_IDENTICAL_DISPATCHES = 3
+
 
 # ---------------------------------------------------------------------------
 # reply_to_agent
@@ -93,6 +100,7 @@ async def handle_reply_to_agent(
 # ---------------------------------------------------------------------------
 async def handle_select_agent(
     ctx: ToolContext, event_id: str, args: dict, response_parts: list[dict] | None,
+    *, loop_guard: bool = True,
 ) -> bool:
     agent_name = args.get("agent_name", "")
     task = args.get("task_instruction", "") or args.get("question", "")
@@ -132,6 +140,16 @@ async def handle_select_agent(
         await ctx.close_and_broadcast(event_id, "Agent routing loop detected. Force closed.", "force_closed")
         return False
 
+    signature = hashlib.blake2b(f"{agent_name}\0{task}".encode(), digest_size=8).hexdigest()
+    if loop_guard and ctx.record_dispatch(event_id, signature) >= MAX_IDENTICAL_DISPATCHES:
+        logger.warning(f"Event {event_id} dispatched identical task to {agent_name} {MAX_IDENTICAL_DISPATCHES}x")
+        await ctx.close_and_broadcast(
+            event_id,
+            f"Loop detected: identical dispatch to {agent_name} {MAX_IDENTICAL_DISPATCHES}x. Force closed.",
+            "force_closed",
+        )
+        return False
+
     await ctx.stamp_event(event_id, last_dispatched_at=time.time())
 
     action = "route"
@@ -189,6 +207,12 @@ async def handle_select_agent(
     return False
 
 
+async def handle_ask_agent_for_state(
+    ctx: ToolContext, event_id: str, args: dict, response_parts: list[dict] | None,
+) -> bool:
+    return await handle_select_agent(ctx, event_id, args, response_parts, loop_guard=False)
+
+
 # ---------------------------------------------------------------------------
 # message_agent
 # ---------------------------------------------------------------------------
@@ -484,6 +508,6 @@ from .tool_router import HANDLER_REGISTRY
 
 HANDLER_REGISTRY["reply_to_agent"] = handle_reply_to_agent
 HANDLER_REGISTRY["select_agent"] = handle_select_agent
-HANDLER_REGISTRY["ask_agent_for_state"] = handle_select_agent  # shared branch
+HANDLER_REGISTRY["ask_agent_for_state"] = handle_ask_agent_for_state  # shared branch, no loop guard
 HANDLER_REGISTRY["message_agent"] = handle_message_agent
 HANDLER_REGISTRY["report_incident"] = handle_report_incident
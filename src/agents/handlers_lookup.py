@@ -7,11 +7,19 @@
 # 5. [Gotcha]: consult_deep_memory cached guard uses string matching coupled to Archivist response text.
 # 6. [Pattern]: consult_deep_memory scopes search_knowledge() via service_filter=svc or event.service --
 #    explicit tool-call `service` arg wins, falling back to the event's own service.
+# 7. [Pattern]: google_web_search results are cached per normalized query (lowercase, collapsed
+#    whitespace) in a process-local LRU with TTL (GOOGLE_SEARCH_CACHE_TTL_SEC). Failures are never cached.
+# 8. [Pattern]: lookup_service reads via ctx.get_cached_service / get_cached_service_names (short TTL,
+#    owned by Brain) so repeated calls within one LLM turn don't re-hit Redis.
+# 9. [Pattern]: google_web_search reuses one module-level genai.Client (_get_search_client) so searches share
+#    its pooled keep-alive connections instead of a fresh TLS handshake per call.
 """Lookup and query tool handlers (service, deep memory, journal)."""
 from __future__ import annotations
 
 import logging
+import os
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 from ..models import ConversationTurn
@@ -22,6 +30,49 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("darwin.brain")
 
+_WEB_SEARCH_CACHE_MAX = 256
+_WEB_SEARCH_CACHE_TTL = float(os.getenv("GOOGLE_SEARCH_CACHE_TTL_SEC", "900"))
+_web_search_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+_search_client = None  # genai.Client -- lazy, shared by every google_web_search call
+
+
+def _get_search_client():
+    global _search_client
+    if _search_client is None:
+        from google import genai
+        _search_client = genai.Client(
+            vertexai=True,
+            project=os.getenv("GCP_PROJECT", ""),
+            location=os.getenv("GCP_LOCATION", "global"),
+        )
+    return _search_client
+
+
+def _web_search_cache_key(query: str) -> str:
+    """Normalize so trivially different phrasings share one cache entry."""
+    return " ".join(query.lower().split())
+
+
+def _web_search_cache_get(key: str) -> str | None:
+    hit = _web_search_cache.get(key)
+    if hit is None:
+        return None
+    stored_at, result_text = hit
+    if time.monotonic() - stored_at > _WEB_SEARCH_CACHE_TTL:
+        _web_search_cache.pop(key, None)
+        return None
+    _web_search_cache.move_to_end(key)
+    return result_text
+
+
+def _web_search_cache_put(key: str, result_text: str) -> None:
+    _web_search_cache[key] = (time.monotonic(), result_text)
+    _web_search_cache.move_to_end(key)
+    while len(_web_search_cache) > _WEB_SEARCH_CACHE_MAX:
+        _web_search_cache.popitem(last=False)
+
 
 async def handle_lookup_service(
     ctx: ToolContext, event_id: str, args: dict, response_parts: list[dict] | None,
@@ -53,13 +104,13 @@ async def handle_lookup_service(
         await ctx.append_and_broadcast(event_id, turn)
         return False
 
-    svc = await bb.get_service(service_name)
+    svc = await ctx.get_cached_service(service_name)
     if not svc and "/" not in service_name:
-        known = await bb.get_services()
+        known = await ctx.get_cached_service_names()
         matches = [k for k in known if k.endswith(f"/{service_name}")]
         if len(matches) == 1:
             service_name = matches[0]
-            svc = await bb.get_service(service_name)
+            svc = await ctx.get_cached_service(service_name)
         elif matches:
             result_text = (
                 f"## Service: {service_name}\n\n"
@@ -94,7 +145,7 @@ async def handle_lookup_service(
             rows.append(f"| Escalation | Escalated{scope_label}: {svc.escalation_flag} |")
         result_text = f"## Service: {service_name}\n\n| Field | Value |\n|---|---|\n" + "\n".join(rows)
     else:
-        known = await bb.get_services()
+        known = await ctx.get_cached_service_names()
         result_text = f"## Service: {service_name}\n\nNot found. Known services: {', '.join(sorted(known)) if known else 'none'}"
 
     turn = ConversationTurn(
@@ -337,7 +388,6 @@ async def handle_google_web_search(
 ) -> bool:
     """Execute an isolated grounded search and return structured results."""
     import asyncio
-    import os
 
     query = args.get("query", "").strip()[:500]
     if not query:
@@ -349,15 +399,24 @@ async def handle_google_web_search(
         await ctx.append_and_broadcast(event_id, turn)
         return True
 
+    cache_key = _web_search_cache_key(query)
+    cached = _web_search_cache_get(cache_key)
+    if cached is not None:
+        logger.info("google_web_search cache hit for %s (%d chars)", event_id, len(cached))
+        turn = ConversationTurn(
+            turn=0, actor="brain", action="tool_result",
+            evidence=cached,
+            response_parts=response_parts,
+        )
+        await ctx.append_and_broadcast(event_id, turn)
+        return True
+
     model = os.getenv("GOOGLE_SEARCH_GROUNDING_MODEL", "gemini-3.5-flash-lite")
-    project = os.getenv("GCP_PROJECT", "")
-    location = os.getenv("GCP_LOCATION", "global")
 
     try:
-        from google import genai
         from google.genai import types
 
-        client = genai.Client(vertexai=True, project=project, location=location)
+        client = _get_search_client()
         async with asyncio.timeout(60):
             response = await client.aio.models.generate_content(
                 model=model,
@@ -399,6 +458,7 @@ async def handle_google_web_search(
             "google_web_search for %s: %d chunks, %d queries, %d chars",
             event_id, len(chunks), len(search_queries), len(summary),
         )
+        _web_search_cache_put(cache_key, result_text)
 
     except Exception as e:
         logger.warning("google_web_search failed for %s: %s", event_id, e)
@@ -5,6 +5,9 @@
 # 3. [Pattern]: Every handler returns bool (True = re-invoke LLM, False = stop).
 # 4. [Constraint]: Called within per-event asyncio.Lock — MUST NOT re-acquire.
 # 5. [Gotcha]: defer_event uses ctx.get_blackboard().defer_event_status() (not raw Redis).
+#    defer_event / request_user_approval hand their turn (turn=0) to defer_event_status() / park_for_approval(),
+#    which number and append it in the same WATCH/MULTI as the status change, then ctx.fanout_turn() broadcasts it.
+#    Do NOT call append_and_broadcast first -- that is a second transaction and reopens the turn/status gap.
 # 6. [Gotcha]: close_event delegates to ctx.close_and_broadcast() which stays on Brain.
 # 7. [Pattern]: close_event has pessimistic re-check — re-fetches event from Redis, calls
 #    has_unevaluated_close_blocker() (shared with gate) to catch late-arriving messages.
@@ -37,7 +40,7 @@ async def handle_close_event(
     # Redis and scan for unevaluated turns before committing the close.
     bb = ctx.get_blackboard()
     fresh = await bb.get_event(event_id)
-    if not fresh or fresh.status.value == "closed":
+    if not fresh or fresh.status is EventStatus.CLOSED:
         logger.debug("close_event skipped for %s: event gone or already closed", event_id)
         return False
     if has_unevaluated_close_blocker(fresh.conversation):
@@ -69,17 +72,16 @@ async def handle_request_user_approval(
     plan_summary = args.get("plan_summary", "")
     ctx.mark_waiting_for_user(event_id)
     turn = ConversationTurn(
-        turn=(await ctx.next_turn_number(event_id)),
+        turn=0,
         actor="brain",
         action="request_approval",
         thoughts=plan_summary,
         pendingApproval=True,
         waitingFor="user",
     )
-    await ctx.append_and_broadcast(event_id, turn)
-    bb = ctx.get_blackboard()
-    await bb.park_for_approval(event_id)
-    event = await bb.get_event(event_id)
+    event = await ctx.get_blackboard().park_for_approval(event_id, turn=turn)
+    if event:
+        await ctx.fanout_turn(event_id, turn, event)
     if event and event.source in ("slack", "chat"):
         ctx.get_idle_timeout().schedule(event_id, warning_sec=ctx.get_conversation_timeout(event))
     return False
@@ -356,7 +358,7 @@ async def handle_defer_event(
     if ctx.is_waiting_for_user(event_id):
         logger.warning(f"Ignoring defer_event for {event_id}: waiting for user response")
         turn = ConversationTurn(
-            turn=(await ctx.next_turn_number(event_id)),
+            turn=0,
             actor="brain",
             action="tool_result",
             thoughts="This event is currently waiting for user input and "
@@ -372,16 +374,16 @@ async def handle_defer_event(
     defer_started_at = time.time()
     defer_until = defer_started_at + delay
     turn = ConversationTurn(
-        turn=(await ctx.next_turn_number(event_id)),
+        turn=0,
         actor="brain",
         action="defer",
         thoughts=f"Deferring event for {delay}s: {reason}",
         waitingFor="defer_event",
     )
-    await ctx.append_and_broadcast(event_id, turn)
     bb = ctx.get_blackboard()
-    success = await bb.defer_event_status(event_id, defer_until, delay)
+    success = await bb.defer_event_status(event_id, defer_until, delay, turn=turn)
     if success:
+        await ctx.fanout_turn(event_id, turn)
         await ctx.broadcast({
             "type": "event_status_changed",
             "event_id": event_id,
@@ -400,7 +402,7 @@ async def handle_defer_event(
         event = await bb.get_event(event_id)
         service = event.service if event else "unknown"
         notify_turn = ConversationTurn(
-            turn=(await ctx.next_turn_number(meta_id)),
+            turn=0,
             actor="system",
             action="notification",
             thoughts=f"[SYSTEM] evt-{event_id[:8]} ({service}) entered deferred state.",
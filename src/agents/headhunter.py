@@ -71,6 +71,7 @@ class Headhunter:
     ):
         self.blackboard = blackboard
         self._adapter = None
+        self._adapter_lock = asyncio.Lock()
         self._close_signal = close_signal
         self._poll_interval = int(os.getenv("HEADHUNTER_POLL_INTERVAL", "300"))
         self._wip_cap = int(os.getenv("MAX_ACTIVE_EVENTS", "20"))
@@ -95,18 +96,15 @@ class Headhunter:
 
     async def _get_adapter(self):
         """Lazy-load LLM adapter (Gemini Flash for Headhunter)."""
-        if self._adapter is None and self._llm_enabled:
-            try:
-                from .llm import create_adapter
-
-                project = os.getenv("GCP_PROJECT")
-                location = os.getenv("GCP_LOCATION", "us-central1")
-                self._adapter = create_adapter("gemini", project, location, self._model_name)
-                logger.info(f"Headhunter LLM adapter initialized: gemini/{self._model_name}")
-            except Exception as e:
-                logger.warning(f"LLM adapter not available for Headhunter: {e}")
-                self._adapter = None
-        return self._adapter
+        if self._adapter is not None or not self._llm_enabled:
+            return self._adapter
+        from .llm import get_or_create_adapter
+
+        return await get_or_create_adapter(
+            self, self._adapter_lock, "gemini",
+            os.getenv("GCP_PROJECT"), os.getenv("GCP_LOCATION", "us-central1"), self._model_name,
+            label="Headhunter",
+        )
 
     # =========================================================================
     # LLM Analysis (platform-agnostic)
@@ -42,6 +42,8 @@ from typing import TYPE_CHECKING
 
 import httpx
 
+from ..models import OPEN_EVENT_STATUSES
+
 if TYPE_CHECKING:
     from ..state.blackboard import BlackboardState
 
@@ -217,7 +219,7 @@ class GitHubPlatform:
             event = await self.blackboard.get_event(eid)
             if not event or event.source != "headhunter":
                 continue
-            if event.status.value not in ("new", "active", "deferred"):
+            if event.status not in OPEN_EVENT_STATUSES:
                 continue
             evidence = event.event.evidence if event.event else None
             if evidence is None:
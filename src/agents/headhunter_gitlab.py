@@ -24,6 +24,8 @@ from typing import TYPE_CHECKING
 
 import httpx
 
+from ..models import OPEN_EVENT_STATUSES
+
 if TYPE_CHECKING:
     from ..state.blackboard import BlackboardState
 
@@ -135,7 +137,7 @@ class GitLabPlatform:
             event = await self.blackboard.get_event(eid)
             if not event or event.source != "headhunter":
                 continue
-            if event.status.value not in ("new", "active", "deferred"):
+            if event.status not in OPEN_EVENT_STATUSES:
                 continue
             ctx = getattr(event.event.evidence, "gitlab_context", None) if event.event and event.event.evidence else None
             if ctx:
@@ -40,6 +40,8 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from ..models import OPEN_EVENT_STATUSES
+
 if TYPE_CHECKING:
     from ..state.blackboard import BlackboardState
 
@@ -673,7 +675,7 @@ class HeadhunterJira:
             event = await self.blackboard.get_event(eid)
             if (event and event.source == "headhunter"
                     and getattr(event, "subject_type", "service") == "jira"
-                    and event.status.value in ("new", "active", "deferred")):
+                    and event.status in OPEN_EVENT_STATUSES):
                 jira_ctx = getattr(event.event.evidence, "jira_context", None) if event.event and event.event.evidence else None
                 if jira_ctx and isinstance(jira_ctx, dict):
                     keys.add(jira_ctx.get("issue_key", ""))
@@ -5,6 +5,8 @@
 # 3. [Pattern]: QuotaTracker is a module-level singleton. Created lazily on first Gemini create_adapter() call.
 # 4. [Constraint]: Claude adapter skips QuotaTracker (separate Anthropic quota via Vertex AI).
 # 5. [Pattern]: TokenMeter is a lazy singleton via get_token_meter(). Unlike QuotaTracker, never returns None.
+# 6. [Pattern]: Lazy per-owner adapters go through get_or_create_adapter(owner, lock, ...): double-checked lock,
+#    create_adapter in a worker thread, failures logged and returned as None (next call retries).
 """
 LLM adapter factory and re-exports.
 
@@ -12,6 +14,7 @@ Usage:
     from .llm import create_adapter, BRAIN_TOOL_SCHEMAS, LLMChunk
     adapter = create_adapter("gemini", project, location, model)
 """
+import asyncio
 import logging
 import os
 
@@ -30,6 +33,7 @@ from .quota_tracker import QuotaExhaustedError, QuotaTracker
 
 __all__ = [
     "create_adapter",
+    "get_or_create_adapter",
     "get_quota_tracker",
     "get_token_meter",
     "record_token_usage",
@@ -90,3 +94,36 @@ def create_adapter(provider: str, project: str, location: str, model_name: str)
 
     from .gemini_client import GeminiAdapter
     return GeminiAdapter(project, location, model_name, quota_tracker=_quota_tracker)
+
+
+async def get_or_create_adapter(
+    owner: object,
+    lock: asyncio.Lock,
+    provider: str,
+    project: str,
+    location: str,
+    model_name: str,
+    *,
+    attr: str = "_adapter",
+    label: str = "",
+) -> LLMPort | None:
+    """Return ``owner.<attr>``, building it once via create_adapter.
+
+    SDK client construction (credential discovery) runs in a worker thread;
+    the double-checked ``lock`` keeps concurrent first callers from building
+    a second client. Failures are logged and return None so a later call retries.
+    """
+    adapter = getattr(owner, attr)
+    if adapter is not None:
+        return adapter
+    async with lock:
+        adapter = getattr(owner, attr)
+        if adapter is None:
+            try:
+                adapter = await asyncio.to_thread(create_adapter, provider, project, location, model_name)
+            except Exception as e:
+                _logger.warning("%s LLM adapter not available: %s", label or type(owner).__name__, e)
+                return None
+            setattr(owner, attr, adapter)
+            _logger.info("%s LLM adapter initialized: %s/%s", label or type(owner).__name__, provider, model_name)
+    return adapter
@@ -4,6 +4,8 @@
 # 2. [Pattern]: _build_config() shared by generate() and generate_stream(). tools=None omits tool config.
 # 3. [Gotcha]: generate_content_stream chunk may have .text AND .function_calls -- process both.
 # 4. [Pattern]: _convert_tools() converts plain dict schemas to google.genai FunctionDeclaration objects.
+#    Declarations are memoized module-wide in _DECLARATION_CACHE (LRU, key = orjson bytes of the schema),
+#    so a changed schema is a new key, never a stale hit. Only the Tool wrapper is built per call.
 # 5. [Gotcha]: Temperature range 0.0-2.0 -- passthrough, no normalization needed.
 # 6. [Pattern]: include_thoughts=True enables Gemini's thinking tokens. Check part.thought flag in candidates.
 # 7. [Pattern]: _convert_contents() three-way: str (plain) | list[dict] with "role" (structured) | list (multimodal).
@@ -19,6 +21,18 @@
 #     with models that don't clear thought history.
 # 13. [Pattern]: Client init configures explicit HttpRetryOptions (5 attempts, exp backoff, 408/429/5xx).
 #     SDK-level retries handle 502/503 before Brain's own retry layer. timeout=180s for long inference.
+# 14. [Pattern]: _convert_structured() pairs a model turn's single functionCall with the next user
+#     message's leading "[SYSTEM <tool>]: ..." part as Part.from_function_response. Only exact
+#     name match + exactly one functionCall -- otherwise the text passes through unchanged (no FR/FC count mismatch).
+#     The text part's thought_signature (base64 in Redis) is decoded onto the function_response Part.
+# 15. [Pattern]: _convert_structured() joins runs of plain {"text"} parts with "\n" into one part. Parts with
+#     extra keys (thought, thought_signature, functionCall) and image parts are never merged.
+# 16. [Pattern]: generate(response_mime_type="application/json") sets JSON mode in _build_config -- the model
+#     returns bare JSON (no ``` fences). Blocking calls only; generate_stream() never sets it.
+# 17. [Constraint]: No explicit CachedContent for the Brain system prompt. A cache binds system_instruction AND
+#     tools, but both vary per call: the prompt opens with the live event-state header and carries per-event
+#     template vars / evidence-gated skills, and tool_gates filters the tool list every iteration. A cache per
+#     distinct pair would be created far more often than reused. cached_content_token_count is still recorded.
 """
 GeminiAdapter -- LLMPort implementation using google-genai SDK (Vertex AI).
 
@@ -28,12 +42,20 @@ generate_content / generate_content_stream.
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 
+import orjson
+
 from .types import FunctionCall, LLMChunk, LLMResponse, TokenUsage
 
 logger = logging.getLogger(__name__)
 
+# FunctionDeclaration per tool schema, keyed by the schema's serialized bytes so gated subsets and
+# per-event variants (maintainer enum injection) still hit. Shared by every adapter instance.
+_DECLARATION_CACHE: OrderedDict[bytes, object] = OrderedDict()
+DECLARATION_CACHE_MAX = 256
+
 
 class GeminiAdapter:
     """Vertex AI Gemini adapter implementing LLMPort."""
@@ -118,6 +140,7 @@ class GeminiAdapter:
         top_p: float,
         max_output_tokens: int,
         thinking_level: str = "",
+        response_mime_type: str = "",
     ):
         """Build GenerateContentConfig from method args."""
         from google.genai import types
@@ -134,6 +157,8 @@ class GeminiAdapter:
         }
         if system_prompt:
             kwargs["system_instruction"] = system_prompt
+        if response_mime_type:
+            kwargs["response_mime_type"] = response_mime_type
         if tools is not None:
             tool_objects = [self._convert_tools(tools)]
             kwargs["tools"] = tool_objects
@@ -151,11 +176,20 @@ class GeminiAdapter:
 
         declarations = []
         for s in schemas:
-            declarations.append(types.FunctionDeclaration(
-                name=s["name"],
-                description=s["description"],
-                parameters_json_schema=s["input_schema"],
-            ))
+            key = orjson.dumps(s)
+            decl = _DECLARATION_CACHE.get(key)
+            if decl is None:
+                decl = types.FunctionDeclaration(
+                    name=s["name"],
+                    description=s["description"],
+                    parameters_json_schema=s["input_schema"],
+                )
+                _DECLARATION_CACHE[key] = decl
+                if len(_DECLARATION_CACHE) > DECLARATION_CACHE_MAX:
+                    _DECLARATION_CACHE.popitem(last=False)
+            else:
+                _DECLARATION_CACHE.move_to_end(key)
+            declarations.append(decl)
         return types.Tool(function_declarations=declarations)
 
     def _convert_contents(self, contents: str | list):
@@ -195,34 +229,85 @@ class GeminiAdapter:
 
         Text and thought_signature parts pass through as dicts (SDK accepts them).
         Image parts ({"bytes": ...}) are converted to SDK Part objects.
+        A "[SYSTEM <tool>]: ..." text part answering the previous model turn's
+        single functionCall is sent as Part.from_function_response so Gemini
+        sees a proper FC/FR pair instead of a free-text user message.
+        Adjacent plain {"text"} parts are joined with newlines into one part.
         """
         from google.genai import types
         converted = []
+        pending_fc: str | None = None
         for msg in contents:
             role = msg["role"]
             parts = []
-            for p in msg.get("parts", []):
+            for i, p in enumerate(msg.get("parts", [])):
+                if i == 0 and pending_fc and role == "user":
+                    fr = self._as_function_response(p, pending_fc)
+                    if fr is not None:
+                        parts.append(fr)
+                        continue
                 if isinstance(p, dict) and "bytes" in p:
                     parts.append(types.Part.from_bytes(
                         data=p["bytes"], mime_type=p["mime_type"],
                     ))
                 elif isinstance(p, dict):
                     if "thought_signature" in p:
-                        import base64
                         restored = dict(p)
-                        sig = restored["thought_signature"]
-                        try:
-                            restored["thought_signature"] = base64.b64decode(sig) if isinstance(sig, str) else sig
-                        except Exception:
-                            pass
+                        restored["thought_signature"] = self._decode_signature(restored["thought_signature"])
                         parts.append(restored)
+                    elif p.keys() == {"text"} and parts and self._is_plain_text(parts[-1]):
+                        # Coalesce runs of plain text into one Part -- merged turns
+                        # otherwise cost one proto Part (and its framing) each.
+                        parts[-1] = {"text": f"{parts[-1]['text']}\n{p['text']}"}
                     else:
                         parts.append(p)
                 else:
                     parts.append(p)
+            pending_fc = None
+            if role == "model":
+                fc_names = [
+                    p["functionCall"].get("name")
+                    for p in msg.get("parts", [])
+                    if isinstance(p, dict) and "functionCall" in p
+                ]
+                if len(fc_names) == 1:
+                    pending_fc = fc_names[0]
             converted.append(types.Content(role=role, parts=parts))
         return converted
 
+    @staticmethod
+    def _is_plain_text(part) -> bool:
+        return isinstance(part, dict) and part.keys() == {"text"} and isinstance(part["text"], str)
+
+    @staticmethod
+    def _decode_signature(sig):
+        """thought_signature is stored base64 in Redis; the SDK wants bytes."""
+        import base64
+        try:
+            return base64.b64decode(sig) if isinstance(sig, str) else sig
+        except Exception:
+            return sig
+
+    @classmethod
+    def _as_function_response(cls, part, fc_name: str):
+        """Return a function_response Part if *part* is the tool_result text for *fc_name*.
+
+        A thought_signature on the text part is carried onto the function_response.
+        """
+        from google.genai import types
+        if not isinstance(part, dict) or "text" not in part:
+            return None
+        prefix = f"[SYSTEM {fc_name}]: "
+        text = part["text"]
+        if not isinstance(text, str) or not text.startswith(prefix):
+            return None
+        fr = types.Part.from_function_response(
+            name=fc_name, response={"output": text[len(prefix):]},
+        )
+        if part.get("thought_signature"):
+            fr.thought_signature = cls._decode_signature(part["thought_signature"])
+        return fr
+
     # -----------------------------------------------------------------
     # LLMPort: generate (blocking)
     # -----------------------------------------------------------------
@@ -237,8 +322,11 @@ class GeminiAdapter:
         max_output_tokens: int = 65000,
         thinking_level: str = "",
         tool_choice: dict | None = None,
+        response_mime_type: str = "",
     ) -> LLMResponse:
-        config = self._build_config(system_prompt, tools, temperature, top_p, max_output_tokens, thinking_level)
+        config = self._build_config(
+            system_prompt, tools, temperature, top_p, max_output_tokens, thinking_level, response_mime_type,
+        )
 
         estimate = self._estimate_tokens(contents)
         if self._tracker:
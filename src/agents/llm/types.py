@@ -81,6 +81,7 @@ class LLMPort(Protocol):
         max_output_tokens: int = 65000,
         thinking_level: str = "",
         tool_choice: dict | None = None,
+        response_mime_type: str = "",
     ) -> LLMResponse: ...
 
     async def generate_stream(
@@ -0,0 +1,97 @@
+# BlackBoard/src/agents/progress_pump.py
+# @ai-rules:
+# 1. [Pattern]: Shared on_progress delivery for both agent transports (base_client.AgentClient and dispatch's
+#    reverse-WS bridge). Leaf module -- imports nothing from src.agents.
+# 2. [Constraint]: Lossy past MAX_PENDING for UI-only payloads; LOSSLESS_SOURCES (they become conversation turns)
+#    are never dropped by overflow, and close() gives queued ones LOSSLESS_DRAIN_SEC to land.
+# 3. [Constraint]: Per-payload log calls use %-style args, not f-strings (hot path).
+"""Serial, bounded on_progress delivery from a side task."""
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressPump:
+    """Deliver on_progress payloads serially from a side task.
+
+    A slow callback (UI broadcast, Redis turn append) no longer delays handling
+    of the next sidecar frame. Bounded: past MAX_PENDING the oldest droppable
+    payload is discarded -- progress is lossy, conversation-bearing sources are not.
+    """
+
+    MAX_PENDING = 64
+    LOSSLESS_DRAIN_SEC = 2.0  # close() waits this long for queued conversation-bearing payloads
+    LOSSLESS_SOURCES = frozenset({"agent_message", "teammate"})
+    # Status-only payloads ("[deliverable updated: N chars]"): a newer one supersedes a still-queued one
+    LATEST_ONLY_SOURCES = frozenset({"callback"})
+
+    def __init__(self, on_progress: Optional[Callable], label: str, coalesce_sec: float = 0.0):
+        self._cb = on_progress
+        self._label = label
+        # >0: deliver at most one batch per tick; a queued droppable payload is superseded by a newer
+        # one of the same source (noisy agents -> one UI update per tick instead of one per line)
+        self._coalesce_sec = coalesce_sec
+        self._items: collections.deque = collections.deque()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = asyncio.create_task(self._drain()) if on_progress else None
+
+    def emit(self, payload: dict) -> None:
+        if self._task is None:
+            return
+        source = payload.get("source")
+        if self._items and self._items[-1].get("source") == source and (
+            source in self.LATEST_ONLY_SOURCES
+            or (self._coalesce_sec and source not in self.LOSSLESS_SOURCES)
+        ):
+            self._items[-1] = payload
+            return
+        if len(self._items) >= self.MAX_PENDING:
+            for i, queued in enumerate(self._items):
+                if queued.get("source") not in self.LOSSLESS_SOURCES:
+                    del self._items[i]
+                    break
+        self._items.append(payload)
+        self._idle.clear()
+        self._wakeup.set()
+
+    async def _drain(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            if self._coalesce_sec:
+                await asyncio.sleep(self._coalesce_sec)
+            self._wakeup.clear()
+            while self._items:
+                payload = self._items.popleft()
+                try:
+                    await self._cb(payload)
+                except Exception as e:
+                    logger.warning("%s on_progress callback failed: %s", self._label, e)
+            self._idle.set()
+
+    async def flush(self) -> None:
+        """Wait until every queued payload has been delivered."""
+        if self._task is not None:
+            await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop the pump; still-queued lossless payloads get LOSSLESS_DRAIN_SEC to land first."""
+        if self._task is None:
+            return
+        lossless = [p for p in self._items if p.get("source") in self.LOSSLESS_SOURCES]
+        self._items.clear()
+        if lossless:
+            self._items.extend(lossless)
+            self._wakeup.set()
+            try:
+                await asyncio.wait_for(self._idle.wait(), self.LOSSLESS_DRAIN_SEC)
+            except TimeoutError:
+                logger.warning("%s dropped %d queued progress turn(s) on close", self._label, len(self._items))
+        self._task.cancel()
+        self._task = None
@@ -28,6 +28,58 @@ FORBIDDEN_PATTERNS = [
     r"dd\s+if=",
 ]
 
+_REGEX_META = set(".^$*+?{}[]|()")
+
+
+def _as_literal(pattern: str) -> str | None:
+    """Lowercased plain string if *pattern* has no regex semantics, else None."""
+    out: list[str] = []
+    escaped = False
+    for ch in pattern:
+        if escaped:
+            if ch.isalnum():  # \s, \d, \b ... are character classes, not literals
+                return None
+            out.append(ch)
+            escaped = False
+        elif ch == "\\":
+            escaped = True
+        elif ch in _REGEX_META:
+            return None
+        else:
+            out.append(ch)
+    return None if escaped else "".join(out).lower()
+
+
+# Two tiers, built once at import, both scanning the text lowercased once:
+# plain-string patterns use str.__contains__ (tight C loop, no regex engine);
+# the rest are compiled individually and searched case-sensitively. Each
+# pattern starts with a literal ("rm", "kubectl", ...), so sre's literal-prefix
+# search skips ahead at memchr speed -- an IGNORECASE alternation gets no such
+# prefix and steps the engine at every offset (~30x slower on large prompts).
+# Patterns with uppercase characters keep IGNORECASE so \S, \W etc. stay correct.
+# No Hyperscan/Aho-Corasick: the scan runs once per task send and costs ~0.1 ms on a
+# 4 KB prompt, ~3 ms on 117 KB of command-dense text -- not worth a native dependency
+# (and its separate regex dialect) at 14 patterns. Revisit if the list grows to hundreds.
+_LITERAL_FORBIDDEN: tuple[tuple[str, str], ...] = tuple(
+    (lit, p) for p in FORBIDDEN_PATTERNS if (lit := _as_literal(p)) is not None
+)
+_REGEX_FORBIDDEN: tuple[tuple[re.Pattern, str], ...] = tuple(
+    (re.compile(p, re.IGNORECASE if any(c.isupper() for c in p) else 0), p)
+    for p in FORBIDDEN_PATTERNS if _as_literal(p) is None
+)
+
+
+def find_forbidden_pattern(text: str) -> str | None:
+    """Return a FORBIDDEN_PATTERNS entry matched in text, or None."""
+    low = text.lower()
+    for lit, pattern in _LITERAL_FORBIDDEN:
+        if lit in low:
+            return pattern
+    for rx, pattern in _REGEX_FORBIDDEN:
+        if rx.search(low) is not None:
+            return pattern
+    return None
+
 
 class SecurityError(Exception):
     """Raised when a forbidden operation is detected."""
@@ -43,10 +95,10 @@ def safe_execution(func):
     @functools.wraps(func)
     def wrapper(self, plan_context: str, *args, **kwargs):
         # Scan for forbidden patterns
-        for pattern in FORBIDDEN_PATTERNS:
-            if re.search(pattern, plan_context, re.IGNORECASE):
-                logger.error(f"SECURITY BLOCK: Forbidden pattern detected: {pattern}")
-                raise SecurityError(f"Blocked forbidden pattern: {pattern}")
+        pattern = find_forbidden_pattern(plan_context)
+        if pattern is not None:
+            logger.error(f"SECURITY BLOCK: Forbidden pattern detected: {pattern}")
+            raise SecurityError(f"Blocked forbidden pattern: {pattern}")
         
         return func(self, plan_context, *args, **kwargs)
     
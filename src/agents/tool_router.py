@@ -68,6 +68,7 @@ class ToolContext(Protocol):
     def is_task_running(self, eid: str) -> bool: ...
     def get_routing_depth(self, eid: str) -> int: ...
     def increment_routing_depth(self, eid: str) -> int: ...
+    def record_dispatch(self, eid: str, signature: str) -> int: ...
     def is_dispatch_locked(self) -> bool: ...
     def get_active_agent_for_event(self, eid: str) -> str | None: ...
     def get_agent_instance(self, name: str) -> object | None: ...
@@ -94,6 +95,8 @@ class ToolContext(Protocol):
     def has_incident_been_created(self, eid: str) -> bool: ...
     def mark_incident_created(self, eid: str) -> None: ...
     def get_cached_journal(self, svc: str) -> Awaitable[list[str]]: ...
+    def get_cached_service(self, name: str) -> Awaitable[object | None]: ...
+    def get_cached_service_names(self) -> Awaitable[list[str]]: ...
 
     # === Timers ===
     def get_idle_timeout(self) -> IdleTimeoutPort: ...
@@ -106,6 +109,10 @@ class ToolContext(Protocol):
         self, event_id: str, turn: "ConversationTurn", event: "EventDocument | None" = None,
     ) -> int: ...
 
+    async def fanout_turn(
+        self, event_id: str, turn: "ConversationTurn", event: "EventDocument | None" = None,
+    ) -> None: ...
+
     async def broadcast(self, message: dict) -> None: ...
 
     async def emit_pulse(
@@ -30,6 +30,10 @@ logger = logging.getLogger("darwin.formatter")
 
 # Slack section text limit (Block Kit)
 _MAX_TEXT = 2900
+# Per-turn text cap in the Markdown report attachment
+_REPORT_TURN_CHARS = 300
+
+_DISPLAY_NAMES: dict[str, str] = {"brain": "FRIDAY", "jarvis": "JARVIS"}
 
 AGENT_COLORS: dict[str, str] = {
     "architect": "#3b82f6",
@@ -185,7 +189,7 @@ def format_turn(turn: "ConversationTurn", event_id: str = "") -> list[dict]:
     Returns a list of block dicts ready for chat_postMessage(blocks=...).
     """
     key = f"{turn.actor}.{turn.action}"
-    display_name = {"brain": "FRIDAY", "jarvis": "JARVIS"}.get(turn.actor, turn.actor)
+    display_name = _DISPLAY_NAMES.get(turn.actor, turn.actor)
     logger.debug("format_turn: %s", key)
     blocks: list[dict] = []
 
@@ -327,7 +331,7 @@ def get_agent_notification_text(turn: "ConversationTurn") -> str:
     so anything here appears as a separate visible line before the color bar.
     """
     emoji = AGENT_EMOJI.get(turn.actor, "\U0001f916")
-    display_name = {"brain": "FRIDAY", "jarvis": "JARVIS"}.get(turn.actor, turn.actor)
+    display_name = _DISPLAY_NAMES.get(turn.actor, turn.actor)
     return f"{emoji} {display_name}"
 
 
@@ -354,35 +358,35 @@ def build_event_report_md(event_doc: "EventDocument") -> str:
         "",
         "## Conversation",
     ]
+    cap = _REPORT_TURN_CHARS
     for t in event_doc.conversation:
-        name = t.user_name or {"brain": "FRIDAY", "jarvis": "JARVIS"}.get(t.actor, t.actor)
-        if t.actor == "user" and t.source == "automated":
-            name = "System"
+        automated = t.actor == "user" and t.source == "automated"
+        name = "System" if automated else (t.user_name or _DISPLAY_NAMES.get(t.actor, t.actor))
         lines.append(f"### Turn {t.turn} - {name} ({t.action})")
-        if t.actor == "user" and t.source == "automated":
-            text = (t.thoughts or "")[:300]
+        if automated:
+            text = (t.thoughts or "")[:cap]
             if text:
                 lines.append(f"**System Nudge:** {text}")
         elif t.actor == "user":
-            text = (t.thoughts or t.result or t.action or "")[:300]
+            text = (t.thoughts or t.result or t.action or "")[:cap]
             lines.append(f"**Message:** {text}")
         elif t.action in ("think", "thoughts"):
-            text = (t.thoughts or "")[:300]
+            text = (t.thoughts or "")[:cap]
             if text:
                 lines.append(f"**Internal:** {text}")
         elif t.action == "response":
-            text = (t.thoughts or "")[:300]
+            text = (t.thoughts or "")[:cap]
             if text:
                 lines.append(f"**FRIDAY:** {text}")
         elif t.action == "respond_jarvis":
-            text = (t.thoughts or "")[:300]
+            text = (t.thoughts or "")[:cap]
             if text:
                 lines.append(f"**Message to JARVIS:** {text}")
         elif t.action == "tool_result":
-            text = (t.result or t.evidence or t.thoughts or t.action or "")[:300]
+            text = (t.result or t.evidence or t.thoughts or t.action or "")[:cap]
             lines.append(f"**Evidence:** {text}")
         else:
-            text = (t.thoughts or t.result or t.action or "")[:300]
+            text = (t.thoughts or t.result or t.action or "")[:cap]
             lines.append(text)
         lines.append("")
     return "\n".join(lines)
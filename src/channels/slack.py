@@ -202,6 +202,15 @@ class SlackChannel:
         """
         from ..models import ConversationTurn
         prior_context = self._build_prior_context(event_doc)
+        ctx_turn = ConversationTurn(
+            turn=1, actor="brain", action="context",
+            thoughts=prior_context, source="system",
+        )
+        user_turn = ConversationTurn(
+            turn=2, actor="user", action="message",
+            thoughts=text, source="slack",
+            user_name=display_name,
+        )
         new_event_id = await self._blackboard.create_event(
             source="slack",
             service=event_doc.service,
@@ -213,22 +222,12 @@ class SlackChannel:
                 domain="disorder",
                 severity="info",
             ),
-        )
-        await self._blackboard.update_event_slack_context(
-            new_event_id, channel, thread_ts, user_id,
+            slack_channel_id=channel,
+            slack_thread_ts=thread_ts,
+            slack_user_id=user_id or None,
+            initial_turns=[ctx_turn, user_turn],
         )
         await self._blackboard.set_slack_mapping(channel, thread_ts, new_event_id)
-        ctx_turn = ConversationTurn(
-            turn=1, actor="brain", action="context",
-            thoughts=prior_context, source="system",
-        )
-        await self._blackboard.append_turn(new_event_id, ctx_turn)
-        user_turn = ConversationTurn(
-            turn=2, actor="user", action="message",
-            thoughts=text, source="slack",
-            user_name=display_name,
-        )
-        await self._blackboard.append_turn(new_event_id, user_turn)
         return new_event_id
 
     def _register_handlers(self) -> None:
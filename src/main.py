@@ -119,6 +119,7 @@ async def lifespan(app: FastAPI):
         
         aligner = Aligner(blackboard)
         archivist = Archivist()
+        archivist.checkpoint = blackboard
         set_archivist(archivist)
         architect = Architect()
         sysadmin = SysAdmin()
@@ -245,6 +246,9 @@ async def lifespan(app: FastAPI):
             headhunter_close_signal = asyncio.Event()
             brain.set_headhunter_close_signal(headhunter_close_signal)
 
+        # Prewarm the LLM adapter off the request path (first event would otherwise pay SDK init)
+        asyncio.create_task(brain.prewarm_adapter())
+
         # Start Brain event loop
         asyncio.create_task(brain.start_event_loop())
         logger.info("Brain event loop started - WebSocket conversation queue active")
@@ -517,6 +521,10 @@ async def lifespan(app: FastAPI):
     if redis and nightwatcher_observer:
         await nightwatcher_observer.stop()
         logger.info("NightwatcherObserver stopped")
+
+    # Release Archivist's pooled Qdrant connections
+    if redis:
+        await archivist.close()
     
     await close_redis()
     logger.info("Redis connection closed")
@@ -641,6 +649,7 @@ async def get_flow_metrics() -> FlowMetricsResponse:
         waiting_approval_events=flow.get("waiting_approval_events", 0),
         headhunter_pending=hh_pending,
         aligner_pending=aligner_pending_count,
+        archivist_pending=flow.get("archivist_pending", 0),
         wip_used=wip_used,
         wip_cap=wip_cap,
         wip_utilization_pct=round(wip_utilization_pct, 1),
@@ -8,6 +8,7 @@
 # 6. [Pattern]: get_points() retrieves by ID list. delete() removes by ID list. Both follow Qdrant REST conventions.
 # 7. [Pattern]: search() accepts optional keyword-only `filter` dict (Qdrant filter DSL). Passed as sibling key in request body.
 # 8. [Pattern]: create_payload_index() is idempotent -- 409 means index already exists (same as ensure_collection).
+# 9. [Pattern]: upsert_many() writes a list of {id, vector, payload} points in one request; upsert() is the single-point form.
 """
 Thin async wrapper around Qdrant REST API.
 No additional pip dependencies -- uses httpx (already installed).
@@ -71,18 +72,20 @@ class VectorStore:
         payload: dict[str, Any],
     ) -> None:
         """Store a vector + metadata payload."""
+        await self.upsert_many(
+            collection, [{"id": point_id, "vector": vector, "payload": payload}],
+        )
+
+    async def upsert_many(
+        self,
+        collection: str,
+        points: list[dict[str, Any]],
+    ) -> None:
+        """Store several {id, vector, payload} points in one request."""
         client = await self._get_client()
         resp = await client.put(
             f"/collections/{collection}/points",
-            json={
-                "points": [
-                    {
-                        "id": point_id,
-                        "vector": vector,
-                        "payload": payload,
-                    }
-                ]
-            },
+            json={"points": points},
         )
         resp.raise_for_status()
 
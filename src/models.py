@@ -6,6 +6,8 @@
 # 4. [Pattern]: EventInput.evidence uses field_validator to coerce plain str -> EventEvidence for backward compat with existing Redis data.
 # 5. [Pattern]: EventDocument.slack_* fields and ConversationTurn.source are Optional for backward compat with existing Redis data (pre-Slack events have None).
 # 6. [Pattern]: EventDocument.created_by_email is Optional[str] for backward compat -- existing Redis events deserialize with None.
+# 7. [Pattern]: Compare statuses by member (`status in OPEN_EVENT_STATUSES`, `status is EventStatus.CLOSED`), not via
+#    `.value` -- Enum.value is a descriptor lookup (~0.5us) paid per turn in conversation scans.
 """Pydantic schemas for Darwin Blackboard state layers."""
 from __future__ import annotations
 
@@ -226,6 +228,10 @@ class EventStatus(str, Enum):
     CLOSED = "closed"
 
 
+# Statuses of an event that is still being worked (dedup / ownership checks).
+OPEN_EVENT_STATUSES = frozenset({EventStatus.NEW, EventStatus.ACTIVE, EventStatus.DEFERRED})
+
+
 class EventMetrics(BaseModel):
     """Snapshot metrics attached to event evidence."""
     cpu: float = 0.0
@@ -308,6 +314,10 @@ class MessageStatus(str, Enum):
     PROCESSED = "processed"
 
 
+# Turns the Brain has not evaluated yet (read-receipt grey states).
+UNEVALUATED_MESSAGE_STATUSES = frozenset({MessageStatus.SENT, MessageStatus.DELIVERED})
+
+
 class ConversationTurn(BaseModel):
     """A single turn in an event conversation."""
     turn: int = Field(..., description="Turn number in conversation")
@@ -628,6 +638,7 @@ class FlowMetricsResponse(BaseModel):
     waiting_approval_events: int = 0
     headhunter_pending: int = 0
     aligner_pending: int = 0
+    archivist_pending: int = 0
     wip_used: int = 0
     wip_cap: int = 0
     wip_utilization_pct: float = 0.0
@@ -649,6 +660,7 @@ class FlowSnapshot(BaseModel):
     waiting_approval_events: int = 0
     headhunter_pending: int = 0
     aligner_pending: int = 0
+    archivist_pending: int = 0
     wip_used: int = 0
     wip_cap: int = 0
     wip_utilization_pct: float = 0.0
@@ -183,6 +183,7 @@ class FlowCollector:
             waiting_approval_events=flow.get("waiting_approval_events", 0),
             headhunter_pending=hh_pending,
             aligner_pending=aligner_pending,
+            archivist_pending=flow.get("archivist_pending", 0),
             wip_used=wip_used_raw,
             wip_cap=wip_cap,
             wip_utilization_pct=round(wip_used_raw / wip_cap * 100, 1) if wip_cap > 0 else 0.0,
@@ -67,6 +67,7 @@ class NightwatcherObserver:
         self._slack_notify = slack_notify
         self._broadcast: "Callable[[dict], Awaitable[None]] | None" = broadcast
         self._adapter = None
+        self._adapter_lock = asyncio.Lock()
         self._task: Optional[asyncio.Task] = None
         self._running = False
 
@@ -93,17 +94,14 @@ class NightwatcherObserver:
 
     async def _get_adapter(self):
         """Lazy-load LLM adapter (Gemini Flash for Nightwatcher)."""
-        if self._adapter is None:
-            try:
-                from ..agents.llm import create_adapter
-                project = os.getenv("GCP_PROJECT", "")
-                location = os.getenv("GCP_LOCATION", "global")
-                model = os.getenv("LLM_MODEL_NIGHTWATCHER", "gemini-3.6-flash")
-                self._adapter = create_adapter("gemini", project, location, model)
-                logger.info("Nightwatcher LLM adapter: gemini/%s", model)
-            except Exception as e:
-                logger.warning("Nightwatcher LLM adapter failed: %s", e)
-        return self._adapter
+        from ..agents.llm import get_or_create_adapter
+        return await get_or_create_adapter(
+            self, self._adapter_lock, "gemini",
+            os.getenv("GCP_PROJECT", ""),
+            os.getenv("GCP_LOCATION", "global"),
+            os.getenv("LLM_MODEL_NIGHTWATCHER", "gemini-3.6-flash"),
+            label="Nightwatcher",
+        )
 
     async def _poll_loop(self) -> None:
         from croniter import croniter
@@ -6,6 +6,8 @@
 # 4. [Constraint]: 30s asyncio.timeout per LLM call, 15s per chart render. Failures get
 #    placeholder text/blank chart rather than propagating -- keeps the caller's outer 90s
 #    report timeout (observations_mgmt.py) from being consumed by any single slow step.
+#    LLM calls use the SDK's native async client (client.aio) so the timeout really cancels the request;
+#    a to_thread'ed sync call would keep running (and hold a pool worker) after the timeout fired.
 # 5. [Pattern]: Charts use dark theme matching Darwin UI (bg=#0f172a).
 """LLM-powered observation analysis report with embedded SVG charts."""
 from __future__ import annotations
@@ -60,8 +62,7 @@ async def _analyze_series(client, model: str, series: dict) -> str:
         f"{_SERIES_PROMPT}"
     )
     async with asyncio.timeout(30):
-        response = await asyncio.to_thread(
-            client.models.generate_content,
+        response = await client.aio.models.generate_content(
             model=model,
             contents=prompt,
             config={"max_output_tokens": 512, "temperature": 0.2},
@@ -76,8 +77,7 @@ async def _summarize(client, model: str, analyses: list[str], context: str) -> s
         prompt += f"User context: {context}\n\n"
     prompt += _SUMMARY_PROMPT
     async with asyncio.timeout(30):
-        response = await asyncio.to_thread(
-            client.models.generate_content,
+        response = await client.aio.models.generate_content(
             model=model,
             contents=prompt,
             config={"max_output_tokens": 1024, "temperature": 0.2},
@@ -45,6 +45,13 @@ async def create_chat_event(
     Poll GET /queue/{event_id} to track conversation progress.
     """
     try:
+        # User message is the first conversation turn, written with the event
+        user_turn = ConversationTurn(
+            turn=1,
+            actor="user",
+            action="message",
+            thoughts=request.message,
+        )
         event_id = await blackboard.create_event(
             source="chat",
             service=request.service,
@@ -56,15 +63,8 @@ async def create_chat_event(
                 domain="disorder",
                 severity="info",
             ),
+            initial_turns=[user_turn],
         )
-        # Add user message as the first conversation turn
-        user_turn = ConversationTurn(
-            turn=1,
-            actor="user",
-            action="message",
-            thoughts=request.message,
-        )
-        await blackboard.append_turn(event_id, user_turn)
         logger.info(f"Chat event created: {event_id} for service {request.service}")
         return ChatEventResponse(event_id=event_id)
     except Exception as e:
@@ -7,6 +7,7 @@ Provides the Architecture Graph visualization (Visualization #1).
 from __future__ import annotations
 
 import logging
+from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException
 
@@ -21,13 +22,23 @@ router = APIRouter(prefix="/topology", tags=["topology"])
 
 @router.get("/")
 async def get_topology(
+    detail: Literal["summary", "full"] = "full",
     blackboard: BlackboardState = Depends(get_blackboard),
 ) -> dict:
     """
     Get current topology with full service details.
     
     Returns services (with metrics), edges, and topology info.
+    detail="summary" returns only service count + names -- no per-service
+    fetch or model_dump (used by status indicators that just poll liveness).
     """
+    if detail == "summary":
+        names = await blackboard.get_services()
+        return {
+            "total_services": len(names),
+            "service_names": names,
+        }
+
     topology = await blackboard.get_topology()
     services = await blackboard.get_all_services()
     
@@ -6,6 +6,9 @@
 # 4. [Pattern]: reconcile_fn receives event_id only. All state lives in the Brain, not the scheduler.
 # 5. [Constraint]: Scheduler NEVER catches exceptions from reconcile_fn -- they propagate to worker error handler.
 # 6. [Pattern]: mark_done must be called after reconcile_fn completes (success or failure) to release the key.
+# 7. [Pattern]: debounce_sec > 0 delays the queue put (loop.call_later) but marks the key pending at once, so a
+#    burst of enqueues for one event (agent result + huddle + user turn) collapses into a single reconcile that
+#    reads the settled state. Default 0 keeps enqueue synchronous (unit tests, no running loop needed).
 """
 ReconcileScheduler: Kubernetes controller-runtime style fair event scheduler.
 
@@ -35,9 +38,12 @@ class FairQueue:
     - FIFO ordering for distinct keys.
     - enqueue() is a no-op if the key is already pending or inflight.
     - mark_done() releases the key for future re-enqueue.
+    - With debounce_sec > 0 a new key becomes dequeueable only after that delay;
+      enqueues of the same key inside the window are deduped like any pending key.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, debounce_sec: float = 0.0) -> None:
+        self._debounce_sec = debounce_sec
         self._queue: asyncio.Queue[str] = asyncio.Queue()
         self._pending: set[str] = set()
         self._inflight: set[str] = set()
@@ -50,7 +56,10 @@ class FairQueue:
             self._dedup_count += 1
             return False
         self._pending.add(event_id)
-        self._queue.put_nowait(event_id)
+        if self._debounce_sec > 0:
+            asyncio.get_running_loop().call_later(self._debounce_sec, self._queue.put_nowait, event_id)
+        else:
+            self._queue.put_nowait(event_id)
         self._total_enqueued += 1
         return True
 
@@ -98,12 +107,13 @@ class ReconcileScheduler:
         workers: int = 4,
         on_error: Callable[[str, Exception], Awaitable[None]] | None = None,
         stats_interval: float = 60.0,
+        debounce_sec: float = 0.0,
     ) -> None:
         self._reconcile_fn = reconcile_fn
         self._worker_count = workers
         self._on_error = on_error
         self._stats_interval = stats_interval
-        self._queue = FairQueue()
+        self._queue = FairQueue(debounce_sec=debounce_sec)
         self._triggers: list[Trigger] = []
         self._worker_tasks: list[asyncio.Task] = []
         self._trigger_tasks: list[asyncio.Task] = []
@@ -1,7 +1,8 @@
 # BlackBoard/src/state/blackboard.py
 # @ai-rules:
 # 1. [Constraint]: Redis mutations use WATCH/MULTI/EXEC or Lua scripts for atomicity. Catch redis.WatchError specifically -- NEVER bare Exception.
-# 2. [Pattern]: mark_turns_delivered/evaluated/mark_turn_status/update_turn_evidence follow the pipeline pattern from append_turn.
+# 2. [Pattern]: mark_turns_delivered/evaluated/mark_turn_status/update_turn_evidence follow the pipeline pattern from append_turns
+#    (append_turn delegates to it -- one WATCH/MULTI numbering loop).
 # 3. [Gotcha]: close_event uses WATCH/MULTI/EXEC to prevent turn loss from concurrent writers.
 # 4. [Pattern]: Ops journal (darwin:journal:{service}) is a capped LIST (RPUSH + LTRIM). Brain caches reads with 60s TTL.
 # 5. [Pattern]: Journal writes happen in 3 places: Brain._close_and_broadcast(), queue.py close_event_by_user(), Brain._startup_cleanup().
@@ -12,6 +13,17 @@
 # 10. [Pattern]: Lua scripts registered once at __init__ via register_script() — used for atomic compare-and-delete (escalation flag) and atomic observation rename-and-reindex.
 # 11. [Pattern]: Field Notes Notebook (darwin:notebook HASH). RENAMENX for atomic drain; ResponseError for missing-source guard. Quarantine via RENAME after MAX_DIGEST_RETRIES. Retry counter is Redis INCR with TTL (survives pod restart).
 # 12. [Pattern]: Aligner pending queue — darwin:aligner:pending ZSET (ZADD NX score=first_seen) + darwin:aligner:pending:meta HASH. Pipelined stage/commit/restage. remove_service() auto-cleans health pending.
+# 13. [Pattern]: Archivist checkpoint — darwin:archivist:pending HASH (point_id -> {collection, point}). Staged before the
+#     Qdrant upsert, committed (HDEL) after it; Archivist.backfill_archives replays leftovers on startup.
+#     Bounded while Qdrant is down: staging stops at ARCHIVE_PENDING_MAX points and the key expires
+#     ARCHIVE_PENDING_TTL_SEC after the last stage. HLEN is surfaced as get_flow_metrics()["archivist_pending"].
+# 14. [Pattern]: EventDocument round-trips via model_dump_json()/model_validate_json() (pydantic-core, no dict/stdlib
+#     json hop). record_event's darwin:events ZSET stores ArchitectureEvent, not EventDocument -- left on json.dumps.
+# 15. [Pattern]: get_turn_count reads len(conversation) with a bare orjson parse -- no model validation. It is a
+#     hint for pre-append turn numbers only; append_turn still assigns the authoritative number inside WATCH/MULTI.
+# 16. [Pattern]: transition_event_status(turn=, clear_keys=) folds a turn append and side-key DELs into the status
+#     MULTI (deferred wake: flip + notification + defer_until DEL in one round). Not Lua -- cjson would re-encode
+#     the embedded conversation lossily; keep the WATCH/MULTI pattern of rule 1.
 """
 Blackboard State Repository - Central state management for Darwin Brain.
 
@@ -39,6 +51,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
+import orjson
 from redis.exceptions import ResponseError, WatchError
 
 from ..models import (
@@ -185,6 +198,9 @@ redis.call('SADD', KEYS[3], ARGV[2])
 return 1
 """
 
+    # (input fingerprint, rendered diagram) from the last generate_mermaid() call
+    _mermaid_cache: tuple[tuple, str] | None = None
+
     def __init__(self, redis: Redis):
         self.redis = redis
         self._clear_escalation_script = self.redis.register_script(
@@ -588,6 +604,18 @@ return 1
         
         if not filtered_services:
             return "graph TD\n    Empty[No services registered]"
+
+        ticket_nodes = await self._get_ticket_nodes()
+
+        # Rendering is O(services + edges) string work; reuse the last diagram
+        # when every rendered input is unchanged (dashboards poll this).
+        fingerprint = (
+            tuple((svc, tuple(service_data[svc].values())) for svc in filtered_services),
+            tuple((src, tuple(tgts)) for src, tgts in topology.edges.items()),
+            tuple((t.event_id, t.status, t.current_agent, t.turn_count) for t in ticket_nodes),
+        )
+        if self._mermaid_cache is not None and self._mermaid_cache[0] == fingerprint:
+            return self._mermaid_cache[1]
         
         lines = ["graph TD"]
         
@@ -629,7 +657,6 @@ return 1
                 defined_nodes.add(service)
         
         # Add ticket nodes from active general/headhunter events
-        ticket_nodes = await self._get_ticket_nodes()
         ticket_ids: list[str] = []
         for ticket in ticket_nodes:
             tid = f"ticket_{ticket.event_id.replace('-', '_')}"
@@ -657,7 +684,9 @@ return 1
         for tid in ticket_ids:
             lines.append(f"    class {tid} ticket")
         
-        return "\n".join(lines)
+        mermaid = "\n".join(lines)
+        self._mermaid_cache = (fingerprint, mermaid)
+        return mermaid
     
     # =========================================================================
     # Metadata Layer (Service Health)
@@ -1082,23 +1111,25 @@ return 1
         """
         Append a message to a conversation.
         
-        Messages are stored with incrementing indices (msg:0, msg:1, etc.)
+        Messages are stored with incrementing indices (msg:0, msg:1, etc.).
+        Index assignment and TTL refresh share one WATCH/MULTI/EXEC, so
+        concurrent appends cannot reuse a msg:N slot.
         """
         key = f"darwin:conversation:{conversation_id}"
-        
-        # Get current message count
-        data = await self.redis.hgetall(key)
-        msg_count = len([k for k in data.keys() if k.startswith("msg:")])
-        
-        # Add new message
-        await self.redis.hset(
-            key,
-            f"msg:{msg_count}",
-            json.dumps(message.model_dump())
-        )
-        
-        # Refresh TTL on each message
-        await self.redis.expire(key, CONVERSATION_TTL_SECONDS)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    fields = await pipe.hkeys(key)
+                    msg_count = sum(1 for k in fields if k.startswith("msg:"))
+                    pipe.multi()
+                    pipe.hset(key, f"msg:{msg_count}", json.dumps(message.model_dump()))
+                    # Refresh TTL on each append
+                    pipe.expire(key, CONVERSATION_TTL_SECONDS)
+                    await pipe.execute()
+                    break
+                except WatchError:
+                    continue
         
         logger.debug(
             f"Appended {message.role} message to conversation {conversation_id}"
@@ -1140,12 +1171,17 @@ return 1
         slack_channel_id: Optional[str] = None,
         slack_thread_ts: Optional[str] = None,
         slack_user_id: Optional[str] = None,
+        initial_turns: Optional[List[ConversationTurn]] = None,
     ) -> str:
         """Create a new event and add to the queue for Brain triage.
 
         Evidence contract: callers MUST pass a structured EventEvidence object.
         Plain strings are accepted only for backward compat (_coerce_evidence).
 
+        initial_turns are written with the document (numbered 1..n) so callers
+        seeding the opening user/context turns skip a follow-up append_turn
+        round trip, and Brain never dequeues the event before they exist.
+
         Source patterns:
           aligner    -- source_type="aligner", LLM domain/severity, EventMetrics
           chat/slack -- source_type="chat"/"slack", domain="complicated", severity="info"
@@ -1168,10 +1204,13 @@ return 1
             slack_thread_ts=slack_thread_ts,
             slack_user_id=slack_user_id,
         )
+        for i, turn in enumerate(initial_turns or [], 1):
+            turn.turn = i
+            event.conversation.append(turn)
         # Store event document
         await self.redis.set(
             f"{self.EVENT_PREFIX}{event.id}",
-            json.dumps(event.model_dump())
+            event.model_dump_json()
         )
         # Add to active set
         await self.redis.sadd(self.EVENT_ACTIVE, event.id)
@@ -1185,7 +1224,21 @@ return 1
         data = await self.redis.get(f"{self.EVENT_PREFIX}{event_id}")
         if not data:
             return None
-        return EventDocument(**json.loads(data))
+        return EventDocument.model_validate_json(data)
+
+    async def get_turn_count(self, event_id: str) -> int:
+        """Conversation length of an event (0 if missing) without building the EventDocument."""
+        data = await self.redis.get(f"{self.EVENT_PREFIX}{event_id}")
+        if not data:
+            return 0
+        return len(orjson.loads(data).get("conversation") or ())
+
+    async def get_events(self, event_ids: list[str]) -> list[Optional[EventDocument]]:
+        """Batch get_event: one MGET round trip, results aligned with event_ids (None = missing)."""
+        if not event_ids:
+            return []
+        raw_values = await self.redis.mget([f"{self.EVENT_PREFIX}{eid}" for eid in event_ids])
+        return [EventDocument.model_validate_json(raw) if raw else None for raw in raw_values]
 
     async def append_turn(
         self,
@@ -1198,6 +1251,23 @@ return 1
         current conversation length.  Returns the assigned turn number,
         or 0 if the event no longer exists (fail-closed).
         """
+        assigned = await self.append_turns(event_id, [turn])
+        if not assigned:
+            return 0
+        logger.debug(f"Appended turn {turn.turn} ({turn.actor}.{turn.action}) to event {event_id}")
+        return assigned[0]
+
+    async def append_turns(
+        self,
+        event_id: str,
+        turns: list[ConversationTurn],
+    ) -> list[int]:
+        """Append several turns in one WATCH/MULTI round; the single loop behind append_turn.
+
+        Each ``turn.turn`` is assigned from the current conversation length.
+        Returns the assigned turn numbers in order, or [] if the event no
+        longer exists (fail-closed).
+        """
         key = f"{self.EVENT_PREFIX}{event_id}"
         async with self.redis.pipeline(transaction=True) as pipe:
             while True:
@@ -1205,19 +1275,19 @@ return 1
                     await pipe.watch(key)
                     data = await pipe.get(key)
                     if not data:
-                        logger.warning(f"Event {event_id} not found for append_turn")
-                        return 0
-                    event = EventDocument(**json.loads(data))
-                    turn.turn = len(event.conversation) + 1
-                    event.conversation.append(turn)
+                        logger.warning(f"Event {event_id} not found for append_turns")
+                        return []
+                    event = EventDocument.model_validate_json(data)
+                    for turn in turns:
+                        turn.turn = len(event.conversation) + 1
+                        event.conversation.append(turn)
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
                     continue
-        logger.debug(f"Appended turn {turn.turn} ({turn.actor}.{turn.action}) to event {event_id}")
-        return turn.turn
+        return [turn.turn for turn in turns]
 
     async def mark_turns_delivered(
         self,
@@ -1237,7 +1307,7 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         return 0
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     changed = 0
                     for t in event.conversation[:up_to_turn]:
                         if t.status == MessageStatus.SENT:
@@ -1246,7 +1316,7 @@ return 1
                     if changed == 0:
                         return 0
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     logger.debug(f"Marked {changed} turns DELIVERED for event {event_id}")
                     return changed
@@ -1275,7 +1345,7 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         return 0
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     scope = event.conversation[:up_to_turn] if up_to_turn is not None else event.conversation
                     changed = 0
                     for t in scope:
@@ -1285,7 +1355,7 @@ return 1
                     if changed == 0:
                         return 0
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     logger.debug(f"Marked {changed} turns EVALUATED for event {event_id}")
                     return changed
@@ -1317,7 +1387,7 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         return 0
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     scope = event.conversation[:up_to_turn] if up_to_turn is not None else event.conversation
                     changed = 0
                     for t in scope:
@@ -1330,7 +1400,7 @@ return 1
                     if changed == 0:
                         return 0
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     logger.debug(f"Marked {changed} turns {status.value.upper()} for event {event_id}")
                     return changed
@@ -1356,7 +1426,7 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         return False
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     found = False
                     for t in event.conversation:
                         if t.turn == turn_number:
@@ -1366,7 +1436,7 @@ return 1
                     if not found:
                         return False
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     logger.debug(f"Marked turn {turn_number} as {status.value} for event {event_id}")
                     return True
@@ -1392,7 +1462,7 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         return False
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     found = False
                     for t in event.conversation:
                         if t.turn == turn_num:
@@ -1402,7 +1472,7 @@ return 1
                     if not found:
                         return False
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     logger.debug(f"Updated turn {turn_num} evidence for event {event_id}")
                     return True
@@ -1414,11 +1484,18 @@ return 1
         event_id: str,
         from_status: str,
         to_status: "EventStatus",
+        *,
+        turn: Optional[ConversationTurn] = None,
+        clear_keys: tuple[str, ...] = (),
     ) -> bool:
         """Atomically transition an event's status using WATCH/MULTI/EXEC.
 
         Returns True if the transition succeeded, False if the current status
         didn't match from_status (no-op).
+
+        ``turn`` (optional) is appended in the same transaction, numbered like
+        append_turn. ``clear_keys`` are DELeted in the same MULTI, only when the
+        transition succeeds (e.g. the defer_until timer on deferred -> active).
         """
         key = f"{self.EVENT_PREFIX}{event_id}"
         async with self.redis.pipeline(transaction=True) as pipe:
@@ -1429,13 +1506,18 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for status transition")
                         return False
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     if event.status.value != from_status:
                         logger.debug(f"Event {event_id} status is '{event.status.value}', expected '{from_status}' -- skipping transition")
                         return False
                     event.status = to_status
+                    if turn is not None:
+                        turn.turn = len(event.conversation) + 1
+                        event.conversation.append(turn)
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
+                    if clear_keys:
+                        pipe.delete(*clear_keys)
                     await pipe.execute()
                     break
                 except WatchError:
@@ -1445,6 +1527,7 @@ return 1
 
     async def defer_event_status(
         self, event_id: str, defer_until: float, delay: int,
+        turn: Optional[ConversationTurn] = None,
     ) -> bool:
         """Atomically set event status to DEFERRED and store defer_until timestamp.
 
@@ -1452,9 +1535,13 @@ return 1
         transition_event_status). Also sets the defer_until key with TTL.
         Returns True if the event was found and updated.
 
-        while True (no retry cap): caller appends a "defer" turn BEFORE calling
-        this method, so failure would leave conversation/state divergent.
-        WatchError means concurrent modification — self-resolves on next iteration.
+        ``turn`` (optional) is appended in the same transaction, numbered like
+        append_turn, so the "defer" turn and the status flip land together in
+        one WATCH round trip instead of two.
+
+        while True (no retry cap): a lost update would leave conversation/state
+        divergent. WatchError means concurrent modification — self-resolves on
+        next iteration.
         """
         key = f"{self.EVENT_PREFIX}{event_id}"
         async with self.redis.pipeline(transaction=True) as pipe:
@@ -1464,10 +1551,13 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         return False
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     event.status = EventStatus.DEFERRED
+                    if turn is not None:
+                        turn.turn = len(event.conversation) + 1
+                        event.conversation.append(turn)
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     pipe.set(
                         f"{key}:defer_until",
                         str(defer_until),
@@ -1538,11 +1628,13 @@ return 1
             pipe.llen(self.EVENT_QUEUE)
             pipe.scard(self.EVENT_ACTIVE)
             pipe.scard(self.EVENT_WAITING_APPROVAL)
-            queue_depth, active_count, waiting_approval = await pipe.execute()
+            pipe.hlen(self.ARCHIVE_PENDING)
+            queue_depth, active_count, waiting_approval, archivist_pending = await pipe.execute()
         return {
             "queue_depth": queue_depth,
             "active_events": active_count,
             "waiting_approval_events": waiting_approval,
+            "archivist_pending": archivist_pending,
         }
 
     # =========================================================================
@@ -1621,6 +1713,7 @@ return 1
                 waiting_approval_events=round(sum(s.waiting_approval_events for s in group) / n),
                 headhunter_pending=round(sum(s.headhunter_pending for s in group) / n),
                 aligner_pending=round(sum(s.aligner_pending for s in group) / n),
+                archivist_pending=round(sum(s.archivist_pending for s in group) / n),
                 wip_used=round(sum(s.wip_used for s in group) / n),
                 wip_cap=round(sum(s.wip_cap for s in group) / n),
                 wip_utilization_pct=sum(s.wip_utilization_pct for s in group) / n,
@@ -1671,11 +1764,11 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     for field, value in fields.items():
                         setattr(event, field, value)
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -1755,7 +1848,7 @@ return 1
         for eid, raw in zip(event_ids, raw_values):
             if not raw:
                 continue
-            event = EventDocument(**json.loads(raw))
+            event = EventDocument.model_validate_json(raw)
 
             if (event.service != "general"
                     and event.source != "headhunter"
@@ -1796,7 +1889,7 @@ return 1
 
             defer_until, defer_started_at = await self.resolve_defer_timestamps(
                 eid, event,
-            ) if event.status.value == "deferred" else (None, None)
+            ) if event.status is EventStatus.DEFERRED else (None, None)
 
             tickets.append(TicketNode(
                 event_id=eid,
@@ -1844,7 +1937,7 @@ return 1
         for (eid, close_time), raw in zip(closed_with_scores, docs):
             if not raw:
                 continue
-            event = EventDocument(**json.loads(raw))
+            event = EventDocument.model_validate_json(raw)
             if event.service != service:
                 continue
             # Get closing summary from last turn
@@ -1874,7 +1967,7 @@ return 1
         for raw in docs:
             if not raw:
                 continue
-            event = EventDocument(**json.loads(raw))
+            event = EventDocument.model_validate_json(raw)
             if event.source == source:
                 results.append(event)
         return results
@@ -1958,7 +2051,7 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         break
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     event.closed_at = time.time()
                     event.status = EventStatus.CLOSED
                     if token_usage:
@@ -1972,7 +2065,7 @@ return 1
                     )
                     event.conversation.append(close_turn)
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -1986,8 +2079,15 @@ return 1
     # Approval Parking (park/resume for events awaiting human authorization)
     # =========================================================================
 
-    async def park_for_approval(self, event_id: str) -> None:
-        """Move event from active to waiting_approval set + update status atomically."""
+    async def park_for_approval(
+        self, event_id: str, turn: Optional[ConversationTurn] = None,
+    ) -> Optional[EventDocument]:
+        """Move event from active to waiting_approval set + update status atomically.
+
+        ``turn`` (optional) is appended inside the same transaction, numbered
+        like append_turn. Returns the parked event as read inside the
+        transaction (None if missing), so callers don't need a second GET.
+        """
         key = f"{self.EVENT_PREFIX}{event_id}"
         async with self.redis.pipeline(transaction=True) as pipe:
             while True:
@@ -1996,13 +2096,16 @@ return 1
                     data = await pipe.get(key)
                     if not data:
                         logger.warning(f"park_for_approval: {event_id} not found")
-                        return
-                    event = EventDocument(**json.loads(data))
-                    if event.status == EventStatus.WAITING_APPROVAL:
-                        return  # Already parked, idempotent
+                        return None
+                    event = EventDocument.model_validate_json(data)
+                    if event.status == EventStatus.WAITING_APPROVAL and turn is None:
+                        return event  # Already parked, idempotent
                     event.status = EventStatus.WAITING_APPROVAL
+                    if turn is not None:
+                        turn.turn = len(event.conversation) + 1
+                        event.conversation.append(turn)
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     pipe.srem(self.EVENT_ACTIVE, event_id)
                     pipe.sadd(self.EVENT_WAITING_APPROVAL, event_id)
                     await pipe.execute()
@@ -2010,6 +2113,7 @@ return 1
                 except WatchError:
                     continue
         logger.info(f"Parked event for approval: {event_id}")
+        return event
 
     async def resume_from_approval(self, event_id: str) -> None:
         """Move event from waiting_approval back to active set + update status atomically."""
@@ -2022,10 +2126,10 @@ return 1
                     if not data:
                         logger.warning(f"resume_from_approval: {event_id} not found")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     event.status = EventStatus.ACTIVE
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     pipe.srem(self.EVENT_WAITING_APPROVAL, event_id)
                     pipe.sadd(self.EVENT_ACTIVE, event_id)
                     await pipe.execute()
@@ -2056,13 +2160,13 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for slack context update")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     event.slack_channel_id = channel_id
                     event.slack_thread_ts = thread_ts
                     if user_id:
                         event.slack_user_id = user_id
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -2080,11 +2184,11 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for domain update")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     if isinstance(event.event.evidence, EventEvidence):
                         event.event.evidence.brain_domain = brain_domain
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -2103,10 +2207,10 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for phase update")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     event.brain_phase = brain_phase
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -2129,7 +2233,7 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for gitlab_context update")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     if isinstance(event.event.evidence, EventEvidence):
                         if event.event.evidence.github_context is not None:
                             logger.warning(f"Rejecting gitlab_context update on event {event_id}: github_context already set")
@@ -2140,7 +2244,7 @@ return 1
                         if "severity" in updates:
                             event.event.evidence.severity = updates["severity"]
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -2163,7 +2267,7 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for github_context update")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     if isinstance(event.event.evidence, EventEvidence):
                         if event.event.evidence.gitlab_context is not None:
                             logger.warning(f"Rejecting github_context update on event {event_id}: gitlab_context already set")
@@ -2174,7 +2278,7 @@ return 1
                         if "severity" in updates:
                             event.event.evidence.severity = updates["severity"]
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -2196,13 +2300,13 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for kargo_context update")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     if isinstance(event.event.evidence, EventEvidence):
                         kc = event.event.evidence.kargo_context or {}
                         kc.update(updates)
                         event.event.evidence.kargo_context = kc
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -2220,11 +2324,11 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for severity update")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     if isinstance(event.event.evidence, EventEvidence):
                         event.event.evidence.brain_severity = brain_severity
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -2244,11 +2348,11 @@ return 1
                     if not data:
                         logger.warning(f"Event {event_id} not found for sticky_notes update")
                         return
-                    event = EventDocument(**json.loads(data))
+                    event = EventDocument.model_validate_json(data)
                     event.sticky_notes = sticky_notes
                     event.unread_notes = unread_notes
                     pipe.multi()
-                    pipe.set(key, json.dumps(event.model_dump()))
+                    pipe.set(key, event.model_dump_json())
                     await pipe.execute()
                     break
                 except WatchError:
@@ -2835,6 +2939,52 @@ return 1
         pipe.hset(self.ALIGNER_PENDING_META, key, json.dumps(metadata))
         await pipe.execute()
 
+    # =========================================================================
+    # Archivist Checkpoint (HASH point_id -> {collection, point})
+    # =========================================================================
+    # Archive points (summary + vector) are staged here before the Qdrant write
+    # and removed once it succeeds, so a crash or Qdrant outage between the
+    # summary LLM call and the upsert does not cost a re-summarization.
+
+    ARCHIVE_PENDING = "darwin:archivist:pending"
+    ARCHIVE_PENDING_MAX = int(os.getenv("ARCHIVIST_PENDING_MAX", "5000"))
+    ARCHIVE_PENDING_TTL_SEC = 7 * 86400
+
+    async def stage_archive_point(self, collection: str, point: dict) -> bool:
+        """Record an archive point ahead of its Qdrant upsert.
+
+        Returns False (nothing staged) once ARCHIVE_PENDING_MAX points are
+        waiting -- a long Qdrant outage must not grow the HASH without bound.
+        """
+        if await self.redis.hlen(self.ARCHIVE_PENDING) >= self.ARCHIVE_PENDING_MAX:
+            return False
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(
+                self.ARCHIVE_PENDING, point["id"],
+                json.dumps({"collection": collection, "point": point}),
+            )
+            pipe.expire(self.ARCHIVE_PENDING, self.ARCHIVE_PENDING_TTL_SEC)
+            await pipe.execute()
+        return True
+
+    async def get_staged_archive_points(self) -> list[tuple[str, dict]]:
+        """Return (collection, point) for every staged, not yet committed archive point."""
+        raw = await self.redis.hgetall(self.ARCHIVE_PENDING)
+        staged = []
+        for point_id, value in raw.items():
+            try:
+                entry = json.loads(value)
+                staged.append((entry["collection"], entry["point"]))
+            except (json.JSONDecodeError, KeyError, TypeError):
+                logger.warning(f"Dropping malformed archive checkpoint {point_id}")
+                await self.redis.hdel(self.ARCHIVE_PENDING, point_id)
+        return staged
+
+    async def commit_archive_points(self, point_ids: list[str]) -> None:
+        """Remove archive points whose Qdrant upsert succeeded."""
+        if point_ids:
+            await self.redis.hdel(self.ARCHIVE_PENDING, *point_ids)
+
     # =========================================================================
     # Observations (FRIDAY numeric series -- event-scoped + global timeline)
     # =========================================================================
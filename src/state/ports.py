@@ -335,7 +335,7 @@ class CortexRepository(Protocol):
 class EventRepository(Protocol):
     """Port for the core event lifecycle: creation, conversation, queue, and closure.
 
-    42 methods. The largest domain — all WATCH/MULTI operations on EventDocument stay here.
+    43 methods. The largest domain — all WATCH/MULTI operations on EventDocument stay here.
     Cross-domain: close_event interacts with Topology (get_service),
     Observations (cleanup), and Reports (persist_report) — resolved
     at BlackboardState facade level.
@@ -354,14 +354,21 @@ class EventRepository(Protocol):
         slack_channel_id: Optional[str] = None,
         slack_thread_ts: Optional[str] = None,
         slack_user_id: Optional[str] = None,
+        initial_turns: Optional[list[ConversationTurn]] = None,
     ) -> str: ...
 
     async def get_event(self, event_id: str) -> Optional[EventDocument]: ...
 
+    async def get_events(self, event_ids: list[str]) -> list[Optional[EventDocument]]: ...
+
+    async def get_turn_count(self, event_id: str) -> int: ...
+
     # --- Conversation turns (WATCH/MULTI) ---
 
     async def append_turn(self, event_id: str, turn: ConversationTurn) -> int: ...
 
+    async def append_turns(self, event_id: str, turns: list[ConversationTurn]) -> list[int]: ...
+
     async def mark_turns_delivered(self, event_id: str, up_to_turn: int) -> int: ...
 
     async def mark_turns_evaluated(
@@ -380,6 +387,7 @@ class EventRepository(Protocol):
 
     async def transition_event_status(
         self, event_id: str, from_status: str, to_status: EventStatus,
+        *, turn: Optional[ConversationTurn] = None, clear_keys: tuple[str, ...] = (),
     ) -> bool: ...
 
     async def close_event(
@@ -401,7 +409,9 @@ class EventRepository(Protocol):
 
     # --- Approval parking ---
 
-    async def park_for_approval(self, event_id: str) -> None: ...
+    async def park_for_approval(
+        self, event_id: str, turn: Optional[ConversationTurn] = None,
+    ) -> Optional[EventDocument]: ...
 
     async def resume_from_approval(self, event_id: str) -> None: ...
 
@@ -453,6 +463,7 @@ class EventRepository(Protocol):
 
     async def defer_event_status(
         self, event_id: str, defer_until: float, delay: int,
+        turn: Optional[ConversationTurn] = None,
     ) -> bool: ...
 
     # --- Closed event queries ---
@@ -0,0 +1,42 @@
+# tests/test_agent_client_http.py
+# @ai-rules:
+# 1. [Constraint]: No sidecar -- httpx.MockTransport answers /health in-process.
+# 2. [Pattern]: AgentClient constructed directly (thin subclasses only set names/urls).
+"""Verify AgentClient.health() reuses one pooled httpx client and close() releases it."""
+from __future__ import annotations
+
+import httpx
+
+from src.agents.base_client import AgentClient
+
+
+def _client() -> AgentClient:
+    return AgentClient("sysadmin", "UNUSED_SIDECAR_URL_ENV", "http://sidecar:9000", "/tmp")
+
+
+async def test_health_reuses_shared_client():
+    agent = _client()
+    seen: list[str] = []
+    agent._http = first = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda req: seen.append(str(req.url)) or httpx.Response(200)
+    ))
+    assert await agent.health() is True
+    assert await agent.health() is True
+    assert agent._get_http() is first
+    assert seen == ["http://sidecar:9000/health"] * 2
+    await agent.close()
+    assert agent._http is None
+
+
+async def test_get_http_is_lazy_and_cached():
+    agent = _client()
+    assert agent._http is None
+    assert agent._get_http() is agent._get_http()
+    await agent.close()
+
+
+async def test_health_false_on_non_200():
+    agent = _client()
+    agent._http = httpx.AsyncClient(transport=httpx.MockTransport(lambda req: httpx.Response(503)))
+    assert await agent.health() is False
+    await agent.close()
@@ -0,0 +1,473 @@
+# tests/test_agent_client_ws.py
+# @ai-rules:
+# 1. [Constraint]: No sidecar -- _FakeWS replays scripted frames and records sends.
+# 2. [Pattern]: Call _process_inner directly (process() is a thin wrapper). _ensure_connected is stubbed;
+#    _attach() starts the real _read_loop over the fake socket.
+"""AgentClient WebSocket receive-loop behaviour against a scripted sidecar."""
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import orjson
+import pytest
+
+from src.agents.base_client import AgentClient, _TaskRun
+
+
+class _FakeWS:
+    """Replays frames once the first message is sent. A None frame is a short silence; bytes go out raw."""
+
+    def __init__(self, frames: list[dict | bytes | None]):
+        self._frames = [f if isinstance(f, bytes) else orjson.dumps(f) for f in frames]
+        self._sent_any = asyncio.Event()
+        self.sent: list[bytes] = []
+        self.closed = False
+
+    async def send(self, data) -> None:
+        self.sent.append(data)
+        self._sent_any.set()
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await self._sent_any.wait()
+        while self._frames:
+            frame = self._frames.pop(0)
+            if frame != b"null":
+                return frame
+            await asyncio.sleep(0.05)
+        raise StopAsyncIteration
+
+
+def _agent(frames: list[dict | None], defensive_lock: bool = True) -> tuple[AgentClient, _FakeWS]:
+    agent = AgentClient(
+        "sysadmin", "UNUSED_SIDECAR_URL_ENV", "http://sidecar:9000", "/tmp", defensive_lock=defensive_lock,
+    )
+    _attach(agent, _FakeWS(frames))
+    agent._ensure_connected = AsyncMock(return_value=True)
+    return agent, agent._ws
+
+
+def _attach(agent: AgentClient, ws: _FakeWS) -> None:
+    agent._ws = ws
+    agent._connected = True
+    agent._start_reader()
+
+
+async def test_task_sent_as_json_and_dict_result_pretty_printed():
+    agent, ws = _agent([
+        {"type": "progress", "message": "working"},
+        {"type": "result", "output": {"ok": True}, "session_id": "s-1"},
+    ])
+    progress = AsyncMock()
+    result, session = await agent._process_inner("evt-1", "restart pod", on_progress=progress)
+
+    assert json.loads(ws.sent[0])["prompt"] == "restart pod"
+    assert json.loads(result) == {"ok": True}
+    assert result.startswith("{\n  ")
+    assert session == "s-1"
+    progress.assert_awaited_once()
+    assert not ws.closed  # connection is reused by the next task
+
+
+async def test_question_returned_as_str():
+    agent, _ = _agent([{"type": "question", "message": "which ns?", "requestingAgent": "sysadmin"}])
+    result, _ = await agent._process_inner("evt-2", "scale it")
+    assert isinstance(result, str)
+    assert json.loads(result)["type"] == "question"
+
+
+async def test_busy_retry_count_is_per_invocation():
+    agent, ws = _agent([{"type": "busy"}, {"type": "ready"}] * 5 + [{"type": "busy"}])
+    result, _ = await agent._process_inner("evt-3", "deploy")
+    assert json.loads(result)["type"] == "agent_busy"
+    assert len(ws.sent) == 6  # initial task + 5 retries
+
+    _attach(agent, _FakeWS([{"type": "busy"}, {"type": "ready"}, {"type": "result", "output": "done"}]))
+    result, _ = await agent._process_inner("evt-3", "deploy")
+    assert result == "done"
+
+
+async def test_busy_waits_for_ready_and_keeps_reading_frames():
+    agent, ws = _agent([
+        {"type": "busy"},
+        {"type": "progress", "message": "still here"},
+        {"type": "ready"},
+        {"type": "result", "output": "ok"},
+    ])
+    progress = AsyncMock()
+    result, _ = await agent._process_inner("evt-4", "deploy", on_progress=progress)
+    assert result == "ok"
+    assert len(ws.sent) == 2  # resent exactly once, on ready
+    progress.assert_awaited_once()
+
+
+async def test_unsolicited_ready_does_not_resend():
+    agent, ws = _agent([{"type": "ready"}, {"type": "result", "output": "ok"}])
+    result, _ = await agent._process_inner("evt-5", "deploy")
+    assert result == "ok"
+    assert len(ws.sent) == 1
+
+
+async def test_busy_falls_back_to_timed_resend_without_ready():
+    agent, ws = _agent([{"type": "busy"}, None, {"type": "result", "output": "late"}])
+    agent.BUSY_BACKOFF_SEC = (0.01,) * 5
+    result, _ = await agent._process_inner("evt-6", "deploy")
+    assert result == "late"
+    assert len(ws.sent) == 2
+
+
+async def test_frames_for_other_events_are_not_consumed():
+    agent, ws = _agent([
+        {"type": "result", "event_id": "evt-old", "output": "stale"},
+        {"type": "progress", "event_id": "evt-7", "message": "mine"},
+        {"type": "result", "event_id": "evt-7", "output": "fresh"},
+    ])
+    result, _ = await agent._process_inner("evt-7", "deploy")
+    assert result == "fresh"
+    assert agent._pending == {}
+
+
+async def test_connection_loss_fails_waiter():
+    agent, _ = _agent([{"type": "progress", "message": "starting"}])
+    result, _ = await agent._process_inner("evt-8", "deploy")
+    assert result == "Error: WebSocket connection closed during execution"
+    assert agent._connected is False
+
+
+async def test_cancel_sends_cancel_frame_and_keeps_socket():
+    agent, ws = _agent([None] * 20)
+    task = asyncio.create_task(agent._process_inner("evt-9", "deploy"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    task_id = json.loads(ws.sent[0])["task_id"]
+    assert json.loads(ws.sent[-1]) == {"type": "cancel", "event_id": "evt-9", "task_id": task_id}
+    assert not ws.closed
+    await agent.close()
+
+
+async def test_late_frames_of_a_cancelled_run_are_dropped():
+    agent, ws = _agent([
+        {"type": "result", "event_id": "evt-13", "task_id": "run-cancelled", "output": "killed"},
+        {"type": "result", "event_id": "evt-13", "output": "fresh"},
+    ])
+    result, _ = await agent._process_inner("evt-13", "deploy")
+    assert result == "fresh"
+    assert json.loads(ws.sent[0])["task_id"] != "run-cancelled"
+    assert agent._run_ids == {}
+
+
+async def test_result_chunks_stream_to_progress_and_join_on_final():
+    agent, _ = _agent([
+        {"type": "result_chunk", "output": "part-1 ", "seq": 0, "final": False},
+        {"type": "result_chunk", "output": "part-2", "seq": 1, "final": True,
+         "session_id": "s-2", "source": "callback"},
+    ])
+    progress = AsyncMock()
+    result, session = await agent._process_inner("evt-10", "plan", on_progress=progress)
+    assert result == "part-1 part-2"
+    assert session == "s-2"
+    assert [c.args[0]["message"] for c in progress.await_args_list] == ["part-1 ", "part-2"]
+    assert {c.args[0]["source"] for c in progress.await_args_list} == {"result_chunk"}
+
+
+async def test_undecodable_frames_do_not_stop_the_reader():
+    agent, _ = _agent([
+        b'{"type": "result_chunk", "event_id": "evt-11", "output": "half \\ud83d", "seq": 0, "final": false}',
+        b"not json",
+        {"type": "result_chunk", "event_id": "evt-11", "output": " rest", "seq": 1, "final": True},
+    ])
+    result, _ = await agent._process_inner("evt-11", "plan")
+    assert result == "half \ud83d rest"  # the final chunk arrived after the garbage frame
+
+
+async def test_slow_progress_callback_does_not_delay_frame_handling():
+    frames = [{"type": "progress", "message": str(i)} for i in range(3)]
+    agent, _ = _agent(frames + [{"type": "result", "output": "ok"}])
+    delivered: list[str] = []
+    gate = asyncio.Event()
+
+    async def slow(payload: dict) -> None:
+        await gate.wait()
+        delivered.append(payload["message"])
+
+    task = asyncio.create_task(agent._process_inner("evt-20", "plan", on_progress=slow))
+    await asyncio.sleep(0.05)
+    assert not task.done()  # result parked behind the flush, frames already consumed
+    gate.set()
+    result, _ = await task
+    assert result == "ok"
+    assert delivered == ["0", "1", "2"]  # flushed in order before the result is returned
+
+
+async def test_progress_overflow_drops_only_ui_payloads():
+    from src.agents.progress_pump import ProgressPump
+
+    delivered: list[dict] = []
+    gate = asyncio.Event()
+
+    async def slow(payload: dict) -> None:
+        await gate.wait()
+        delivered.append(payload)
+
+    pump = ProgressPump(slow, "sysadmin")
+    pump.emit({"source": "agent_message", "message": "turn"})
+    for i in range(ProgressPump.MAX_PENDING + 5):
+        pump.emit({"source": "", "message": str(i)})
+    gate.set()
+    await pump.flush()
+    await pump.close()
+
+    assert delivered[0]["message"] == "turn"
+    assert len(delivered) == ProgressPump.MAX_PENDING  # lossless head kept, oldest UI payloads dropped
+    assert delivered[-1]["message"] == str(ProgressPump.MAX_PENDING + 4)
+
+
+async def test_progress_callback_error_is_not_fatal():
+    agent, _ = _agent([
+        {"type": "progress", "message": "boom"},
+        {"type": "result", "output": "ok"},
+    ])
+    result, _ = await agent._process_inner(
+        "evt-21", "plan", on_progress=AsyncMock(side_effect=RuntimeError("ui down")),
+    )
+    assert result == "ok"
+
+
+async def test_unknown_frame_types_are_ignored():
+    agent, _ = _agent([{"type": "telemetry", "cpu": 3}, {"type": "result", "output": "ok"}])
+    result, _ = await agent._process_inner("evt-22", "plan")
+    assert result == "ok"
+
+
+async def test_busy_resend_reuses_task_frame_including_session():
+    agent, ws = _agent([{"type": "busy"}, {"type": "ready"}, {"type": "result", "output": "ok"}])
+    result, _ = await agent._process_inner("evt-23", "deploy", session_id="s-9")
+    assert result == "ok"
+    assert ws.sent[0] == ws.sent[1]
+    assert json.loads(ws.sent[1])["session_id"] == "s-9"
+
+
+def test_backoff_schedules_are_explicit():
+    assert AgentClient.BUSY_BACKOFF_SEC == (5, 10, 20, 40, 60)
+    assert AgentClient.CONNECT_BACKOFF_SEC == (1, 2, 4, 8, 16)
+
+
+async def test_busy_gives_up_after_backoff_table_is_exhausted():
+    agent, ws = _agent([{"type": "busy"}, {"type": "ready"}, {"type": "busy"}])
+    agent.BUSY_BACKOFF_SEC = (0.01,)
+    result, _ = await agent._process_inner("evt-24", "deploy")
+    assert orjson.loads(result)["type"] == "agent_busy"
+    assert len(ws.sent) == 2
+
+
+async def test_close_delivers_queued_lossless_payloads_only():
+    from src.agents.progress_pump import ProgressPump
+
+    delivered: list[str] = []
+    gate = asyncio.Event()
+
+    async def slow(payload: dict) -> None:
+        await gate.wait()
+        delivered.append(payload["message"])
+
+    pump = ProgressPump(slow, "sysadmin")
+    pump.emit({"source": "agent_message", "message": "first"})
+    await asyncio.sleep(0)  # "first" is now in flight
+    pump.emit({"source": "", "message": "ui-only"})
+    pump.emit({"source": "teammate", "message": "huddle"})
+    gate.set()
+    await pump.close()
+
+    assert delivered == ["first", "huddle"]
+
+
+async def test_queued_callback_status_collapses_to_latest():
+    from src.agents.progress_pump import ProgressPump
+
+    delivered: list[str] = []
+    gate = asyncio.Event()
+
+    async def slow(payload: dict) -> None:
+        await gate.wait()
+        delivered.append(payload["message"])
+
+    pump = ProgressPump(slow, "sysadmin")
+    pump.emit({"source": "", "message": "line"})
+    for n in (10, 20, 30):
+        pump.emit({"source": "callback", "message": f"[deliverable updated: {n} chars]"})
+    pump.emit({"source": "", "message": "after"})
+    pump.emit({"source": "callback", "message": "[deliverable updated: 40 chars]"})
+    gate.set()
+    await pump.flush()
+    await pump.close()
+
+    assert delivered == [
+        "line", "[deliverable updated: 30 chars]", "after", "[deliverable updated: 40 chars]",
+    ]
+
+
+async def test_abort_current_task_closes_socket_and_fails_waiter():
+    agent, ws = _agent([None] * 20)
+    task = asyncio.create_task(agent._process_inner("evt-10", "deploy"))
+    await asyncio.sleep(0.01)
+    await agent.abort_current_task()
+    result, _ = await task
+    assert result.startswith("Error: WebSocket connection closed")
+    assert ws.closed
+    assert not agent._connected
+    await agent.close()
+
+
+async def test_concurrent_tasks_share_one_socket_without_call_lock():
+    agent, ws = _agent([
+        None,
+        {"type": "progress", "event_id": "evt-b", "message": "b working"},
+        {"type": "result", "event_id": "evt-b", "output": "b done"},
+        {"type": "result", "event_id": "evt-a", "output": "a done"},
+    ], defensive_lock=False)
+    (a, _), (b, _) = await asyncio.gather(
+        agent.process("evt-a", "first"), agent.process("evt-b", "second"),
+    )
+    assert (a, b) == ("a done", "b done")
+    assert sorted(json.loads(f)["event_id"] for f in ws.sent) == ["evt-a", "evt-b"]
+
+
+async def test_second_task_for_same_event_is_refused():
+    agent, _ = _agent([None] * 5 + [{"type": "result", "event_id": "evt-c", "output": "ok"}], defensive_lock=False)
+    first = asyncio.create_task(agent.process("evt-c", "first"))
+    await asyncio.sleep(0)
+    result, _ = await agent.process("evt-c", "again")
+    assert "already has a task in flight" in result
+    assert (await first)[0] == "ok"
+
+
+async def test_busy_fallback_tracks_measured_busy_time():
+    agent, _ = _agent([])
+    assert agent._busy_fallback_delay(1) == agent.BUSY_BACKOFF_SEC[0]  # nothing measured yet
+
+    agent._busy_ema = 2.0
+    delays = [agent._busy_fallback_delay(1) for _ in range(50)]
+    assert all(2.2 * 0.8 <= d <= 2.2 * 1.2 for d in delays)
+    assert len(set(delays)) > 1  # jittered
+
+    agent._busy_ema = 500.0
+    assert agent._busy_fallback_delay(3) == agent.BUSY_BACKOFF_SEC[2]  # table is the ceiling
+
+
+async def test_ready_after_busy_updates_busy_estimate():
+    agent, _ = _agent([{"type": "busy"}, None, {"type": "ready"}, {"type": "result", "output": "ok"}])
+    result, _ = await agent._process_inner("evt-25", "deploy")
+    assert result == "ok"
+    assert 0.04 <= agent._busy_ema < 1.0
+
+
+async def test_timed_out_fallbacks_keep_the_table_as_a_total_wait_floor():
+    agent, _ = _agent([])
+    agent._busy_ema = 0.01
+    agent._send = AsyncMock()
+    run = _TaskRun("evt-26", b"{}", None, agent.agent_name)
+    loop = asyncio.get_running_loop()
+
+    for _ in agent.BUSY_BACKOFF_SEC:
+        assert await agent._on_busy(run, {"type": "busy"}) is None
+        if run.retries < len(agent.BUSY_BACKOFF_SEC):
+            await agent._on_ready(run, {"type": "ready", "fallback": True})
+
+    assert agent._busy_ema == 0.01  # fallbacks never feed the estimate
+    assert run.resend_at >= run.first_busy_at + sum(agent.BUSY_BACKOFF_SEC)
+    assert run.resend_at > loop.time() + 100
+
+
+async def test_ensure_connected_skips_ping_on_recently_active_socket():
+    agent = AgentClient("sysadmin", "UNUSED_SIDECAR_URL_ENV", "http://sidecar:9000", "/tmp")
+    ws = _FakeWS([])
+    ws.ping = AsyncMock()
+    _attach(agent, ws)
+
+    await agent._send(b"{}")
+    assert await agent._ensure_connected() is True
+    ws.ping.assert_not_awaited()
+
+    agent._last_activity -= agent.PING_SKIP_SEC
+    assert await agent._ensure_connected() is True
+    ws.ping.assert_awaited_once()
+    await agent.close()
+
+
+async def test_calls_serialize_by_default():
+    agent = AgentClient("sysadmin", "UNUSED_SIDECAR_URL_ENV", "http://sidecar:9000", "/tmp")
+    _attach(agent, _FakeWS([None, {"type": "result", "event_id": "evt-d", "output": "d done"}]))
+    agent._ensure_connected = AsyncMock(return_value=True)
+    first = asyncio.create_task(agent.process("evt-d", "first"))
+    second = asyncio.create_task(agent.process("evt-e", "second"))
+    await asyncio.sleep(0.01)
+    assert [json.loads(f)["event_id"] for f in agent._ws.sent] == ["evt-d"]  # second waits on the lock
+    assert (await first)[0] == "d done"
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    await agent.close()
+
+
+async def test_non_string_result_is_stringified_and_chunks_released():
+    agent, _ = _agent([{"type": "result", "output": 42}])
+    result, _ = await agent._process_inner("evt-26", "count")
+    assert result == "42"
+
+    agent, _ = _agent([
+        {"type": "result_chunk", "output": "ab", "seq": 0},
+        {"type": "result_chunk", "output": "cd", "seq": 1, "final": True},
+    ])
+    seen = {}
+    on_result = agent._frame_handlers["result"]
+
+    async def spy(run, msg):
+        seen["pending_chunks"] = len(run.result_chunks)
+        return await on_result(run, msg)
+
+    agent._on_result = spy
+    result, _ = await agent._process_inner("evt-27", "dump")
+    assert result == "abcd"
+    assert seen["pending_chunks"] == 0
+
+
+async def test_connect_disables_compression_and_raises_frame_cap(monkeypatch):
+    import websockets
+
+    connect = AsyncMock(return_value=_FakeWS([]))
+    monkeypatch.setattr(websockets, "connect", connect)
+    agent = AgentClient("sysadmin", "UNUSED_SIDECAR_URL_ENV", "http://sidecar:9000", "/tmp")
+    await agent.connect()
+    kwargs = connect.await_args.kwargs
+    assert kwargs["compression"] is None
+    assert kwargs["max_size"] == agent.WS_MAX_FRAME_BYTES > 2**20
+    await agent.close()
+
+
+async def test_progress_coalescing_keeps_latest_per_tick_and_all_lossless():
+    from src.agents.progress_pump import ProgressPump
+
+    delivered: list[str] = []
+
+    async def record(payload: dict) -> None:
+        delivered.append(payload["message"])
+
+    pump = ProgressPump(record, "sysadmin", coalesce_sec=0.02)
+    for i in range(5):
+        pump.emit({"source": "", "message": f"line{i}"})
+    pump.emit({"source": "agent_message", "message": "turn"})
+    for i in range(5, 10):
+        pump.emit({"source": "", "message": f"line{i}"})
+    await asyncio.sleep(0)
+    await pump.flush()
+    await pump.close()
+    assert delivered == ["line4", "turn", "line9"]
@@ -0,0 +1,34 @@
+# tests/test_agent_registry_balancing.py
+# @ai-rules:
+# 1. [Constraint]: No real WS -- MagicMock stands in for the FastAPI WebSocket; the registry never touches it here.
+# 2. [Pattern]: Agent ids use distinct prefixes so register() does not evict one replica as a stale reconnect.
+"""Verify AgentRegistry.get_available spreads tasks across idle replicas of a role."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from src.agents.agent_registry import AgentRegistry
+
+
+async def _registry(*agent_ids: str) -> AgentRegistry:
+    registry = AgentRegistry()
+    for aid in agent_ids:
+        await registry.register(aid, "sysadmin", MagicMock(), [], "claude", "m")
+    return registry
+
+
+async def test_longest_idle_replica_is_chosen():
+    registry = await _registry("pod-a-1", "pod-b-1")
+    first = await registry.get_available("sysadmin")
+    await registry.mark_busy(first.agent_id, "evt-1", "t-1")
+    await registry.mark_idle(first.agent_id)
+    second = await registry.get_available("sysadmin")
+    assert {first.agent_id, second.agent_id} == {"pod-a-1", "pod-b-1"}
+
+
+async def test_busy_replicas_are_skipped():
+    registry = await _registry("pod-a-1", "pod-b-1")
+    await registry.mark_busy("pod-a-1", "evt-1", "t-1")
+    assert (await registry.get_available("sysadmin")).agent_id == "pod-b-1"
+    await registry.mark_busy("pod-b-1", "evt-2", "t-2")
+    assert await registry.get_available("sysadmin") is None
@@ -0,0 +1,38 @@
+# tests/test_agent_ws_frames.py
+# @ai-rules:
+# 1. [Pattern]: Fake ASGI WebSocket -- only receive() is exercised (AsyncMock returning ASGI message dicts).
+# 2. [Constraint]: Lone-surrogate frames (JS .slice() mid-pair) must decode via the stdlib fallback.
+"""Verify agent_ws_handler._receive_frame parses text and binary frames with orjson."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from src.agents.agent_ws_handler import _receive_frame
+
+
+def _ws(message: dict) -> MagicMock:
+    ws = MagicMock()
+    ws.receive = AsyncMock(return_value=message)
+    return ws
+
+
+async def test_text_and_binary_frames_parse_alike():
+    text = await _receive_frame(_ws({"type": "websocket.receive", "text": '{"type": "progress"}'}))
+    binary = await _receive_frame(_ws({"type": "websocket.receive", "bytes": b'{"type": "progress"}'}))
+    assert text == binary == {"type": "progress"}
+
+
+async def test_disconnect_raises_websocket_disconnect():
+    with pytest.raises(WebSocketDisconnect) as exc:
+        await _receive_frame(_ws({"type": "websocket.disconnect", "code": 1001}))
+    assert exc.value.code == 1001
+
+
+async def test_lone_surrogate_falls_back_to_stdlib_json():
+    frame = await _receive_frame(_ws({"type": "websocket.receive", "text": '{"message": "cut \\ud83d"}'}))
+    assert frame == {"message": "cut \ud83d"}
+    with pytest.raises(ValueError):
+        await _receive_frame(_ws({"type": "websocket.receive", "text": "not json"}))
@@ -0,0 +1,26 @@
+# tests/test_archivist_adapter_init.py
+# @ai-rules:
+# 1. [Constraint]: No real SDK -- create_adapter is patched at its import site (src.agents.llm).
+"""Verify Archivist lazy adapters build once under concurrent archive tasks."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from src.agents.archivist import Archivist
+
+
+async def test_concurrent_get_adapter_builds_one_client():
+    archivist = Archivist()
+    sentinel = object()
+    with patch("src.agents.llm.create_adapter", return_value=sentinel) as factory:
+        results = await asyncio.gather(*(archivist._get_adapter() for _ in range(3)))
+    assert all(r is sentinel for r in results)
+    assert factory.call_count == 1
+
+
+async def test_claude_adapter_failure_returns_none():
+    archivist = Archivist()
+    with patch("src.agents.llm.create_adapter", side_effect=RuntimeError("no creds")):
+        assert await archivist._get_claude_adapter() is None
+    assert archivist._claude_adapter is None
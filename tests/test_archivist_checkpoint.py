@@ -0,0 +1,67 @@
+# tests/test_archivist_checkpoint.py
+# @ai-rules:
+# 1. [Pattern]: Uses fakeredis (decode_responses=True, matching production) for the BlackboardState checkpoint HASH.
+# 2. [Constraint]: No Qdrant -- AsyncMock vector store; a failing upsert_many stands in for a crash before the write.
+"""Verify archive points are checkpointed in Redis until Qdrant acks, and replayed on backfill."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import fakeredis.aioredis
+import pytest
+
+import src.agents.archivist as archivist_mod
+from src.agents.archivist import COLLECTION_NAME, Archivist
+from src.state.blackboard import BlackboardState
+
+
+@pytest.fixture
+async def bb():
+    state = BlackboardState.__new__(BlackboardState)
+    state.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return state
+
+
+def _archivist(monkeypatch, bb) -> Archivist:
+    monkeypatch.setattr(archivist_mod, "ARCHIVE_EMBED_WINDOW_SEC", 0.01)
+    archivist = Archivist()
+    archivist._initialized = True
+    archivist._vector_store = AsyncMock()
+    archivist.checkpoint = bb
+    return archivist
+
+
+async def test_successful_upsert_commits_checkpoint(monkeypatch, bb):
+    archivist = _archivist(monkeypatch, bb)
+    await archivist._upsert_archive(COLLECTION_NAME, "p1", [0.1], {"event_id": "e1"})
+    archivist._vector_store.upsert_many.assert_awaited_once()
+    assert await bb.get_staged_archive_points() == []
+
+
+async def test_failed_upsert_is_replayed_by_backfill(monkeypatch, bb):
+    archivist = _archivist(monkeypatch, bb)
+    archivist._vector_store.upsert_many.side_effect = RuntimeError("qdrant down")
+    with pytest.raises(RuntimeError):
+        await archivist._upsert_archive(COLLECTION_NAME, "p1", [0.1], {"event_id": "e1"})
+    assert [p["id"] for _, p in await bb.get_staged_archive_points()] == ["p1"]
+
+    archivist._vector_store.upsert_many.side_effect = None
+    bb.get_closed_event_ids = AsyncMock(return_value=[])
+    await archivist.backfill_archives(bb)
+    collection, points = archivist._vector_store.upsert_many.await_args.args
+    assert collection == COLLECTION_NAME and points[0]["payload"] == {"event_id": "e1"}
+    assert await bb.get_staged_archive_points() == []
+
+
+async def test_checkpoint_stops_staging_at_cap(monkeypatch, bb, caplog):
+    monkeypatch.setattr(BlackboardState, "ARCHIVE_PENDING_MAX", 2)
+    archivist = _archivist(monkeypatch, bb)
+    archivist._vector_store.upsert_many.side_effect = RuntimeError("qdrant down")
+    for n in range(4):
+        with pytest.raises(RuntimeError):
+            await archivist._upsert_archive(COLLECTION_NAME, f"p{n}", [0.1], {"event_id": f"e{n}"})
+
+    assert sorted(p["id"] for _, p in await bb.get_staged_archive_points()) == ["p0", "p1"]
+    assert await bb.redis.ttl(BlackboardState.ARCHIVE_PENDING) > 0
+    assert (await bb.get_flow_metrics())["archivist_pending"] == 2
+    assert sum("Archive checkpoint full" in r.message for r in caplog.records) == 1
@@ -0,0 +1,98 @@
+# tests/test_archivist_embed_batch.py
+# @ai-rules:
+# 1. [Constraint]: No Vertex -- _client is a MagicMock whose aio.models.embed_content echoes one vector per text.
+# 2. [Pattern]: ARCHIVE_EMBED_WINDOW_SEC / ARCHIVIST_BATCH_SIZE monkeypatched at module level to keep tests fast.
+"""Verify archive-path embeddings and Qdrant writes coalesce into batched requests."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import src.agents.archivist as archivist_mod
+from src.agents.archivist import Archivist
+
+
+def _archivist(monkeypatch, *, batch_size: int = 32) -> Archivist:
+    monkeypatch.setattr(archivist_mod, "ARCHIVE_EMBED_WINDOW_SEC", 0.01)
+    monkeypatch.setattr(archivist_mod, "ARCHIVIST_BATCH_SIZE", batch_size)
+    archivist = Archivist()
+
+    async def _embed_content(model, contents, config):
+        return SimpleNamespace(embeddings=[SimpleNamespace(values=[float(len(t))]) for t in contents])
+
+    archivist._client = MagicMock()
+    archivist._client.aio.models.embed_content = AsyncMock(side_effect=_embed_content)
+    return archivist
+
+
+async def test_concurrent_archive_embeds_share_one_request(monkeypatch):
+    archivist = _archivist(monkeypatch)
+    vectors = await asyncio.gather(*(archivist._embed_archive("x" * n) for n in (1, 2, 3)))
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert archivist._client.aio.models.embed_content.await_count == 1
+
+
+async def test_full_batch_flushes_without_waiting_for_window(monkeypatch):
+    archivist = _archivist(monkeypatch, batch_size=2)
+    vectors = await asyncio.gather(*(archivist._embed_archive("x" * n) for n in (1, 2, 3)))
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert archivist._client.aio.models.embed_content.await_count == 2
+
+
+async def test_in_flight_batches_are_referenced_until_done():
+    gate = asyncio.Event()
+
+    async def flush(items):
+        await gate.wait()
+        return items
+
+    coalescer = archivist_mod._BatchCoalescer(flush, max_batch=1, window=0.01, semaphore=asyncio.Semaphore(2))
+    pending = asyncio.create_task(coalescer.submit("a"))
+    await asyncio.sleep(0)
+    assert len(coalescer._batches) == 1
+    gate.set()
+    assert await pending == "a"
+    await asyncio.sleep(0)
+    assert not coalescer._batches
+
+
+async def test_batch_failure_reaches_every_caller(monkeypatch):
+    archivist = _archivist(monkeypatch)
+    archivist._client.aio.models.embed_content = AsyncMock(side_effect=RuntimeError("quota"))
+    results = await asyncio.gather(
+        archivist._embed_archive("a"), archivist._embed_archive("b"), return_exceptions=True,
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+async def test_concurrent_archive_upserts_share_one_request_per_collection(monkeypatch):
+    archivist = _archivist(monkeypatch)
+    archivist._vector_store = AsyncMock()
+    await asyncio.gather(
+        archivist._upsert_archive("darwin_events", "p1", [0.1], {"event_id": "e1"}),
+        archivist._upsert_archive("darwin_events", "p2", [0.2], {"event_id": "e2"}),
+        archivist._upsert_archive("darwin_archive_cache", "c1", [0.3], {"event_id": "e1"}),
+    )
+    calls = {c.args[0]: [p["id"] for p in c.args[1]] for c in archivist._vector_store.upsert_many.call_args_list}
+    assert calls == {"darwin_events": ["p1", "p2"], "darwin_archive_cache": ["c1"]}
+
+
+async def test_search_many_embeds_in_one_request_and_keeps_order(monkeypatch):
+    archivist = _archivist(monkeypatch)
+    archivist._ensure_initialized = AsyncMock(return_value=True)
+    archivist._vector_store = AsyncMock()
+    archivist._vector_store.search = AsyncMock(
+        side_effect=lambda collection, vector, limit, filter: [{"score": vector[0]}],
+    )
+    results = await archivist.search_many(["a", "bbb", "cc"], limit=2)
+    assert results == [[{"score": 1.0}], [{"score": 3.0}], [{"score": 2.0}]]
+    assert archivist._client.aio.models.embed_content.await_count == 1
+    assert archivist._vector_store.search.await_count == 3
+
+
+async def test_search_many_embed_failure_returns_empty_per_query(monkeypatch):
+    archivist = _archivist(monkeypatch)
+    archivist._ensure_initialized = AsyncMock(return_value=True)
+    archivist._client.aio.models.embed_content = AsyncMock(side_effect=RuntimeError("quota"))
+    assert await archivist.search_many(["a", "b"]) == [[], []]
@@ -0,0 +1,79 @@
+# tests/test_archivist_query_embed_cache.py
+# @ai-rules:
+# 1. [Constraint]: No Vertex -- Archivist._embed is an AsyncMock; the cache sits above it.
+# 2. [Pattern]: Eviction tested by monkeypatching QUERY_EMBED_CACHE_MAX at module level.
+"""Verify the query-path embedding LRU and its single-flight de-duplication."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+import src.agents.archivist as archivist_mod
+from src.agents.archivist import Archivist
+
+
+def _archivist() -> Archivist:
+    archivist = Archivist()
+    archivist._initialized = True
+
+    async def _embed(text: str) -> list[float]:
+        await asyncio.sleep(0)
+        return [float(len(text))]
+
+    archivist._embed = AsyncMock(side_effect=_embed)
+    return archivist
+
+
+async def test_repeated_query_embeds_once():
+    archivist = _archivist()
+    assert await archivist.embed_query("pods crashlooping") == [17.0]
+    assert await archivist.embed_query("pods crashlooping") == [17.0]
+    assert archivist._embed.await_count == 1
+
+
+async def test_concurrent_identical_misses_share_one_call():
+    archivist = _archivist()
+    vectors = await asyncio.gather(*(archivist.embed_query("oom") for _ in range(5)))
+    assert vectors == [[3.0]] * 5
+    assert archivist._embed.await_count == 1
+    assert archivist._query_embed_inflight == {}
+
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    archivist = _archivist()
+    gate = asyncio.Event()
+
+    async def _embed(text: str) -> list[float]:
+        if archivist._embed.await_count == 1:
+            await gate.wait()  # the leader blocks until it is cancelled
+        return [float(len(text))]
+
+    archivist._embed.side_effect = _embed
+    leader = asyncio.create_task(archivist.embed_query("oom"))
+    await asyncio.sleep(0)
+    followers = [asyncio.create_task(archivist.embed_query("oom")) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await asyncio.gather(*followers) == [[3.0]] * 3
+    assert leader.cancelled()
+    assert archivist._embed.await_count == 2  # one re-embed, shared by the followers
+
+
+async def test_failed_embed_is_not_cached():
+    archivist = _archivist()
+    archivist._embed.side_effect = [RuntimeError("quota"), [1.0]]
+    with pytest.raises(RuntimeError):
+        await archivist.embed_query("q")
+    assert await archivist.embed_query("q") == [1.0]
+
+
+async def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(archivist_mod, "QUERY_EMBED_CACHE_MAX", 2)
+    archivist = _archivist()
+    for q in ("a", "bb", "a", "ccc"):
+        await archivist.embed_query(q)
+    await archivist.embed_query("a")
+    await archivist.embed_query("bb")
+    assert archivist._embed.await_count == 4  # a, bb, ccc, then bb again after eviction
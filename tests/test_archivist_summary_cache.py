@@ -0,0 +1,157 @@
+# tests/test_archivist_summary_cache.py
+# @ai-rules:
+# 1. [Constraint]: No Qdrant/Vertex -- AsyncMock vector store; _embed_archive and the Claude adapter are stubbed.
+# 2. [Pattern]: Archivist() then flip _initialized/_archive_cache_ready, like test_lesson_hygiene's store_lesson tests.
+# 3. [Pattern]: _event() is one turn -- the autouse fixture disables the short-conversation fast path so the
+#    cache/LLM path is exercised; fast-path tests re-enable it explicitly.
+# 4. [Pattern]: Gemini fallback is exercised by returning None from _get_claude_adapter.
+"""Verify archive_event's semantic summary cache (darwin_archive_cache)."""
+from __future__ import annotations
+
+import time
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+import src.agents.archivist as archivist_mod
+from src.agents.archivist import ARCHIVE_CACHE_COLLECTION, COLLECTION_NAME, Archivist, _event_point_id
+from src.models import ConversationTurn, EventDocument, EventEvidence, EventInput
+
+
+@pytest.fixture(autouse=True)
+def _no_fast_path(monkeypatch):
+    monkeypatch.setattr(archivist_mod, "ARCHIVIST_FAST_PATH_MAX_TURNS", 0)
+
+
+def _event(event_id: str = "evt-2") -> EventDocument:
+    return EventDocument(
+        id=event_id, source="aligner", service="svc-a",
+        event=EventInput(reason="pods crashlooping", evidence=EventEvidence(display_text="x", source_type="aligner")),
+        conversation=[ConversationTurn(turn=1, actor="brain", action="triage", thoughts="OOMKilled")],
+    )
+
+
+def _archivist(hits: list[dict]) -> Archivist:
+    archivist = Archivist()
+    archivist._initialized = True
+    archivist._archive_cache_ready = True
+    archivist._archive_cache_services = {"svc-a": time.time()}  # svc-a archived recently -- cache embed runs
+    archivist._vector_store = AsyncMock()
+    archivist._vector_store.search.return_value = hits
+    archivist._embed_archive = AsyncMock(return_value=[0.1] * 768)
+    adapter = AsyncMock()
+    adapter.generate.return_value = SimpleNamespace(
+        usage=None, text="",
+        function_call=SimpleNamespace(args={"symptom": "oom", "root_cause": "limits", "fix_action": "raise"}),
+    )
+    archivist._get_claude_adapter = AsyncMock(return_value=adapter)
+    archivist.store_knowledge = AsyncMock()
+    return archivist
+
+
+def _upserts(archivist: Archivist) -> dict[str, dict]:
+    return {
+        collection: point["payload"]
+        for (collection, points), _ in archivist._vector_store.upsert_many.call_args_list
+        for point in points
+    }
+
+
+async def test_cache_hit_reuses_summary_without_llm():
+    cached = {"symptom": "oom", "root_cause": "limits", "fix_action": "raise", "turns": 9,
+              "pattern_keywords": ["oom"], "instance_keywords": ["svc-a-7f9c"], "outcome": "escalated",
+              "procedures": ["bump limits"], "agent_execution_times": [{"agent": "sysadmin", "duration_seconds": 40}],
+              "reference_facts": [{"topic": "t", "fact": "f"}]}
+    archivist = _archivist([{"id": "p", "score": 0.97, "payload": {"event_id": "evt-1", "summary": cached}}])
+    await archivist.archive_event(_event())
+
+    adapter = await archivist._get_claude_adapter()
+    adapter.generate.assert_not_awaited()
+    stored = _upserts(archivist)
+    assert set(stored) == {COLLECTION_NAME}  # hits are not re-cached
+    payload = stored[COLLECTION_NAME]
+    assert payload["source_event_id"] == "evt-1"
+    assert payload["event_id"] == "evt-2" and payload["turns"] == 1
+    assert payload["root_cause"] == "limits" and payload["pattern_keywords"] == ["oom"]
+    assert payload["instance_keywords"] == ["svc-a"]  # rebuilt from this event, not the source's
+    assert payload["outcome"] == "unknown" and payload["procedures"] == "unknown"
+    assert payload["agent_execution_times"] == []
+    archivist.store_knowledge.assert_not_awaited()
+
+
+async def test_first_archive_of_a_service_skips_the_cache_embed():
+    archivist = _archivist([])
+    archivist._archive_cache_services = {"svc-b": time.time() - archivist_mod.ARCHIVE_CACHE_TTL_SEC}
+    await archivist.archive_event(_event())
+
+    archivist._vector_store.search.assert_not_awaited()
+    archivist._embed_archive.assert_awaited_once()  # summary embed only
+    assert set(_upserts(archivist)) == {COLLECTION_NAME}
+    assert set(archivist._archive_cache_services) == {"svc-a"}  # expired svc-b pruned on insert
+
+
+async def test_cache_miss_summarizes_and_records_conversation_vector():
+    archivist = _archivist([{"id": "p", "score": 0.80, "payload": {"event_id": "evt-1", "summary": {"x": 1}}}])
+    await archivist.archive_event(_event())
+
+    adapter = await archivist._get_claude_adapter()
+    adapter.generate.assert_awaited_once()
+    stored = _upserts(archivist)
+    assert stored[ARCHIVE_CACHE_COLLECTION]["event_id"] == "evt-2"
+    assert stored[ARCHIVE_CACHE_COLLECTION]["summary"]["root_cause"] == "limits"
+    assert "source_event_id" not in stored[COLLECTION_NAME]
+
+
+async def test_short_conversation_archives_heuristic_summary_without_llm(monkeypatch):
+    monkeypatch.setattr(archivist_mod, "ARCHIVIST_FAST_PATH_MAX_TURNS", 3)
+    archivist = _archivist([])
+    event = _event()
+    event.conversation.append(ConversationTurn(turn=2, actor="brain", action="close", result="restarted pod"))
+    await archivist.archive_event(event)
+
+    adapter = await archivist._get_claude_adapter()
+    adapter.generate.assert_not_awaited()
+    archivist._vector_store.search.assert_not_awaited()
+    archivist._embed_archive.assert_awaited_once()  # summary embed only -- no conversation cache embed
+    stored = _upserts(archivist)
+    assert set(stored) == {COLLECTION_NAME}
+    payload = stored[COLLECTION_NAME]
+    assert payload["summary_source"] == "heuristic"
+    assert payload["symptom"] == "pods crashlooping" and payload["fix_action"] == "restarted pod"
+    assert payload["turns"] == 2
+
+
+async def test_gemini_fallback_requests_json_mode_and_parses_text():
+    archivist = _archivist([])
+    archivist._get_claude_adapter = AsyncMock(return_value=None)
+    gemini = AsyncMock()
+    gemini.generate.return_value = SimpleNamespace(usage=None, text='{"symptom": "oom", "root_cause": "limits"}')
+    archivist._get_adapter = AsyncMock(return_value=gemini)
+    await archivist.archive_event(_event())
+
+    assert gemini.generate.await_args.kwargs["response_mime_type"] == "application/json"
+    payload = _upserts(archivist)[COLLECTION_NAME]
+    assert payload["symptom"] == "oom" and payload["root_cause"] == "limits"
+
+
+def test_format_conversation_skips_think_and_labels_fields():
+    from src.agents.archivist import _format_conversation
+
+    turns = [
+        ConversationTurn(turn=1, actor="brain", action="triage", thoughts="t", evidence="e"),
+        ConversationTurn(turn=2, actor="brain", action="think", thoughts="hidden"),
+        ConversationTurn(turn=3, actor="sysadmin", action="execute", result="r", plan="p"),
+    ]
+    text = _format_conversation(turns)
+    lines = text.split("\n")
+    assert lines[0].endswith(" brain.triage] t") and lines[1] == "  Evidence: e"
+    assert lines[2].endswith(" sysadmin.execute]")
+    assert lines[3:] == ["  Result: r", "  Plan: p"]
+    assert "hidden" not in text
+
+
+def test_event_point_id_matches_legacy_uuid5():
+    for event_id in ("evt-2", "evt-ünïcode", ""):
+        assert _event_point_id(event_id) == str(uuid.uuid5(uuid.NAMESPACE_URL, f"darwin:{event_id}"))
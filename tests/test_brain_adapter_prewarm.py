@@ -0,0 +1,31 @@
+# tests/test_brain_adapter_prewarm.py
+# @ai-rules:
+# 1. [Constraint]: No real SDK -- create_adapter is patched at its import site (src.agents.llm).
+# 2. [Pattern]: Brain(blackboard=MagicMock(), agents={}) like test_ephemeral_model_routing.py.
+"""Verify Brain adapter prewarm and single initialization under concurrent callers."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from src.agents.brain import Brain
+
+
+async def test_concurrent_get_adapter_builds_one_client():
+    brain = Brain(blackboard=MagicMock(), agents={})
+    sentinel = object()
+    with patch("src.agents.llm.create_adapter", return_value=sentinel) as factory:
+        results = await asyncio.gather(
+            brain.prewarm_adapter(), brain._get_adapter(), brain._get_adapter(),
+        )
+    assert results[1] is sentinel and results[2] is sentinel
+    assert factory.call_count == 1
+    assert brain._llm_available is True
+
+
+async def test_prewarm_failure_leaves_probe_mode():
+    brain = Brain(blackboard=MagicMock(), agents={})
+    with patch("src.agents.llm.create_adapter", side_effect=RuntimeError("no creds")):
+        await brain.prewarm_adapter()
+    assert brain._adapter is None
+    assert brain._llm_available is False
@@ -2,7 +2,7 @@
 # @ai-rules:
 # 1. [Constraint]: No Redis — Brain._cleanup_stale_events with a MagicMock blackboard only.
 # 2. [Pattern]: Asserts headhunter stale startup path calls process_event_feedback directly (no signal).
-"""Brain startup close-path tests (stale headhunter + direct feedback)."""
+"""Brain startup close-path tests (stale headhunter + direct feedback, batched Redis I/O)."""
 from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
@@ -40,6 +40,7 @@ async def test_cleanup_stale_headhunter_calls_direct_feedback():
     bb.get_active_events = AsyncMock(return_value=["evt-stale-hh"])
     bb.mark_turns_evaluated = AsyncMock()
     bb.get_event = AsyncMock(return_value=event)
+    bb.get_events = AsyncMock(return_value=[event])
     bb.close_event = AsyncMock()
     bb.persist_report = AsyncMock()
     bb.append_journal = AsyncMock()
@@ -55,3 +56,30 @@ async def test_cleanup_stale_headhunter_calls_direct_feedback():
     mock_hh.process_event_feedback.assert_awaited_once_with("evt-stale-hh")
     bb.close_event.assert_awaited_once()
     brain._broadcast.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_batches_reads_orphans_and_requeues():
+    fresh = [
+        EventDocument(id=eid, source="chat", service="general",
+                      event=EventInput(reason="hi", evidence="hi"))
+        for eid in ("evt-new-1", "evt-new-2")
+    ]
+    bb = MagicMock()
+    bb.EVENT_ACTIVE = "darwin:event:active"
+    bb.EVENT_QUEUE = "darwin:queue"
+    bb.redis = MagicMock()
+    bb.redis.srem = AsyncMock()
+    bb.redis.lpush = AsyncMock()
+    ids = ["evt-new-1", "evt-gone-1", "evt-new-2", "evt-gone-2"]
+    bb.get_active_events = AsyncMock(return_value=ids)
+    bb.mark_turns_evaluated = AsyncMock()
+    bb.get_events = AsyncMock(return_value=[fresh[0], None, fresh[1], None])
+    bb.get_event = AsyncMock()
+
+    await Brain(blackboard=bb, agents={})._cleanup_stale_events()
+
+    bb.get_events.assert_awaited_once_with(ids)
+    bb.get_event.assert_not_awaited()
+    bb.redis.srem.assert_awaited_once_with(bb.EVENT_ACTIVE, "evt-gone-1", "evt-gone-2")
+    bb.redis.lpush.assert_awaited_once_with(bb.EVENT_QUEUE, "evt-new-1", "evt-new-2")
@@ -46,7 +46,9 @@ def _make_brain() -> Brain:
     bb.redis = MagicMock()
     bb.redis.lpush = AsyncMock()
     bb.get_event = AsyncMock()
+    bb.get_events = AsyncMock(return_value=[])
     bb.append_turn = AsyncMock(return_value=1)
+    bb.get_turn_count = AsyncMock(return_value=0)
     bb.close_event = AsyncMock()
     bb.persist_report = AsyncMock()
     bb.append_journal = AsyncMock()
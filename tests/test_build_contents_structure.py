@@ -81,6 +81,7 @@ def _make_brain_mock():
     bb.get_service.return_value = None
     bb.get_active_events.return_value = []
     bb.get_event.return_value = None
+    bb.get_events.return_value = []
     bb.get_recent_closed_for_service.return_value = []
 
     return SimpleNamespace(
@@ -268,3 +269,49 @@ class TestBuildContentsStructure:
         assert merged_found, (
             "No Content found with both [USER] and [SYSTEM] labels in merged parts"
         )
+
+    @pytest.mark.asyncio
+    async def test_related_events_keep_active_order_and_cache_skips_redis(self):
+        """Concurrent header fetch: related lines follow active-set order; cached ids bypass Redis."""
+        brain = _make_brain_mock()
+        others = {
+            "evt-a": _make_event(event_id="evt-a", source="aligner"),
+            "evt-b": _make_event(event_id="evt-b", source="headhunter"),
+        }
+        brain.blackboard.get_events.side_effect = lambda ids: [others.get(eid) for eid in ids]
+        event = _make_event(conversation=[])
+        cache = {"_cached_active_ids": ["evt-b", "evt-test", "evt-a"], "_cached_recent_closed": []}
+
+        contents = await Brain._build_contents(brain, event, context_cache=cache)
+
+        text = _all_text(contents)
+        assert text.index("evt-b (headhunter)") < text.index("evt-a (aligner)")
+        brain.blackboard.get_active_events.assert_not_awaited()
+        brain.blackboard.get_recent_closed_for_service.assert_not_awaited()
+        brain.blackboard.get_events.assert_awaited_once_with(["evt-b", "evt-a"])  # one MGET, not N GETs
+
+    @pytest.mark.asyncio
+    async def test_skill_refs_keep_tool_result_paired_as_function_response(self):
+        """Skill refs on the latest tool_result go in their own part; the FR pairing survives."""
+        from src.agents.llm.gemini_client import GeminiAdapter
+
+        fc_parts = [{"functionCall": {"name": "lookup_service", "args": {}}}]
+        conversation = [
+            _make_turn(turn=1, actor="brain", action="response", response_parts=fc_parts),
+            _make_turn(turn=2, actor="brain", action="tool_result",
+                       waitingFor="lookup_service", evidence="ok"),
+        ]
+        event = _make_event(conversation=conversation)
+        brain = _make_brain_mock()
+        brain._skill_loader = SimpleNamespace(
+            get_tool_skills=lambda tool: ["lookup"],
+            build_skill_refs=lambda tool, phase, source: '<skill_ref id="lookup"/>',
+        )
+
+        contents = await Brain._build_contents(brain, event)
+
+        result_msg = next(m for m in contents if m["parts"][0].get("text", "").startswith("[SYSTEM lookup_service]"))
+        assert result_msg["parts"][1] == {"text": '<skill_ref id="lookup"/>'}
+        converted = GeminiAdapter.__new__(GeminiAdapter)._convert_structured(contents)
+        fr = converted[contents.index(result_msg)].parts[0]
+        assert fr.function_response.name == "lookup_service"
@@ -0,0 +1,62 @@
+# tests/test_compress_contents.py
+# @ai-rules:
+# 1. [Pattern]: Pure classmethod -- no Brain instance, no Redis. Budgets passed via max_tokens / monkeypatched module constants.
+# 2. [Constraint]: Prune cut must stay put across consecutive calls until it crosses a _PRUNE_STEP boundary.
+"""Tests for Brain._compress_contents tail-keep pruning."""
+from __future__ import annotations
+
+import src.agents.brain as brain_mod
+from src.agents.brain import Brain
+
+
+def _msgs(n: int, chars: int = 400) -> list[dict]:
+    header = {"role": "user", "parts": [{"text": "HEADER"}]}
+    roles = ("model", "user")
+    return [header] + [
+        {"role": roles[i % 2], "parts": [{"text": f"{i}:" + "x" * chars}]} for i in range(n)
+    ]
+
+
+def test_under_budget_is_unchanged():
+    contents = _msgs(10)
+    assert Brain._compress_contents(contents, max_tokens=10_000) is contents
+
+
+def test_prune_prefix_stable_as_conversation_grows(monkeypatch):
+    monkeypatch.setattr(brain_mod, "_CONTENT_TAIL_BUDGET", 2_000)
+    # 100 tokens/msg -> tail keeps ~20 messages; max_tokens leaves room for snapping
+    first = Brain._compress_contents(_msgs(40), max_tokens=3_000)
+    second = Brain._compress_contents(_msgs(41), max_tokens=3_000)
+
+    assert first[0]["parts"][0]["text"] == "HEADER"
+    assert "pruned for context window" in first[1]["parts"][0]["text"]
+    assert first[1] == second[1]
+    assert second[: len(first)] == first
+
+
+def test_snap_skipped_when_it_would_exceed_budget(monkeypatch):
+    monkeypatch.setattr(brain_mod, "_CONTENT_TAIL_BUDGET", 2_000)
+    pruned = Brain._compress_contents(_msgs(40), max_tokens=2_100)
+    kept_tokens = sum(len(p["text"]) // 4 for m in pruned for p in m["parts"])
+    assert kept_tokens < 2_100 + 50
+    assert "20 earlier turns" in pruned[1]["parts"][0]["text"]
+
+
+def test_prune_marker_condenses_dropped_turns(monkeypatch):
+    monkeypatch.setattr(brain_mod, "_CONTENT_TAIL_BUDGET", 200)
+    header = {"role": "user", "parts": [{"text": "HEADER"}]}
+    pad = "x" * 400
+    contents = [
+        header,
+        {"role": "user", "parts": [{"text": f"[USER]: fix it {pad}"}]},
+        {"role": "model", "parts": [{"text": f"routing {pad}"}]},
+        {"role": "user", "parts": [{"text": f"[AGENT sysadmin]: pod restarted\n ok {pad}"},
+                                   {"text": "[SYSTEM lookup_service]: healthy"}]},
+        {"role": "model", "parts": [{"text": f"verify {pad}"}]},
+        {"role": "user", "parts": [{"text": f"[AGENT qe]: tail {pad}"}]},
+    ]
+    pruned = Brain._compress_contents(contents, max_tokens=300)
+    marker = pruned[1]["parts"][0]["text"]
+    assert "2 brain turns, 1 agent replies, 1 system/tool results, 1 user messages" in marker
+    assert "Last agent outcome: [AGENT sysadmin]: pod restarted ok" in marker
+    assert pruned[-1] == contents[-1]
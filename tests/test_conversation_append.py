@@ -0,0 +1,44 @@
+# tests/test_conversation_append.py
+# @ai-rules:
+# 1. [Pattern]: Uses fakeredis (decode_responses=True, matching production) for BlackboardState integration tests.
+# 2. [Constraint]: Verifies append_to_conversation index assignment + ordering under concurrent appends.
+"""Tests for atomic conversation appends."""
+from __future__ import annotations
+
+import asyncio
+
+import fakeredis.aioredis
+import pytest
+
+from src.models import ConversationMessage
+from src.state.blackboard import BlackboardState
+
+
+@pytest.fixture
+async def bb():
+    state = BlackboardState.__new__(BlackboardState)
+    state.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return state
+
+
+async def test_appends_preserve_order(bb):
+    cid = await bb.create_conversation()
+    for role, content in (("user", "hi"), ("user", "scale it"), ("assistant", "done")):
+        await bb.append_to_conversation(cid, ConversationMessage(role=role, content=content))
+
+    history = await bb.get_conversation(cid)
+    assert [(m.role, m.content) for m in history] == [
+        ("user", "hi"), ("user", "scale it"), ("assistant", "done"),
+    ]
+    assert await bb.redis.ttl(f"darwin:conversation:{cid}") > 0
+
+
+async def test_concurrent_appends_do_not_reuse_slots(bb):
+    cid = await bb.create_conversation()
+    await asyncio.gather(*(
+        bb.append_to_conversation(cid, ConversationMessage(role="user", content=str(i)))
+        for i in range(5)
+    ))
+
+    history = await bb.get_conversation(cid)
+    assert sorted(m.content for m in history) == ["0", "1", "2", "3", "4"]
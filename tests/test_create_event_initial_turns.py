@@ -0,0 +1,53 @@
+# tests/test_create_event_initial_turns.py
+# @ai-rules:
+# 1. [Pattern]: Uses fakeredis (decode_responses=True, matching production) for BlackboardState integration tests.
+# 2. [Constraint]: initial_turns land in the stored document before the event is queued; turn numbers are reassigned 1..n.
+"""Tests for seeding opening conversation turns via create_event."""
+from __future__ import annotations
+
+import fakeredis.aioredis
+import pytest
+
+from src.models import ConversationTurn, EventEvidence
+from src.state.blackboard import BlackboardState
+
+
+@pytest.fixture
+async def bb():
+    state = BlackboardState.__new__(BlackboardState)
+    state.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return state
+
+
+def _evidence() -> EventEvidence:
+    return EventEvidence(
+        display_text="hi", source_type="chat", triggered_by="dashboard",
+        domain="disorder", severity="info",
+    )
+
+
+async def test_initial_turns_stored_with_event(bb):
+    turns = [
+        ConversationTurn(turn=0, actor="brain", action="context", thoughts="prior"),
+        ConversationTurn(turn=0, actor="user", action="message", thoughts="hi"),
+    ]
+    event_id = await bb.create_event(
+        source="chat", service="general", reason="hi",
+        evidence=_evidence(), initial_turns=turns,
+    )
+
+    event = await bb.get_event(event_id)
+    assert [(t.turn, t.actor, t.thoughts) for t in event.conversation] == [
+        (1, "brain", "prior"), (2, "user", "hi"),
+    ]
+    # A later append continues the numbering instead of colliding
+    await bb.append_turn(event_id, ConversationTurn(turn=0, actor="brain", action="think"))
+    event = await bb.get_event(event_id)
+    assert len(event.conversation) == 3
+
+
+async def test_create_event_without_initial_turns_is_empty(bb):
+    event_id = await bb.create_event(
+        source="chat", service="general", reason="hi", evidence=_evidence(),
+    )
+    assert (await bb.get_event(event_id)).conversation == []
@@ -0,0 +1,49 @@
+# tests/test_dashboard_broadcast.py
+# @ai-rules:
+# 1. [Constraint]: No FastAPI app -- AsyncMock stands in for each UI WebSocket; Brain/Blackboard are unused MagicMocks.
+"""Verify DashboardWSAdapter broadcast encoding and dead-client pruning."""
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import src.adapters.dashboard_ws as dashboard_ws
+from src.adapters.dashboard_ws import DashboardWSAdapter
+
+
+def _adapter(*clients) -> DashboardWSAdapter:
+    adapter = DashboardWSAdapter(brain=MagicMock(), blackboard=MagicMock(), auth_enabled=False)
+    adapter._clients.update(clients)
+    return adapter
+
+
+async def test_broadcast_encodes_once_and_prunes_dead_clients():
+    ok, dead = AsyncMock(), AsyncMock()
+    dead.send_text.side_effect = RuntimeError("gone")
+    adapter = _adapter(ok, dead)
+    await adapter({"type": "turn", "event_id": "evt-1", "turn": {"thoughts": "naïve ✓"}})
+    assert json.loads(ok.send_text.await_args.args[0])["turn"]["thoughts"] == "naïve ✓"
+    assert adapter.client_count == 1
+
+
+async def test_broadcast_falls_back_for_values_orjson_rejects():
+    ws = AsyncMock()
+    await _adapter(ws)({"type": "stats", "big": 2 ** 70, 3: "non-str key"})
+    assert json.loads(ws.send_text.await_args.args[0])["big"] == 2 ** 70
+
+
+async def test_stalled_client_is_dropped_without_blocking_others(monkeypatch):
+    monkeypatch.setattr(dashboard_ws, "_SEND_TIMEOUT", 0.05)
+    ok, stalled = AsyncMock(), AsyncMock()
+
+    async def _never_drains(_data):
+        await asyncio.sleep(10)
+
+    stalled.send_text.side_effect = _never_drains
+    adapter = _adapter(ok, stalled)
+    await asyncio.wait_for(adapter({"type": "turn", "event_id": "evt-1"}), timeout=1.0)
+    ok.send_text.assert_awaited_once()
+    assert adapter._clients == {ok}
+    stalled.close.assert_awaited_once_with(code=1011)  # browser reconnects instead of going deaf
+    ok.close.assert_not_awaited()
@@ -0,0 +1,22 @@
+# tests/test_developer_sessions.py
+# @ai-rules:
+# 1. [Constraint]: No sidecar -- exercises Developer's in-memory session maps only.
+"""Verify Developer's per-event session maps stay bounded without cleanup_event."""
+from __future__ import annotations
+
+from src.agents import developer as developer_mod
+from src.agents.developer import Developer
+
+
+def test_session_map_evicts_oldest_event(monkeypatch):
+    monkeypatch.setattr(developer_mod, "MAX_TRACKED_SESSIONS", 2)
+    dev = Developer()
+    for eid in ("evt-1", "evt-2"):
+        dev._remember(dev._dev_sessions, eid, f"s-{eid}")
+    dev._remember(dev._dev_sessions, "evt-1", "s-new")  # refresh moves evt-1 to the back
+    dev._remember(dev._dev_sessions, "evt-3", "s-evt-3")
+    assert list(dev._dev_sessions) == ["evt-1", "evt-3"]
+    assert dev._dev_sessions["evt-1"] == "s-new"
+
+    dev.cleanup_event("evt-1")
+    assert "evt-1" not in dev._dev_sessions
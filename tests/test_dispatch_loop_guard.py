@@ -0,0 +1,76 @@
+# tests/test_dispatch_loop_guard.py
+# @ai-rules:
+# 1. [Constraint]: No Redis -- record_dispatch runs on a real Brain tool context; the handler gets a mock ctx.
+# 2. [Pattern]: Handler test asserts the guard fires before stamp_event (no route turn, no agent run).
+# 3. [Pattern]: ask_agent_for_state test stops at stamp_event (side_effect) -- only the guard decision matters.
+"""Verify select_agent's identical-dispatch loop guard."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agents.brain import Brain
+from src.agents.handlers_dispatch import MAX_IDENTICAL_DISPATCHES, handle_select_agent
+from src.agents.tool_router import HANDLER_REGISTRY
+
+
+def test_record_dispatch_counts_consecutive_repeats_only():
+    ctx = Brain(blackboard=MagicMock(), agents={})._tool_ctx
+    assert ctx.record_dispatch("evt-1", "a") == 1
+    assert ctx.record_dispatch("evt-1", "a") == 2
+    assert ctx.record_dispatch("evt-1", "b") == 1
+    assert ctx.record_dispatch("evt-1", "a") == 1
+    assert ctx.record_dispatch("evt-2", "a") == 1
+
+
+async def test_identical_dispatch_limit_force_closes_before_routing():
+    ctx = MagicMock()
+    ctx.is_task_running.return_value = False
+    ctx.is_dispatch_locked.return_value = False
+    ctx.increment_routing_depth.return_value = 1
+    ctx.record_dispatch.return_value = MAX_IDENTICAL_DISPATCHES
+    ctx.close_and_broadcast = AsyncMock()
+    ctx.stamp_event = AsyncMock()
+
+    args = {"agent_name": "sysadmin", "task_instruction": "check pods"}
+    assert await handle_select_agent(ctx, "evt-1", args, None) is False
+
+    ctx.close_and_broadcast.assert_awaited_once()
+    assert ctx.close_and_broadcast.await_args.args[2] == "force_closed"
+    ctx.stamp_event.assert_not_awaited()
+
+
+def test_changed_agent_result_resets_the_repeat_count():
+    brain = Brain(blackboard=MagicMock(), agents={})
+    ctx = brain._tool_ctx
+    ctx.record_dispatch("evt-1", "a")
+    brain._note_agent_result("evt-1", "3 pods crashlooping")
+    ctx.record_dispatch("evt-1", "a")
+    brain._note_agent_result("evt-1", "3 pods crashlooping")
+    assert ctx.record_dispatch("evt-1", "a") == 3
+
+    brain._dispatch_repeat.clear()
+    ctx.record_dispatch("evt-1", "a")
+    brain._note_agent_result("evt-1", "3 pods crashlooping")
+    ctx.record_dispatch("evt-1", "a")
+    brain._note_agent_result("evt-1", "1 pod crashlooping")
+    assert ctx.record_dispatch("evt-1", "a") == 1
+
+
+async def test_ask_agent_for_state_skips_the_loop_guard():
+    ctx = MagicMock()
+    ctx.is_task_running.return_value = False
+    ctx.is_dispatch_locked.return_value = False
+    ctx.increment_routing_depth.return_value = 1
+    ctx.record_dispatch.return_value = MAX_IDENTICAL_DISPATCHES
+    ctx.close_and_broadcast = AsyncMock()
+    ctx.stamp_event = AsyncMock(side_effect=RuntimeError("stop after guard"))
+
+    args = {"agent_name": "sysadmin", "question": "pod status?"}
+    with pytest.raises(RuntimeError):
+        await HANDLER_REGISTRY["ask_agent_for_state"](ctx, "evt-1", args, None)
+
+    ctx.record_dispatch.assert_not_called()
+    ctx.close_and_broadcast.assert_not_awaited()
+    ctx.stamp_event.assert_awaited_once()
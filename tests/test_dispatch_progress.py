@@ -0,0 +1,80 @@
+# tests/test_dispatch_progress.py
+# @ai-rules:
+# 1. [Constraint]: No Redis, no real WS -- MagicMock agent connection + real TaskBridge (as test_dispatch_model_effort).
+# 2. [Pattern]: send_json side effect enqueues the whole frame script, then a "result", so the loop drains in one go.
+"""Verify reverse-WS dispatch delivers on_progress off the queue loop, in order, before returning."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from src.agents.dispatch import consume_wake_task, dispatch_to_agent
+from src.agents.task_bridge import TaskBridge
+
+
+def _conn(bridge: TaskBridge, frames: list[dict]):
+    conn = MagicMock()
+    conn.agent_id = "agent-1"
+    conn.busy = False
+    conn.current_event_id = conn.current_task_id = conn.current_role = None
+
+    async def _on_send(payload: dict) -> None:
+        for frame in frames:
+            bridge.put(payload["task_id"], frame)
+
+    conn.ws.send_json = AsyncMock(side_effect=_on_send)
+    registry = AsyncMock()
+    registry.get_available = AsyncMock(return_value=conn)
+    return conn, registry
+
+
+async def test_slow_progress_callback_is_flushed_in_order_before_result():
+    bridge = TaskBridge()
+    frames = [{"type": "progress", "message": f"p{i}"} for i in range(3)]
+    frames.append({"type": "result", "output": "done", "source": "findings"})
+    _, registry = _conn(bridge, frames)
+    delivered: list[str] = []
+
+    async def on_progress(payload: dict) -> None:
+        await asyncio.sleep(0.01)
+        delivered.append(payload["message"])
+
+    result, _ = await dispatch_to_agent(
+        registry, bridge, "architect", "evt-1", "do the thing", on_progress=on_progress,
+    )
+    assert result == "done"
+    assert delivered == ["p0", "p1", "p2"]
+
+
+async def test_wake_task_teammate_messages_reach_callback():
+    bridge = TaskBridge()
+    bridge.create_queue("t-1")
+    bridge.put("t-1", {"type": "agent_teammate_message", "from": "qe", "content": "hi"})
+    bridge.put("t-1", {"type": "result", "output": "ok", "source": "findings"})
+    on_progress = AsyncMock()
+
+    result, _ = await consume_wake_task(
+        bridge, AsyncMock(), "agent-1", "t-1", "evt-2", "developer", on_progress=on_progress,
+    )
+    assert result == "ok"
+    on_progress.assert_awaited_once()
+    assert on_progress.await_args.args[0]["source"] == "teammate"
+
+
+async def test_frames_without_a_handler_are_skipped():
+    bridge = TaskBridge()
+    frames = [
+        {"type": "agent_teammate_message", "content": "wake-only frame"},
+        {"type": "mystery"},
+        {"type": "progress", "message": "still here"},
+        {"type": "result", "output": "done", "source": "findings"},
+    ]
+    _, registry = _conn(bridge, frames)
+    on_progress = AsyncMock()
+
+    result, _ = await dispatch_to_agent(
+        registry, bridge, "architect", "evt-3", "do it", on_progress=on_progress,
+    )
+    assert result == "done"
+    on_progress.assert_awaited_once()
+    assert on_progress.await_args.args[0]["message"] == "still here"
@@ -37,6 +37,7 @@ def _make_brain() -> Brain:
     bb = MagicMock()
     bb.get_event = AsyncMock(return_value=_make_headhunter_event())
     bb.append_turn = AsyncMock(return_value=1)
+    bb.get_turn_count = AsyncMock(return_value=0)
     bb.mark_turn_status = AsyncMock()
     bb.stamp_event = AsyncMock()
     bb.get_active_events = AsyncMock(return_value=[])
@@ -172,6 +173,8 @@ class TestCircuitBreakerFallbackGate:
         assert mock_dispatch.call_args.kwargs["model"] == ""
         assert mock_dispatch.call_args.kwargs["effort"] == ""
         brain._ephemeral_provisioner.record_dispatch_sidecar_fallback.assert_called_once()
+        # The ack turn landed after the early read -- the volume write must re-read the event
+        assert brain.write_event_to_volume.await_args.kwargs["event"] is None
 
     @pytest.mark.asyncio
     async def test_provision_none_fallback_passes_raw_effort_through(self, registry_and_bridge):
@@ -32,6 +32,15 @@ def test_user_turn_renders_message_label():
     assert "**Thoughts:**" not in md
 
 
+def test_turn_header_clock_and_delta_are_utc():
+    """Turn header shows the UTC wall clock and the offset from the first turn."""
+    first = _make_turn(turn=1, actor="brain", action="response", timestamp=1714500000.0)
+    later = _make_turn(turn=2, actor="brain", action="response", timestamp=1714500125.9)
+    md = Brain._event_to_markdown(_make_event(first, later))
+    assert "### Turn 1 - FRIDAY (response) [18:00:00] (+0s)" in md
+    assert "### Turn 2 - FRIDAY (response) [18:02:05] (+2m 5s)" in md
+
+
 def test_user_turn_falls_back_to_result():
     """User turn with no thoughts falls back to result field."""
     turn = _make_turn(actor="user", action="message", thoughts=None, result="fallback text")
@@ -0,0 +1,71 @@
+# tests/test_event_volume_write.py
+# @ai-rules:
+# 1. [Constraint]: No Redis -- MagicMock blackboard; VOLUME_PATHS is patched to a tmp_path.
+# 2. [Pattern]: Asserts on Redis await counts and the written file, not on markdown details.
+"""Verify Brain.write_event_to_volume reuses a pre-fetched event and writes atomically off-loop."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.agents.brain import Brain
+from src.models import EventDocument, EventInput
+
+
+def _make_brain() -> tuple[Brain, EventDocument]:
+    event = EventDocument(
+        source="chat",
+        service="test-service",
+        event=EventInput(reason="test", evidence="test evidence"),
+    )
+    bb = MagicMock()
+    bb.get_event = AsyncMock(return_value=event)
+    bb.get_service = AsyncMock(return_value=None)
+    return Brain(blackboard=bb, agents={}), event
+
+
+async def test_prefetched_event_skips_redis_read(tmp_path):
+    brain, event = _make_brain()
+    with patch.dict("src.agents.brain.VOLUME_PATHS", {"developer": str(tmp_path)}):
+        await brain.write_event_to_volume(event.id, "developer", event=event)
+    brain.blackboard.get_event.assert_not_awaited()
+    written = tmp_path / "events" / f"event-{event.id}.md"
+    assert written.read_text() == Brain._event_to_markdown(event, None, "")
+
+
+async def test_volume_write_leaves_no_temp_file(tmp_path):
+    brain, event = _make_brain()
+    with patch.dict("src.agents.brain.VOLUME_PATHS", {"developer": str(tmp_path)}):
+        await brain.write_event_to_volume(event.id, "developer")
+        await brain.write_event_to_volume(event.id, "developer")
+    assert brain.blackboard.get_event.await_count == 2
+    assert [p.name for p in (tmp_path / "events").iterdir()] == [f"event-{event.id}.md"]
+
+
+async def test_disk_write_runs_off_the_event_loop(tmp_path):
+    brain, event = _make_brain()
+    loop_thread = threading.get_ident()
+    seen: list[int] = []
+    real_write = Brain._write_file_atomic
+
+    def _spy(path, content):
+        seen.append(threading.get_ident())
+        real_write(path, content)
+
+    with patch.dict("src.agents.brain.VOLUME_PATHS", {"developer": str(tmp_path)}), \
+            patch.object(Brain, "_write_file_atomic", staticmethod(_spy)):
+        await brain.write_event_to_volume(event.id, "developer", event=event)
+    assert seen and seen[0] != loop_thread
+    assert (tmp_path / "events" / f"event-{event.id}.md").exists()
+
+
+def test_atomic_write_recreates_missing_dir_and_skips_mkdir_otherwise(tmp_path):
+    target = tmp_path / "events" / "event-x.md"
+    Brain._write_file_atomic(target, "naïve ✓")
+    assert target.read_bytes() == "naïve ✓".encode("utf-8")
+
+    with patch.object(Path, "mkdir") as mkdir:
+        Brain._write_file_atomic(target, "second")
+    mkdir.assert_not_called()
+    assert target.read_text(encoding="utf-8") == "second"
@@ -0,0 +1,32 @@
+# tests/test_flash_adapter_init.py
+# @ai-rules:
+# 1. [Constraint]: No real SDK -- create_adapter is patched at its import site (src.agents.llm).
+# 2. [Pattern]: Mirrors test_archivist_adapter_init.py for the Aligner / Headhunter lazy adapters.
+"""Verify Flash-model lazy adapters build once, off-loop, under concurrent callers."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.agents.aligner import Aligner
+from src.agents.headhunter import Headhunter
+
+
+@pytest.mark.parametrize("factory", [Aligner, Headhunter])
+async def test_concurrent_get_adapter_builds_one_client(factory, monkeypatch):
+    monkeypatch.setenv("GCP_PROJECT", "test-project")
+    agent = factory(MagicMock())
+    sentinel = object()
+    with patch("src.agents.llm.create_adapter", return_value=sentinel) as create:
+        results = await asyncio.gather(*(agent._get_adapter() for _ in range(3)))
+    assert all(r is sentinel for r in results)
+    assert create.call_count == 1
+
+
+async def test_adapter_failure_returns_none():
+    agent = Aligner(MagicMock())
+    agent._llm_enabled = True
+    with patch("src.agents.llm.create_adapter", side_effect=RuntimeError("no creds")):
+        assert await agent._get_adapter() is None
@@ -0,0 +1,93 @@
+# tests/test_gemini_convert_structured.py
+# @ai-rules:
+# 1. [Pattern]: GeminiAdapter built via __new__ (no Vertex client) -- same as test_adapter_token_extraction.
+# 2. [Constraint]: FC/FR pairing only for exactly one functionCall with a matching "[SYSTEM <tool>]" part.
+# 3. [Constraint]: Only plain {"text"} runs are coalesced; thought/signature parts keep their own Part.
+"""Tests for GeminiAdapter._convert_structured function_response pairing and text coalescing."""
+from src.agents.llm.gemini_client import GeminiAdapter
+
+
+def _adapter() -> GeminiAdapter:
+    return GeminiAdapter.__new__(GeminiAdapter)
+
+
+def _fc(name: str) -> dict:
+    return {"functionCall": {"name": name, "args": {}}}
+
+
+class TestFunctionResponsePairing:
+
+    def test_tool_result_after_function_call_becomes_function_response(self):
+        contents = [
+            {"role": "user", "parts": [{"text": "header"}]},
+            {"role": "model", "parts": [_fc("lookup_service")]},
+            {"role": "user", "parts": [
+                {"text": "[SYSTEM lookup_service]: replicas=3"},
+                {"text": "What is the next action?"},
+            ]},
+        ]
+        converted = _adapter()._convert_structured(contents)
+        first = converted[2].parts[0]
+        assert first.function_response.name == "lookup_service"
+        assert first.function_response.response == {"output": "replicas=3"}
+        assert converted[2].parts[1].text == "What is the next action?"
+
+    def test_function_response_keeps_thought_signature(self):
+        contents = [
+            {"role": "model", "parts": [_fc("lookup_service")]},
+            {"role": "user", "parts": [
+                {"text": "[SYSTEM lookup_service]: replicas=3", "thought_signature": "c2lnLTE="},
+            ]},
+        ]
+        part = _adapter()._convert_structured(contents)[1].parts[0]
+        assert part.function_response.name == "lookup_service"
+        assert part.thought_signature == b"sig-1"
+
+    def test_name_mismatch_passes_text_through(self):
+        contents = [
+            {"role": "model", "parts": [_fc("lookup_service")]},
+            {"role": "user", "parts": [{"text": "[SYSTEM lookup_journal]: none"}]},
+        ]
+        converted = _adapter()._convert_structured(contents)
+        assert converted[1].parts[0].text == "[SYSTEM lookup_journal]: none"
+        assert converted[1].parts[0].function_response is None
+
+    def test_multiple_function_calls_not_paired(self):
+        contents = [
+            {"role": "model", "parts": [_fc("lookup_service"), _fc("lookup_journal")]},
+            {"role": "user", "parts": [{"text": "[SYSTEM lookup_service]: ok"}]},
+        ]
+        converted = _adapter()._convert_structured(contents)
+        assert converted[1].parts[0].function_response is None
+
+    def test_plain_user_message_unchanged(self):
+        contents = [
+            {"role": "model", "parts": [{"text": "hello"}]},
+            {"role": "user", "parts": [{"text": "[SYSTEM lookup_service]: ok"}]},
+        ]
+        converted = _adapter()._convert_structured(contents)
+        assert converted[1].parts[0].function_response is None
+
+
+class TestTextPartCoalescing:
+
+    def test_adjacent_plain_text_parts_join_into_one(self):
+        contents = [{"role": "user", "parts": [
+            {"text": "header"}, {"text": "--- CONVERSATION ---"}, {"text": "[USER]: hi"},
+        ]}]
+        converted = _adapter()._convert_structured(contents)
+        assert len(converted[0].parts) == 1
+        assert converted[0].parts[0].text == "header\n--- CONVERSATION ---\n[USER]: hi"
+
+    def test_thought_parts_are_not_merged(self):
+        contents = [{"role": "model", "parts": [
+            {"text": "plan", "thought": True}, {"text": "answer"}, {"text": "more"},
+        ]}]
+        converted = _adapter()._convert_structured(contents)
+        assert len(converted[0].parts) == 2
+        assert converted[0].parts[1].text == "answer\nmore"
+
+    def test_input_parts_not_mutated(self):
+        parts = [{"text": "a"}, {"text": "b"}]
+        _adapter()._convert_structured([{"role": "user", "parts": parts}])
+        assert parts == [{"text": "a"}, {"text": "b"}]
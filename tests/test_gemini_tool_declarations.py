@@ -0,0 +1,26 @@
+# tests/test_gemini_tool_declarations.py
+# @ai-rules:
+# 1. [Pattern]: _convert_tools is a staticmethod -- no adapter instance or Vertex client needed.
+"""Verify GeminiAdapter reuses FunctionDeclaration objects across tool conversions."""
+from src.agents.llm.gemini_client import GeminiAdapter
+
+
+def _schema(description: str = "Look up a service") -> dict:
+    return {
+        "name": "lookup_service",
+        "description": description,
+        "input_schema": {"type": "object", "properties": {"name": {"type": "string"}}},
+    }
+
+
+def test_identical_schema_reuses_declaration():
+    first = GeminiAdapter._convert_tools([_schema()]).function_declarations[0]
+    second = GeminiAdapter._convert_tools([dict(_schema())]).function_declarations[0]
+    assert first is second
+
+
+def test_changed_schema_builds_new_declaration():
+    old = GeminiAdapter._convert_tools([_schema()]).function_declarations[0]
+    new = GeminiAdapter._convert_tools([_schema("Look up a service (v2)")]).function_declarations[0]
+    assert new is not old
+    assert new.description == "Look up a service (v2)"
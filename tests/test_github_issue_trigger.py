@@ -15,7 +15,7 @@ import pytest
 
 from src.agents.headhunter_github import GitHubPlatform, _EMERGENCY_ISSUE_SI
 from src.agents.headhunter import Headhunter
-from src.models import EventEvidence
+from src.models import EventEvidence, EventStatus
 
 
 # =============================================================================
@@ -137,13 +137,13 @@ async def test_get_active_keys_reads_both_contexts():
 
     pr_event = MagicMock()
     pr_event.source = "headhunter"
-    pr_event.status.value = "active"
+    pr_event.status = EventStatus.ACTIVE
     pr_event.event.evidence.github_context = {"owner": "o", "repo": "r", "pr_number": 3}
     pr_event.event.evidence.github_issue_context = None
 
     issue_event = MagicMock()
     issue_event.source = "headhunter"
-    issue_event.status.value = "active"
+    issue_event.status = EventStatus.ACTIVE
     issue_event.event.evidence.github_context = None
     issue_event.event.evidence.github_issue_context = {"owner": "o", "repo": "r", "issue_number": 9}
 
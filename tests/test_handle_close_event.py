@@ -36,7 +36,7 @@ def _mock_ctx(event=None):
 def _event(conversation: list[ConversationTurn], status: str = "active"):
     return SimpleNamespace(
         conversation=conversation,
-        status=SimpleNamespace(value=status),
+        status=EventStatus(status),
     )
 
 
@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.agents.headhunter_jira import HeadhunterJira, _walk_adf_mentions, format_jira_for_llm
+from src.models import EventStatus
 
 
 # =========================================================================
@@ -297,7 +298,7 @@ class TestActiveJiraKeys:
         mock_event = MagicMock()
         mock_event.source = "headhunter"
         mock_event.subject_type = "jira"
-        mock_event.status.value = "active"
+        mock_event.status = EventStatus.ACTIVE
         mock_event.event.evidence.jira_context = {"issue_key": "CNV-300"}
         stub_blackboard.get_active_events = AsyncMock(return_value=["evt-1"])
         stub_blackboard.get_event = AsyncMock(return_value=mock_event)
@@ -309,7 +310,7 @@ class TestActiveJiraKeys:
         mock_event = MagicMock()
         mock_event.source = "headhunter"
         mock_event.subject_type = "jira"
-        mock_event.status.value = "closed"
+        mock_event.status = EventStatus.CLOSED
         mock_event.event.evidence.jira_context = {"issue_key": "CNV-400"}
         stub_blackboard.get_active_events = AsyncMock(return_value=["evt-1"])
         stub_blackboard.get_event = AsyncMock(return_value=mock_event)
@@ -0,0 +1,34 @@
+# tests/test_mermaid_cache.py
+# @ai-rules:
+# 1. [Pattern]: Uses fakeredis (decode_responses=True) with a real BlackboardState.
+# 2. [Constraint]: Cache hit must return the identical string; any rendered-input change must re-render.
+"""Tests for generate_mermaid() fingerprint memoization."""
+from __future__ import annotations
+
+import fakeredis.aioredis
+import pytest
+
+from src.state.blackboard import BlackboardState
+
+
+@pytest.fixture
+async def bb():
+    state = BlackboardState(fakeredis.aioredis.FakeRedis(decode_responses=True))
+    await state.add_service("ns/api")
+    await state.update_service_discovery("ns/api", "1.0.0")
+    return state
+
+
+async def test_unchanged_inputs_reuse_rendered_diagram(bb):
+    first = await bb.generate_mermaid()
+    second = await bb.generate_mermaid()
+    assert "v1.0.0" in first
+    assert second is first
+
+
+async def test_version_change_rerenders(bb):
+    first = await bb.generate_mermaid()
+    await bb.update_service_discovery("ns/api", "1.1.0")
+    second = await bb.generate_mermaid()
+    assert second is not first
+    assert "v1.1.0" in second
@@ -67,6 +67,18 @@ def test_event_document_roundtrip_with_created_by_email():
     assert restored.created_by_email == "user@redhat.com"
 
 
+def test_event_document_json_fast_path_matches_legacy_encoding():
+    """model_validate_json reads blobs written by the old json.dumps(model_dump()) path, and vice versa."""
+    event = EventDocument(
+        source="chat",
+        service="general",
+        event=EventInput(reason="tést", evidence="test evidence"),
+    )
+    legacy = json.dumps(event.model_dump())
+    assert EventDocument.model_validate_json(legacy) == event
+    assert json.loads(event.model_dump_json()) == json.loads(legacy)
+
+
 @pytest.mark.asyncio
 async def test_create_event_persists_created_by_email():
     """BlackboardState.create_event() round-trips created_by_email through Redis."""
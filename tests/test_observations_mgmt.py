@@ -257,7 +257,7 @@ class TestReportGeneration:
         mock_llm_response.text = "## Analysis\nPipeline duration is trending upward."
 
         mock_client = MagicMock()
-        mock_client.models.generate_content = MagicMock(return_value=mock_llm_response)
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_llm_response)
 
         with patch("src.reports.observations_reporter._render_chart_svg", return_value="PHN2Zz48L3N2Zz4="):
             result = await generate_report(mock_bb, mock_client, "gemini-3.5-flash-lite", ["pipeline_duration_m"])
@@ -265,6 +265,7 @@ class TestReportGeneration:
         assert "markdown" in result
         assert len(result["markdown"]) > 0
         assert "pipeline_duration_m" in result["markdown"]
+        mock_client.aio.models.generate_content.assert_awaited()  # native async client, no worker thread
 
     @pytest.mark.asyncio
     async def test_generate_report_partial_failure(self):
@@ -325,7 +326,7 @@ class TestReportGeneration:
 
         with patch("src.reports.observations_reporter._render_chart_svg", return_value="PHN2Zz48L3N2Zz4="):
             mock_client = MagicMock()
-            mock_client.models.generate_content = flaky_generate
+            mock_client.aio.models.generate_content = flaky_generate
             result = await generate_report(mock_bb, mock_client, "gemini-3.5-flash-lite", ["error_count", "pod_restart_count"])
 
         assert "markdown" in result
@@ -619,7 +620,7 @@ class TestReportEndpoint:
         mock_llm_response = MagicMock()
         mock_llm_response.text = "## Error Count Analysis\nErrors are trending up."
         mock_client = MagicMock()
-        mock_client.models.generate_content = MagicMock(return_value=mock_llm_response)
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_llm_response)
 
         manage_client.app.dependency_overrides[get_report_client] = lambda: mock_client
         try:
@@ -645,7 +646,7 @@ class TestReportEndpoint:
             "observations": [],
         })
         mock_client = MagicMock()
-        mock_client.models.generate_content = MagicMock(return_value=MagicMock(text="No data"))
+        mock_client.aio.models.generate_content = AsyncMock(return_value=MagicMock(text="No data"))
 
         manage_client.app.dependency_overrides[get_report_client] = lambda: mock_client
         try:
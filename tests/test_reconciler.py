@@ -87,6 +87,20 @@ class TestFairQueueStats:
         assert q.stats["inflight"] == 1
 
 
+class TestFairQueueDebounce:
+    @pytest.mark.asyncio
+    async def test_burst_collapses_and_waits_for_window(self):
+        """Enqueues inside the debounce window dedup; the key dequeues only after it."""
+        q = FairQueue(debounce_sec=0.05)
+        assert q.enqueue("a") is True
+        assert q.enqueue("a") is False
+        assert q.enqueue("a") is False
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(q.dequeue(), timeout=0.01)
+        assert await asyncio.wait_for(q.dequeue(), timeout=1.0) == "a"
+        assert q.stats["dedup_count"] == 2
+
+
 # =============================================================================
 # ReconcileScheduler Tests
 # =============================================================================
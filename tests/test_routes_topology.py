@@ -0,0 +1,33 @@
+# tests/test_routes_topology.py
+# @ai-rules:
+# 1. [Pattern]: Tests the /topology/ route with a mocked BlackboardState.
+# 2. [Constraint]: summary mode must not fetch per-service metadata (no get_all_services / model_dump).
+"""Route tests for /topology/ detail modes."""
+import pytest
+from unittest.mock import AsyncMock
+
+from src.models import Service, TopologySnapshot
+from src.routes.topology import get_topology
+
+
+@pytest.mark.asyncio
+async def test_summary_skips_service_fetch():
+    """detail=summary returns count + names without loading service metadata."""
+    bb = AsyncMock()
+    bb.get_services.return_value = ["api", "db"]
+    result = await get_topology(detail="summary", blackboard=bb)
+    assert result == {"total_services": 2, "service_names": ["api", "db"]}
+    bb.get_all_services.assert_not_called()
+    bb.get_topology.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_full_includes_service_details():
+    """Default detail=full keeps the existing response shape."""
+    bb = AsyncMock()
+    bb.get_topology.return_value = TopologySnapshot(services=["api"], edges={"api": ["db"]})
+    bb.get_all_services.return_value = {"api": Service(name="api")}
+    result = await get_topology(blackboard=bb)
+    assert result["service_names"] == ["api"]
+    assert result["edges"] == {"api": ["db"]}
+    assert result["services"]["api"]["name"] == "api"
@@ -533,6 +533,30 @@ class TestGuard7StaleRaceDetection:
         )
 
 
+class TestScanBatchedRead:
+    """The real scan reads the active set with one MGET, not a GET per event."""
+
+    @pytest.mark.asyncio
+    async def test_scan_uses_single_get_events(self):
+        from src.agents.brain import Brain
+
+        bb = MagicMock()
+        bb.EVENT_ACTIVE = "darwin:events:active"
+        bb.redis.srem = AsyncMock()
+        bb.get_active_events_with_status = AsyncMock(return_value={"evt-1": "closed", "evt-2": "new"})
+        bb.get_events = AsyncMock(return_value=[
+            _make_event("evt-1", status="closed"),
+            _make_event("evt-2", status="new"),
+        ])
+        bb.get_event = AsyncMock()
+        brain = Brain(blackboard=bb, agents={})
+
+        assert await brain._scan_active_for_reconcile() == ["evt-2"]
+        bb.get_events.assert_awaited_once_with(["evt-1", "evt-2"])
+        bb.get_event.assert_not_awaited()
+        bb.redis.srem.assert_awaited_once_with(bb.EVENT_ACTIVE, "evt-1")
+
+
 def _scan_logic(
     active_ids: list[str],
     events: dict[str, EventDocument],
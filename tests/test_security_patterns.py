@@ -0,0 +1,78 @@
+# tests/test_security_patterns.py
+# @ai-rules:
+# 1. [Constraint]: The literal + per-pattern lowercase tiers must agree with per-pattern re.search(IGNORECASE) for every entry.
+"""Tests for the precompiled FORBIDDEN_PATTERNS scanner."""
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from src.agents.dispatch import _check_security
+from src.agents.security import (
+    FORBIDDEN_PATTERNS,
+    _as_literal,
+    SecurityError,
+    find_forbidden_pattern,
+    safe_execution,
+)
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("please RM  -RF the cache", r"rm\s+-rf"),
+    ("then git push -f origin main", r"git\s+push\s+-f"),
+    ("kubectl delete namespace prod", r"kubectl\s+delete\s+namespace"),
+    ("scale deployment to 3 replicas", None),
+])
+def test_find_forbidden_pattern_reports_source_pattern(text, expected):
+    assert find_forbidden_pattern(text) == expected
+
+
+def test_compiled_scan_matches_per_pattern_search():
+    samples = [
+        "rm -rf /tmp", "rm -r /", "delete volume data", "drop database x",
+        "drop table t", "truncate table t", "kubectl delete namespace ns",
+        "kubectl delete pv p", "--force --grace-period=0", "git push --force",
+        "git push -f", "> /dev/sda", "mkfs.ext4", "dd if=/dev/zero",
+    ]
+    assert len(samples) == len(FORBIDDEN_PATTERNS)
+    for pattern, sample in zip(FORBIDDEN_PATTERNS, samples):
+        assert re.search(pattern, sample, re.IGNORECASE)
+        assert find_forbidden_pattern(sample) == pattern
+
+
+def test_callers_raise_security_error():
+    with pytest.raises(SecurityError, match="drop"):
+        _check_security("DROP DATABASE darwin")
+
+    class Runner:
+        @safe_execution
+        def run(self, plan_context: str) -> str:
+            return "ran"
+
+    assert Runner().run("restart pod") == "ran"
+    with pytest.raises(SecurityError):
+        Runner().run("dd if=/dev/zero of=/dev/sda")
+
+
+@pytest.mark.parametrize("pattern,literal", [
+    (r"mkfs\.", "mkfs."),
+    (r"rm\s+-rf", None),
+    (r"dd\s+if=", None),
+    (r"DROP TABLE", "drop table"),
+    (r"a.b", None),
+])
+def test_as_literal_partitions_plain_strings(pattern, literal):
+    assert _as_literal(pattern) == literal
+
+
+def test_literal_tier_is_case_insensitive():
+    assert find_forbidden_pattern("run MKFS.ext4 on the disk") == r"mkfs\."
+
+
+def test_only_patterns_with_uppercase_compile_with_ignorecase():
+    from src.agents.security import _REGEX_FORBIDDEN
+
+    for rx, pattern in _REGEX_FORBIDDEN:
+        assert bool(rx.flags & re.IGNORECASE) == any(c.isupper() for c in pattern)
+    assert find_forbidden_pattern("GIT\tPUSH  --FORCE") == r"git\s+push\s+--force"
@@ -0,0 +1,56 @@
+# tests/test_service_lookup_cache.py
+# @ai-rules:
+# 1. [Constraint]: No Redis -- MagicMock blackboard with AsyncMock get_service/get_services.
+# 2. [Pattern]: TTL expiry is simulated by rewinding the stored monotonic timestamp, not by sleeping.
+"""Verify Brain's short-TTL service lookup cache used by the lookup_service tool."""
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.agents.brain import Brain
+
+
+def _make_brain() -> Brain:
+    bb = MagicMock()
+    bb.get_service = AsyncMock(return_value={"name": "ns/svc"})
+    bb.get_services = AsyncMock(return_value=["ns/svc"])
+    return Brain(blackboard=bb, agents={})
+
+
+async def test_repeated_service_lookup_hits_redis_once():
+    brain = _make_brain()
+    first = await brain._get_service_cached("ns/svc")
+    second = await brain._get_service_cached("ns/svc")
+    assert first is second
+    assert brain.blackboard.get_service.await_count == 1
+
+
+async def test_service_lookup_refetches_after_ttl():
+    brain = _make_brain()
+    await brain._get_service_cached("ns/svc")
+    ts, svc = brain._service_cache["ns/svc"]
+    brain._service_cache["ns/svc"] = (ts - brain.SERVICE_CACHE_TTL - 0.01, svc)
+    await brain._get_service_cached("ns/svc")
+    assert brain.blackboard.get_service.await_count == 2
+
+
+async def test_service_names_cached_via_tool_context():
+    brain = _make_brain()
+    assert await brain._tool_ctx.get_cached_service_names() == ["ns/svc"]
+    assert await brain._tool_ctx.get_cached_service_names() == ["ns/svc"]
+    assert brain.blackboard.get_services.await_count == 1
+
+
+async def test_service_cache_evicts_expired_and_caps_size():
+    brain = _make_brain()
+    brain.SERVICE_CACHE_MAX = 3
+    await brain._get_service_cached("ns/stale")
+    ts, svc = brain._service_cache["ns/stale"]
+    brain._service_cache["ns/stale"] = (ts - brain.SERVICE_CACHE_TTL - 0.01, svc)
+
+    await brain._get_service_cached("ns/a")
+    assert list(brain._service_cache) == ["ns/a"]  # expired entry evicted on insert
+
+    for name in ("ns/b", "ns/c", "ns/d"):
+        await brain._get_service_cached(name)
+    assert list(brain._service_cache) == ["ns/b", "ns/c", "ns/d"]  # oldest dropped at the cap
@@ -115,6 +115,7 @@ def _make_brain(stream_factory=None) -> Brain:
 
     brain._broadcast = AsyncMock()
     brain._append_and_broadcast = AsyncMock(return_value=1)
+    brain._append_turns_and_broadcast = AsyncMock()
     brain._next_turn_number = AsyncMock(return_value=1)
     brain._is_event_closed = AsyncMock(return_value=False)
     brain._normalize_response_parts = MagicMock(return_value=None)
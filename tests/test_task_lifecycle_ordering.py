@@ -43,6 +43,7 @@ def _make_brain() -> Brain:
     bb = MagicMock()
     bb.get_event = AsyncMock(return_value=_make_event())
     bb.append_turn = AsyncMock(return_value=1)
+    bb.get_turn_count = AsyncMock(return_value=0)
     bb.mark_turn_status = AsyncMock()
     bb.stamp_event = AsyncMock()
     bb.get_active_events = AsyncMock(return_value=[])
@@ -284,3 +285,60 @@ class TestWakeTaskCancellationCleanup:
         assert brain._active_agent_for_event.get("evt-test") is None, (
             "finally must clear _active_agent_for_event on broadcast CancelledError"
         )
+
+
+class TestDispatchDoneCallback:
+    """run_agent_task's done-callback covers tasks that never reach their finally."""
+
+    @pytest.mark.asyncio
+    async def test_task_cancelled_before_start_is_dropped(self):
+        brain = Brain(blackboard=MagicMock(), agents={})
+        brain._run_agent_task = AsyncMock()
+        await brain._tool_ctx.run_agent_task("evt-test", "sysadmin", None, "t", "./e.md", 1)
+        task = brain._active_tasks["evt-test"]
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert "evt-test" not in brain._active_tasks
+
+    @pytest.mark.asyncio
+    async def test_done_callback_keeps_newer_task(self):
+        brain = Brain(blackboard=MagicMock(), agents={})
+        brain._run_agent_task = AsyncMock()
+        await brain._tool_ctx.run_agent_task("evt-test", "sysadmin", None, "t", "./e.md", 1)
+        old = brain._active_tasks["evt-test"]
+        newer = asyncio.get_running_loop().create_future()
+        brain._active_tasks["evt-test"] = newer
+        await old
+        await asyncio.sleep(0)
+        assert brain._active_tasks["evt-test"] is newer
+        newer.cancel()
+
+
+class TestStructuredResultParsing:
+    """Only JSON-object results are parsed as structured replies (question / agent_busy)."""
+
+    @staticmethod
+    async def _run(brain: Brain, result: str) -> list:
+        mock_agent = MagicMock()
+        mock_agent.process = AsyncMock(return_value=(result, None))
+        brain._append_and_broadcast = AsyncMock(return_value=1)
+        brain._active_tasks["evt-test"] = asyncio.current_task()
+        brain._active_agent_for_event["evt-test"] = "sysadmin"
+        await brain._run_agent_task(
+            event_id="evt-test", agent_name="sysadmin", agent=mock_agent,
+            task="t", event_md_path="/tmp/event.md", routing_turn_num=None,
+        )
+        return [c.args[1] for c in brain._append_and_broadcast.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_padded_busy_object_still_structured(self):
+        turns = await self._run(_make_brain(), '  {"type": "agent_busy", "message": "busy"}\n')
+        assert [t.action for t in turns] == ["busy"]
+
+    @pytest.mark.asyncio
+    async def test_plain_text_result_written_verbatim(self):
+        text = "[step 1] checked pods\n" + "log line\n" * 50
+        turns = await self._run(_make_brain(), text)
+        assert turns[0].action == "execute"
+        assert turns[0].result == text.strip()
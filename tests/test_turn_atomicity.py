@@ -106,6 +106,106 @@ class TestAtomicTurnAssignment:
         assert len(doc.conversation) == 3
         assert [t.turn for t in doc.conversation] == [1, 2, 3]
 
+    @pytest.mark.asyncio
+    async def test_append_turns_numbers_in_one_write(self, bb):
+        eid = await _seed_event(bb)
+        await bb.append_turn(eid, _make_turn())
+        batch = [_make_turn(action="thoughts"), _make_turn(action="response")]
+        assert await bb.append_turns(eid, batch) == [2, 3]
+        doc = await bb.get_event(eid)
+        assert [(t.turn, t.action) for t in doc.conversation] == [
+            (1, "response"), (2, "thoughts"), (3, "response"),
+        ]
+        assert await bb.append_turns("evt-missing", [_make_turn()]) == []
+
+    @pytest.mark.asyncio
+    async def test_get_turn_count_tracks_appends(self, bb):
+        eid = await _seed_event(bb)
+        assert await bb.get_turn_count(eid) == 0
+        for _ in range(3):
+            await bb.append_turn(eid, _make_turn())
+        assert await bb.get_turn_count(eid) == 3
+        assert await bb.get_turn_count("evt-missing") == 0
+
+    @pytest.mark.asyncio
+    async def test_park_for_approval_returns_parked_event(self, bb):
+        """Approval handler reuses the parked document instead of a second GET."""
+        eid = await _seed_event(bb)
+        await bb.append_turn(eid, _make_turn(action="request_approval"))
+        parked = await bb.park_for_approval(eid)
+        assert parked is not None and parked.status == "waiting_approval"
+        assert parked.conversation[-1].turn == 1
+        assert (await bb.park_for_approval(eid)).id == eid  # idempotent path too
+        assert await bb.park_for_approval("evt-missing") is None
+
+    @pytest.mark.asyncio
+    async def test_park_for_approval_appends_turn_in_same_write(self, bb):
+        eid = await _seed_event(bb)
+        await bb.append_turn(eid, _make_turn())
+        turn = _make_turn(action="request_approval")
+        parked = await bb.park_for_approval(eid, turn=turn)
+        assert turn.turn == 2
+        doc = await bb.get_event(eid)
+        assert doc.status == "waiting_approval"
+        assert [t.action for t in doc.conversation] == ["response", "request_approval"]
+        assert parked.conversation[-1].turn == 2
+
+    @pytest.mark.asyncio
+    async def test_defer_event_status_appends_turn_in_same_write(self, bb):
+        eid = await _seed_event(bb)
+        turn = _make_turn(action="defer")
+        assert await bb.defer_event_status(eid, time.time() + 60, 60, turn=turn)
+        assert turn.turn == 1
+        doc = await bb.get_event(eid)
+        assert doc.status == "deferred"
+        assert doc.conversation[-1].action == "defer"
+        assert not await bb.defer_event_status("evt-missing", time.time() + 60, 60, turn=_make_turn())
+
+    @pytest.mark.asyncio
+    async def test_transition_appends_turn_and_clears_timer_on_success_only(self, bb):
+        from src.models import EventStatus
+
+        eid = await _seed_event(bb)
+        defer_key = f"{bb.EVENT_PREFIX}{eid}:defer_until"
+        await bb.defer_event_status(eid, time.time() + 60, 60)
+        turn = _make_turn(actor="system", action="notification")
+        assert not await bb.transition_event_status(
+            eid, "active", EventStatus.ACTIVE, turn=turn, clear_keys=(defer_key,),
+        )
+        assert await bb.redis.exists(defer_key)
+        assert await bb.get_turn_count(eid) == 0
+
+        assert await bb.transition_event_status(
+            eid, "deferred", EventStatus.ACTIVE, turn=turn, clear_keys=(defer_key,),
+        )
+        doc = await bb.get_event(eid)
+        assert doc.status == "active"
+        assert turn.turn == 1 and doc.conversation[-1].action == "notification"
+        assert not await bb.redis.exists(defer_key)
+
+    @pytest.mark.asyncio
+    async def test_approval_fanout_reports_parked_turn_count(self, bb, monkeypatch):
+        """park_for_approval's document already holds the turn -- total_turns must not add one."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import src.dependencies as deps
+        from src.agents.brain import Brain
+        from src.agents.handlers_state import handle_request_user_approval
+
+        eid = await _seed_event(bb)
+        await bb.append_turn(eid, _make_turn())
+        conn = MagicMock(ws=AsyncMock(), current_role="sysadmin")
+        registry = MagicMock(get_by_event=AsyncMock(return_value=conn))
+        monkeypatch.setattr(deps, "get_registry_and_bridge", lambda: (registry, None))
+        brain = Brain(blackboard=bb, agents={})
+        brain._broadcast = AsyncMock()
+
+        await handle_request_user_approval(brain._tool_ctx, eid, {"plan_summary": "restart"}, None)
+
+        update = conn.ws.send_json.await_args.args[0]
+        assert update["total_turns"] == 2
+        assert update["event_status"] == "waiting_approval"
+
 
 class TestSlackVisibilityFilter:
     """Verify _USER_VISIBLE_TOOL_RESULTS whitelist and conditional logic."""
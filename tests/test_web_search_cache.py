@@ -0,0 +1,76 @@
+# tests/test_web_search_cache.py
+# @ai-rules:
+# 1. [Pattern]: google.genai.Client patched -- no live Vertex calls.
+# 2. [Pattern]: Module-level cache cleared per test via autouse fixture.
+"""Tests for the google_web_search normalized-query result cache."""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents import handlers_lookup
+from src.agents.handlers_lookup import handle_google_web_search
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    handlers_lookup._web_search_cache.clear()
+    handlers_lookup._search_client = None
+    yield
+    handlers_lookup._web_search_cache.clear()
+    handlers_lookup._search_client = None
+
+
+def _ctx():
+    ctx = MagicMock()
+    ctx.append_and_broadcast = AsyncMock()
+    return ctx
+
+
+def _client(text="Answer"):
+    client = MagicMock()
+    response = SimpleNamespace(text=text, candidates=[])
+    client.aio.models.generate_content = AsyncMock(return_value=response)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_repeat_query_served_from_cache():
+    client = _client()
+    with patch("google.genai.Client", return_value=client):
+        await handle_google_web_search(_ctx(), "evt-1", {"query": "Kafka  lag"}, None)
+        ctx = _ctx()
+        await handle_google_web_search(ctx, "evt-2", {"query": "kafka lag"}, None)
+    assert client.aio.models.generate_content.await_count == 1
+    turn = ctx.append_and_broadcast.await_args.args[1]
+    assert "Answer" in turn.evidence
+
+
+@pytest.mark.asyncio
+async def test_failure_not_cached():
+    client = _client()
+    client.aio.models.generate_content = AsyncMock(side_effect=RuntimeError("down"))
+    with patch("google.genai.Client", return_value=client):
+        await handle_google_web_search(_ctx(), "evt-1", {"query": "q"}, None)
+        await handle_google_web_search(_ctx(), "evt-1", {"query": "q"}, None)
+    assert client.aio.models.generate_content.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_refetched():
+    client = _client()
+    with patch("google.genai.Client", return_value=client), \
+            patch.object(handlers_lookup, "_WEB_SEARCH_CACHE_TTL", -1):
+        await handle_google_web_search(_ctx(), "evt-1", {"query": "q"}, None)
+        await handle_google_web_search(_ctx(), "evt-1", {"query": "q"}, None)
+    assert client.aio.models.generate_content.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_distinct_queries_share_one_client():
+    client = _client()
+    with patch("google.genai.Client", return_value=client) as factory:
+        await handle_google_web_search(_ctx(), "evt-1", {"query": "a"}, None)
+        await handle_google_web_search(_ctx(), "evt-1", {"query": "b"}, None)
+    assert client.aio.models.generate_content.await_count == 2
+    assert factory.call_count == 1
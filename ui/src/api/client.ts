@@ -28,6 +28,7 @@ import type {
   ReportMeta,
   Service,
   TopologyResponse,
+  TopologySummaryResponse,
 } from './types';
 
 // Base URL is proxied by Vite in development
@@ -137,6 +138,10 @@ export async function getTopology(): Promise<TopologyResponse> {
   return fetchApi<TopologyResponse>('/topology/');
 }
 
+export async function getTopologySummary(): Promise<TopologySummaryResponse> {
+  return fetchApi<TopologySummaryResponse>('/topology/?detail=summary');
+}
+
 export async function getService(name: string): Promise<Service> {
   return fetchApi<Service>(`/topology/service/${encodeURIComponent(name)}`);
 }
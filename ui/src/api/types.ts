@@ -97,6 +97,11 @@ export interface TopologyResponse {
   edges: Record<string, string[]>;
 }
 
+export interface TopologySummaryResponse {
+  total_services: number;
+  service_names: string[];
+}
+
 // =============================================================================
 // Graph Visualization (Cytoscape.js)
 // =============================================================================
@@ -326,6 +331,7 @@ export interface FlowMetrics {
   waiting_approval_events: number;
   headhunter_pending: number;
   aligner_pending: number;
+  archivist_pending?: number;
   wip_used: number;
   wip_cap: number;
   wip_utilization_pct: number;
@@ -346,6 +352,7 @@ export interface FlowSnapshot {
   waiting_approval_events: number;
   headhunter_pending: number;
   aligner_pending: number;
+  archivist_pending?: number;
   wip_used: number;
   wip_cap: number;
   wip_utilization_pct: number;
@@ -11,7 +11,7 @@ import ActivityStream from '../ActivityStream';
 import FlowHealthWidget from './FlowHealthWidget';
 import WaitingBell from '../WaitingBell';
 import { useConfig } from '../../hooks/useConfig';
-import { useTopology } from '../../hooks';
+import { useTopologySummary } from '../../hooks';
 import { useOpsControl } from '../../contexts/OpsStateContext';
 import { useAuth } from '../../contexts/AuthContext';
 
@@ -21,7 +21,7 @@ const MAX_HEIGHT = 350;
 
 export default function ActivityPanel() {
   const { data: config } = useConfig();
-  const { isError, isFetching } = useTopology();
+  const { isError, isFetching } = useTopologySummary();
   const { connected, send, autoHotspot, toggleAutoHotspot } = useOpsControl();
   const { user, isAuthenticated, logout } = useAuth();
   const userName = user?.profile?.preferred_username || user?.profile?.name || user?.profile?.email || '';
@@ -86,6 +86,9 @@ export default function FlowHealthWidget() {
         {(data.aligner_pending ?? 0) > 0 && (
           <span>{data.aligner_pending} ArgoCD pending</span>
         )}
+        {(data.archivist_pending ?? 0) > 0 && (
+          <span>{data.archivist_pending} archives unsynced</span>
+        )}
       </div>
 
       {/* Per-role breakdown */}
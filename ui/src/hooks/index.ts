@@ -10,5 +10,5 @@ export { useKargoStages, useKargoStagesInvalidation } from './useKargo';
 export { useObservations } from './useObservations';
 export { useActiveEvents, useEventDocument, useQueueInvalidation } from './useQueue';
 export { useResizablePanel } from './useResizablePanel';
-export { useService, useTopology } from './useTopology';
+export { useService, useTopology, useTopologySummary } from './useTopology';
 export { useWebSocket } from './useWebSocket';
@@ -4,8 +4,8 @@
  * Polls /topology/ for details.
  */
 import { useQuery } from '@tanstack/react-query';
-import { ApiError, getTopology, getService } from '../api/client';
-import type { Service, TopologyResponse } from '../api/types';
+import { ApiError, getTopology, getTopologySummary, getService } from '../api/client';
+import type { Service, TopologyResponse, TopologySummaryResponse } from '../api/types';
 
 // Polling interval: 15 seconds (reduced from 2s -- topology rarely changes)
 const TOPOLOGY_POLL_INTERVAL = 15000;
@@ -22,6 +22,19 @@ export function useTopology() {
   });
 }
 
+/**
+ * Hook for the lightweight topology summary (service count + names only).
+ * Use for status indicators that don't render per-service details.
+ */
+export function useTopologySummary() {
+  return useQuery<TopologySummaryResponse>({
+    queryKey: ['topology', 'summary'],
+    queryFn: getTopologySummary,
+    refetchInterval: TOPOLOGY_POLL_INTERVAL,
+    staleTime: TOPOLOGY_POLL_INTERVAL,
+  });
+}
+
 /**
  * Hook for fetching a single service's details.
  * Returns null data (not error) for 404s to handle gracefully.